@@ -1,3 +1,4 @@
+import asyncio
 import json
 import tempfile
 import time
@@ -7,9 +8,10 @@ from unittest import mock
 import pytest
 from requests import Response
 
-from ytmusicapi.auth.oauth import OAuthToken
+from ytmusicapi.auth.oauth import OAuthToken, RefreshingToken
+from ytmusicapi.auth.oauth.credentials import Credentials
 from ytmusicapi.auth.types import AuthType
-from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
 from ytmusicapi.setup import main
 from ytmusicapi.type_alias import JsonDict
 from ytmusicapi.ytmusic import OAuthCredentials, YTMusic
@@ -31,6 +33,27 @@ def fixture_alt_oauth_credentials(config) -> OAuthCredentials:
     return OAuthCredentials(config["auth"]["client_id"], config["auth"]["client_secret"])
 
 
+def mock_credentials() -> mock.Mock:
+    async def refresh_token(refresh_token):
+        await asyncio.sleep(0.01)
+        return {"access_token": "fresh", "expires_in": 3600}
+
+    credentials = mock.Mock(spec=Credentials)
+    credentials.refresh_token = mock.AsyncMock(side_effect=refresh_token)
+    return credentials
+
+
+def expiring_token(credentials: mock.Mock, expires_in: int = 0) -> RefreshingToken:
+    return RefreshingToken(
+        credentials=credentials,
+        scope="https://www.googleapis.com/auth/youtube",
+        token_type="Bearer",
+        access_token="expired",
+        refresh_token="refresh",
+        expires_at=int(time.time()) + expires_in,
+    )
+
+
 @pytest.fixture(name="yt_alt_oauth")
 def fixture_yt_alt_oauth(browser_filepath: str, alt_oauth_credentials: OAuthCredentials) -> YTMusic:
     return YTMusic(browser_filepath, oauth_credentials=alt_oauth_credentials)
@@ -90,7 +113,8 @@ class TestOAuth:
         yt_oauth._token.expires_at = int(time.time())
         # check
         assert yt_oauth._token.is_expiring
-        # pull new values, assuming token will be refreshed on access
+        # pull new values after the refresh of the next request
+        asyncio.run(yt_oauth._token.ensure_fresh())
         second_token = yt_oauth._token.access_token
         second_expire = yt_oauth._token.expires_at
         second_token_inner = yt_oauth._token.access_token
@@ -131,3 +155,135 @@ class TestOAuth:
 
     def test_alt_oauth_request(self, yt_alt_oauth: YTMusic, sample_video):
         yt_alt_oauth.get_watch_playlist(sample_video)
+
+
+class TestRefreshingToken:
+    def test_single_flight_refresh(self):
+        credentials = mock_credentials()
+        token = expiring_token(credentials)
+        # reading the token does not block on a refresh
+        assert token.access_token == "expired"
+
+        async def run():
+            await asyncio.gather(*(token.ensure_fresh() for _ in range(10)))
+
+        asyncio.run(run())
+        credentials.refresh_token.assert_awaited_once_with("refresh")
+        assert token.access_token == "fresh"
+        assert token.expires_at >= time.time() + 3599
+
+    def test_background_renewal(self):
+        credentials = mock_credentials()
+        # not expiring yet, but within the renewal margin
+        token = expiring_token(credentials, expires_in=120)
+        assert not token.is_expiring
+
+        async def run():
+            await token.ensure_fresh()
+            assert token.access_token == "expired"
+            token.start_renewal()
+            await asyncio.sleep(0.05)
+            token.stop_renewal()
+
+        asyncio.run(run())
+        credentials.refresh_token.assert_awaited_once()
+        assert token.access_token == "fresh"
+
+    def test_short_lived_token_renewal(self):
+        credentials = mock_credentials()
+        # renewed tokens are valid for less than RENEW_MARGIN
+        credentials.refresh_token = mock.AsyncMock(return_value={"access_token": "fresh", "expires_in": 100})
+        token = expiring_token(credentials, expires_in=120)
+
+        async def run():
+            token.start_renewal()
+            await asyncio.sleep(0.05)
+            # the next renewal is halfway through the lifetime of the renewed token
+            assert not token._renew_task.done()
+            token.stop_renewal()
+
+        asyncio.run(run())
+        credentials.refresh_token.assert_awaited_once()
+
+    def test_failed_renewal_stops(self):
+        credentials = mock_credentials()
+        credentials.refresh_token = mock.AsyncMock(side_effect=YTMusicServerError("invalid_grant"))
+        token = expiring_token(credentials)
+
+        async def run():
+            token.start_renewal()
+            await asyncio.sleep(0.05)
+            assert token._renew_task.done()
+            with pytest.raises(YTMusicServerError):
+                await token.ensure_fresh()
+
+        asyncio.run(run())
+        assert credentials.refresh_token.await_count == 2
+
+    def test_request_uses_fresh_token(self):
+        credentials = mock_credentials()
+        token = expiring_token(credentials).as_dict()
+
+        async def run():
+            yt = YTMusic(dict(token), oauth_credentials=credentials)
+            yt._visitor_id = "visitor"
+            response = mock.Mock(status=200, reason="OK", headers={})
+            response.read = mock.AsyncMock(return_value=b"{}")
+            with mock.patch.object(yt._session, "post", mock.AsyncMock(return_value=response)) as post:
+                await asyncio.gather(*(yt._send_request("browse", {}) for _ in range(5)))
+            # renewal is opt-in
+            assert yt._token._renew_task is None
+            await yt.close()
+            return post.call_args.kwargs["headers"]
+
+        headers = asyncio.run(run())
+        assert headers["authorization"] == "Bearer fresh"
+        credentials.refresh_token.assert_awaited_once()
+
+    def test_close_stops_renewal(self):
+        credentials = mock_credentials()
+        token = expiring_token(credentials, expires_in=3600).as_dict()
+
+        async def run():
+            async with YTMusic(dict(token), oauth_credentials=credentials, renew_token=True) as yt:
+                yt._visitor_id = "visitor"
+                response = mock.Mock(status=200, reason="OK", headers={})
+                response.read = mock.AsyncMock(return_value=b"{}")
+                with mock.patch.object(yt._session, "post", mock.AsyncMock(return_value=response)):
+                    await yt._send_request("browse", {})
+                renewal = yt._token._renew_task
+                assert renewal is not None and not renewal.done()
+            await asyncio.sleep(0)
+            assert renewal.cancelled()
+            assert yt._token._renew_task is None
+            assert yt._client_session is None
+
+        asyncio.run(run())
+        credentials.refresh_token.assert_not_awaited()
+
+    def test_shared_token_file(self, tmp_path):
+        path = tmp_path / "oauth.json"
+        credentials = mock_credentials()
+        # one token per process, sharing the token file
+        tokens = [expiring_token(credentials) for _ in range(5)]
+        tokens[0].store_token(str(path))
+        for token in tokens:
+            token._local_cache = path
+
+        async def run():
+            await asyncio.gather(*(token.refresh() for token in tokens))
+
+        asyncio.run(run())
+        credentials.refresh_token.assert_awaited_once()
+        assert {token.access_token for token in tokens} == {"fresh"}
+        assert json.loads(path.read_text())["access_token"] == "fresh"
+        # no temporary files are left behind
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["oauth.json", "oauth.json.lock"]
+
+        # a token refreshed by another process is read instead of refreshed again
+        stale = expiring_token(credentials)
+        stale._local_cache = path
+        asyncio.run(stale.refresh())
+        credentials.refresh_token.assert_awaited_once()
+        assert stale.access_token == "fresh"
+        assert not stale.reload()
@@ -0,0 +1,35 @@
+"""
+Compares decoding and encoding the recorded ``browse`` responses with the installed JSON backends.
+
+Run with ``python -m tests.benchmarks.bench_json``
+"""
+
+import importlib.util
+import timeit
+from pathlib import Path
+
+from ytmusicapi.json_backend import get_json_backend
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def main() -> None:
+    responses = [path.read_bytes() for path in sorted(DATA.glob("*.json"))]
+    print(f"{len(responses)} responses, {sum(map(len, responses)) / 1024:.0f} KiB")
+    for name in ["json", "orjson", "msgspec"]:
+        if not importlib.util.find_spec(name):
+            print(f"{name:<8} not installed")
+            continue
+        backend = get_json_backend(name)  # type: ignore[arg-type]
+        decoded = [backend.loads(raw) for raw in responses]
+        decode = min(
+            timeit.repeat(lambda b=backend: [b.loads(raw) for raw in responses], number=10, repeat=5)
+        )
+        encode = min(
+            timeit.repeat(lambda b=backend, d=decoded: [b.dumps(obj) for obj in d], number=10, repeat=5)
+        )
+        print(f"{name:<8} decode {decode / 10 * 1000:7.2f} ms, encode {encode / 10 * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares memory and time of parsing playlist tracks to dicts and to :py:mod:`ytmusicapi.models`.
+
+Run with ``python -m tests.benchmarks.bench_models``
+"""
+
+import json
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi.navigation import MRLIR
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.type_alias import JsonList
+
+DATA = Path(__file__).parent.parent / "data" / "2024_03_get_playlist.json"
+
+#: the fixture is decoded repeatedly to resemble a large playlist
+REPEAT = 100
+
+
+def find_items(node: Any) -> JsonList:
+    if isinstance(node, dict):
+        if MRLIR in node:
+            return [node]
+        return [item for value in node.values() for item in find_items(value)]
+    if isinstance(node, list):
+        return [item for value in node for item in find_items(value)]
+    return []
+
+
+def load_results(text: str) -> JsonList:
+    """tracks of REPEAT separately decoded responses, like the pages of a large playlist"""
+    return [item for _ in range(REPEAT) for item in find_items(json.loads(text))]
+
+
+def measure(text: str, output: Any) -> tuple[int, int]:
+    """
+    returns the bytes and the number of allocations retained by the parsed tracks after the response is freed.
+    Dicts keep parts of the response alive, i.e. the thumbnail lists.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = load_results(text)
+    tracks = parse_playlist_items(results, output=output)
+    del results
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    del tracks
+    return sum(stat.size_diff for stat in stats), sum(stat.count_diff for stat in stats)
+
+
+def main() -> None:
+    text = DATA.read_text(encoding="utf-8")
+    results = load_results(text)
+    print(f"{len(results)} tracks")
+    for output in ["dicts", "models"]:
+        size, count = measure(text, output)
+        seconds = min(
+            timeit.repeat(lambda o=output: parse_playlist_items(results, output=o), number=1, repeat=5)
+        )
+        print(
+            f"{output:<8} {size / 1024:10.1f} KiB {count:8d} allocations "
+            f"{size / len(results):8.1f} B/track {seconds * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares the messages of failed :py:func:`ytmusicapi.navigation.nav` lookups, truncated
+with reprlib, against the previous repr of the whole node lacking the key.
+
+Run with ``python -m tests.benchmarks.bench_navigation``
+"""
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi.navigation import MRLIR, NAVIGATION_VIDEO_TYPE, PLAY_BUTTON, THUMBNAILS, nav
+
+DATA = Path(__file__).parent.parent / "data" / "2024_03_get_playlist.json"
+
+
+def nav_full_repr(root: Any, items: list[Any], none_if_absent: bool = False) -> Any:
+    """nav before the messages were truncated"""
+    if root is None:
+        return None
+    try:
+        for k in items:
+            root = root[k]
+    except (KeyError, IndexError) as e:
+        if none_if_absent:
+            return None
+        raise type(e)(f"Unable to find '{k}' using path {items!r} on {root!r}, exception: {e}")
+    return root
+
+
+def find_items(node: Any) -> list[dict]:
+    if isinstance(node, dict):
+        if MRLIR in node:
+            return [node[MRLIR]]
+        return [item for value in node.values() for item in find_items(value)]
+    if isinstance(node, list):
+        return [item for value in node for item in find_items(value)]
+    return []
+
+
+def bench(label: str, func: Any, number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<40} {seconds / number * 1e6:8.2f} us")
+
+
+def main() -> None:
+    items = find_items(json.loads(DATA.read_text(encoding="utf-8")))
+    paths = [THUMBNAILS, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE]]
+    missing = [[*path[:-1], "missing"] for path in paths]
+    print(f"{len(items)} items, {len(paths)} paths per item")
+
+    bench("hit", lambda: [nav(item, path, True) for item in items for path in paths], 2000)
+    bench("miss", lambda: [nav(item, path, True) for item in items for path in missing], 2000)
+
+    page = {"contents": items}
+    for label, func in [("full repr", nav_full_repr), ("truncated", nav)]:
+
+        def error(f: Any = func) -> None:
+            try:
+                f(page, ["missing"])
+            except KeyError:
+                pass
+
+        bench(f"error message, {label}", error, 200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the event loop lag while large playlist responses are decoded and parsed,
+on the event loop and offloaded to a thread pool and to a process pool.
+
+Run with ``python -m tests.benchmarks.bench_offload``
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+from ytmusicapi import YTMusic
+from ytmusicapi.helpers import initialize_headers
+from ytmusicapi.navigation import nav
+from ytmusicapi.offload import LoopLagMonitor
+from ytmusicapi.parsers.playlists import PLAYLIST_SHELF_PATHS, parse_playlist_response
+
+DATA = Path(__file__).parent.parent / "data" / "2024_03_get_playlist.json"
+
+#: the tracks of the fixture are repeated to resemble a response of several megabytes
+REPEAT = 10
+REQUESTS = 5
+
+
+def large_response() -> bytes:
+    response = json.loads(DATA.read_text(encoding="utf-8"))
+    shelf = next(filter(None, (nav(response, path, True) for path in PLAYLIST_SHELF_PATHS)))
+    shelf["contents"] = shelf["contents"] * REPEAT
+    return json.dumps(response).encode()
+
+
+async def measure(raw: bytes, executor: Executor | None) -> tuple[dict[str, float], float]:
+    yt = YTMusic(offload_threshold=None if executor is None else 1_000_000, executor=executor)
+    yt.__dict__["base_headers"] = initialize_headers()
+    yt._visitor_id = "visitor"
+    response = mock.Mock(status=200, headers={})
+    response.read = mock.AsyncMock(return_value=raw)
+    response.json = mock.AsyncMock(side_effect=lambda: json.loads(raw))
+    monitor = LoopLagMonitor()
+    with mock.patch.object(yt._session, "post", mock.AsyncMock(return_value=response)):
+        monitor.start()
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await yt._send_parsed_request("browse", {"browseId": "VLPL"}, partial(parse_playlist_response))
+            await asyncio.sleep(0.005)  # the next request would wait for the network
+        seconds = time.perf_counter() - start
+        await monitor.stop()
+    await yt._session.close()
+    return monitor.stats(), seconds / REQUESTS
+
+
+def main() -> None:
+    raw = large_response()
+    print(f"{len(raw) / 1024 / 1024:.1f} MiB per response")
+    with ThreadPoolExecutor(2) as threads, ProcessPoolExecutor(2) as processes:
+        processes.submit(int).result()  # start the workers before measuring
+        for label, executor in [("event loop", None), ("threads", threads), ("processes", processes)]:
+            stats, seconds = asyncio.run(measure(raw, executor))
+            print(
+                f"{label:<11} {seconds * 1000:8.1f} ms per response, lag: "
+                f"mean {stats['mean_ms']:6.2f} ms, p99 {stats['p99_ms']:7.2f} ms, max {stats['max_ms']:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares :py:func:`ytmusicapi.parsers.songs.parse_song_runs` with the previous version,
+which matched up to three regexes per run.
+
+Run with ``python -m tests.benchmarks.bench_song_runs``
+"""
+
+import json
+import re
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi.navigation import NAVIGATION_BROWSE_ID, nav
+from ytmusicapi.parsers._utils import parse_duration
+from ytmusicapi.parsers.songs import parse_song_runs
+from ytmusicapi.type_alias import JsonDict, JsonList
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def parse_song_runs_regexes(runs: JsonList) -> JsonDict:
+    """parse_song_runs before the single-pass classifier"""
+    parsed: JsonDict = {"artists": []}
+    for i, run in enumerate(runs):
+        if i % 2:
+            continue
+        text = run["text"]
+        if "navigationEndpoint" in run:
+            item = {"name": text, "id": nav(run, NAVIGATION_BROWSE_ID, True)}
+            if item["id"] and (item["id"].startswith("MPRE") or "release_detail" in item["id"]):
+                parsed["album"] = item
+            else:
+                parsed["artists"].append(item)
+        else:
+            if re.match(r"^\d([^ ])* [^ ]*$", text) and i > 0:
+                parsed["views"] = text.split(" ")[0]
+            elif re.match(r"^(\d+:)*\d+:\d+$", text):
+                parsed["duration"] = text
+                parsed["duration_seconds"] = parse_duration(text)
+            elif re.match(r"^\d{4}$", text):
+                parsed["year"] = text
+            else:
+                parsed["artists"].append({"name": text, "id": None})
+    return parsed
+
+
+def find_runs(node: Any) -> list[JsonList]:
+    """all lists of text runs in a response"""
+    if isinstance(node, dict):
+        found = [node["runs"]] if isinstance(node.get("runs"), list) and node["runs"] else []
+        return found + [runs for value in node.values() for runs in find_runs(value)]
+    if isinstance(node, list):
+        return [runs for value in node for runs in find_runs(value)]
+    return []
+
+
+def main() -> None:
+    items = [
+        runs
+        for path in sorted(DATA.glob("*.json"))
+        for runs in find_runs(json.loads(path.read_text("utf-8")))
+    ]
+    # the subtitles of search results and playlist items, which are missing from the recorded fixtures
+    items += [
+        [{"text": "Song"}, {"text": " • "}, {"text": "Oasis"}, {"text": " • "}, {"text": "3:45"}],
+        [{"text": "Oasis"}, {"text": " • "}, {"text": "1.2M views"}, {"text": " • "}, {"text": "1995"}],
+    ] * 100
+    print(f"{len(items)} run lists, {sum(len(runs) for runs in items)} runs")
+    assert [parse_song_runs(runs) for runs in items] == [parse_song_runs_regexes(runs) for runs in items]
+
+    for label, func in [("regexes", parse_song_runs_regexes), ("single pass", parse_song_runs)]:
+        seconds = min(timeit.repeat(lambda f=func: [f(runs) for runs in items], number=20, repeat=5))
+        print(f"{label:<12} {seconds / 20 / len(items) * 1e6:8.3f} us per item")
+
+
+if __name__ == "__main__":
+    main()
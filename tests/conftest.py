@@ -1,10 +1,18 @@
+import asyncio
 import configparser
+import json
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any, TypeVar
+from unittest import mock
 
 import pytest
 
 from ytmusicapi import YTMusic
 from ytmusicapi.auth.oauth import OAuthCredentials
+from ytmusicapi.helpers import initialize_headers
+
+T = TypeVar("T")
 
 
 def get_resource(file: str) -> str:
@@ -18,6 +26,40 @@ def get_config() -> configparser.RawConfigParser:
     return config
 
 
+def mock_response(
+    payload: Any = None, status: int = 200, headers: dict[str, str] | None = None, reason: str = "OK"
+) -> mock.Mock:
+    """response of a mocked post, whose body is ``payload`` encoded as JSON or the bytes of ``payload``"""
+    response = mock.Mock(status=status, reason=reason, headers=headers or {})
+    body = payload if isinstance(payload, bytes) else json.dumps({} if payload is None else payload).encode()
+    response.read = mock.AsyncMock(return_value=body)
+    return response
+
+
+def mock_post(yt: YTMusic, responses: Any, func: Callable[[], Awaitable[T]]) -> tuple[T, mock.AsyncMock]:
+    """
+    Runs ``func`` in a new event loop, while the posts of ``yt`` are answered with ``responses``.
+    The session of ``yt`` is closed afterwards.
+
+    :param responses: a response returned for every post, or the side effect of the post:
+        a list of responses and exceptions, or an async function of the post arguments
+    :return: the result of ``func`` and the mocked post
+    """
+    if isinstance(responses, mock.Mock) and not isinstance(responses, mock.AsyncMock):
+        post = mock.AsyncMock(return_value=responses)
+    else:
+        post = mock.AsyncMock(side_effect=responses)
+
+    async def run() -> T:
+        with mock.patch.object(yt._session, "post", post):
+            try:
+                return await func()
+            finally:
+                await yt.close()
+
+    return asyncio.run(run()), post
+
+
 @pytest.fixture(name="config")
 def fixture_config() -> configparser.RawConfigParser:
     return get_config()
@@ -50,6 +92,19 @@ def fixture_yt() -> YTMusic:
     return YTMusic()
 
 
+@pytest.fixture(name="offline_yt")
+def fixture_offline_yt() -> Callable[..., YTMusic]:
+    """creates instances for tests with mocked posts, which send no request for the visitor id"""
+
+    def create(*args: Any, **kwargs: Any) -> YTMusic:
+        yt = YTMusic(*args, **kwargs)
+        yt.__dict__["base_headers"] = initialize_headers()
+        yt._visitor_id = "visitor"
+        return yt
+
+    return create
+
+
 @pytest.fixture(name="yt_auth")
 def fixture_yt_auth(browser_filepath) -> YTMusic:
     """a non-brand account that is able to create uploads"""
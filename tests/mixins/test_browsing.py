@@ -99,6 +99,7 @@ class TestBrowsing:
             assert len(album["tracks"]) == 19
             assert len(album["artists"]) == 1
             assert len(album) == 14
+            assert album["tracks"][0]["views_count"] == 155_000_000
             for track in album["tracks"]:
                 assert isinstance(track["title"], str) and track["title"]
                 assert len(track["artists"]) > 0
@@ -3,6 +3,7 @@ from urllib.parse import urlparse
 import pytest
 
 from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.models import Playlist
 
 
 class TestLibrary:
@@ -13,6 +14,10 @@ class TestLibrary:
         playlists = yt_oauth.get_library_playlists(None)
         assert len(playlists) >= config.getint("limits", "library_playlists")
 
+        models = yt_oauth.get_library_playlists(None, output="models")
+        assert all(isinstance(playlist, Playlist) for playlist in models)
+        assert [playlist.id for playlist in models] == [playlist["playlistId"] for playlist in playlists]
+
         playlists = yt_empty.get_library_playlists()
         assert len(playlists) <= 1  # "Episodes saved for later"
 
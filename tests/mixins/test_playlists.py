@@ -5,10 +5,24 @@ from unittest import mock
 
 import pytest
 
+from tests.conftest import mock_post, mock_response
 from ytmusicapi import YTMusic
 from ytmusicapi.constants import SUPPORTED_LANGUAGES
 from ytmusicapi.enums import ResponseStatus
 from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.models import Track
+from ytmusicapi.navigation import CONTENT, MRLIR, SECTION, TWO_COLUMN_RENDERER, nav
+
+
+def load_response(test_file: str) -> dict:
+    with open(Path(__file__).parent.parent / "data" / test_file, encoding="utf8") as f:
+        return json.load(f)
+
+
+def run_offline(yt: YTMusic, response: dict, func):
+    """runs ``func`` while the first post returns ``response``, continuation requests return no further items"""
+    result, _ = mock_post(yt, [mock_response(response), mock_response()], func)
+    return result
 
 
 class TestPlaylists:
@@ -48,6 +62,98 @@ class TestPlaylists:
                 if track["videoType"] == "MUSIC_VIDEO_TYPE_ATV":
                     assert isinstance(track["album"]["name"], str) and track["album"]["name"]
 
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist.json", "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"),
+            ("2024_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+        ],
+    )
+    def test_iter_playlist_tracks(self, offline_yt, test_file, playlist_id):
+        response = load_response(test_file)
+        yt = offline_yt()
+
+        def run(limit):
+            async def iterate():
+                return [track async for track in yt.iter_playlist_tracks(playlist_id, limit=limit)]
+
+            return run_offline(yt, response, iterate)
+
+        tracks = run(None)
+        assert len(tracks) > 2
+        assert all(track["title"] for track in tracks)
+        assert run(2) == tracks[:2]
+
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist.json", "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"),
+            ("2024_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+        ],
+    )
+    def test_get_playlist_fields(self, offline_yt, test_file, playlist_id):
+        response = load_response(test_file)
+        yt = offline_yt()
+        fields = ["videoId", "title", "duration_seconds", "artists"]
+
+        playlist = run_offline(yt, response, lambda: yt.get_playlist(playlist_id))
+        projected = run_offline(yt, response, lambda: yt.get_playlist(playlist_id, fields=fields))
+        assert len(projected["tracks"]) == len(playlist["tracks"])
+        for track, full_track in zip(projected["tracks"], playlist["tracks"]):
+            assert set(track) <= set(fields)
+            assert track == {key: value for key, value in full_track.items() if key in fields}
+        assert projected["duration_seconds"] == playlist["duration_seconds"]
+        assert projected["title"] == playlist["title"] is not None
+
+    def test_get_playlist_audio_empty(self, offline_yt):
+        response = load_response("2024_12_get_playlist_audio.json")
+        shelf = nav(
+            response,
+            [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION, *CONTENT, "musicPlaylistShelfRenderer"],
+        )
+        shelf["contents"] = [item for item in shelf["contents"] if MRLIR not in item]
+
+        yt = offline_yt()
+        playlist = run_offline(
+            yt, response, lambda: yt.get_playlist("OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g")
+        )
+        assert playlist["id"] == "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"
+        assert playlist["tracks"] == []
+        assert playlist["title"] is None
+
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist.json", "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"),
+            ("2024_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+        ],
+    )
+    def test_get_playlist_models(self, offline_yt, test_file, playlist_id):
+        response = load_response(test_file)
+        yt = offline_yt()
+
+        playlist = run_offline(yt, response, lambda: yt.get_playlist(playlist_id, output="dicts"))
+        models = run_offline(yt, response, lambda: yt.get_playlist(playlist_id, output="models"))
+        assert len(models["tracks"]) == len(playlist["tracks"])
+        for track, track_dict in zip(models["tracks"], playlist["tracks"]):
+            assert isinstance(track, Track)
+            assert track.videoId == track_dict["videoId"]
+            assert track.title == track_dict["title"]
+            assert [(artist.name, artist.id) for artist in track.artists] == [
+                (artist["name"], artist["id"]) for artist in track_dict["artists"]
+            ]
+            if track_dict["album"] is not None:
+                assert (track.album.name, track.album.id) == (
+                    track_dict["album"]["name"],
+                    track_dict["album"]["id"],
+                )
+            assert [thumbnail.url for thumbnail in track.thumbnails] == [
+                t["url"] for t in track_dict["thumbnails"]
+            ]
+            assert track.duration_seconds == track_dict.get("duration_seconds")
+        assert models["duration_seconds"] == playlist["duration_seconds"]
+        assert models["title"] == playlist["title"]
+
     @pytest.mark.parametrize(
         "playlist_id, tracks_len, related_len",
         [
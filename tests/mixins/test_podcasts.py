@@ -1,3 +1,6 @@
+from ytmusicapi.models import Episode
+
+
 class TestPodcasts:
     def test_get_channel(self, config, yt):
         podcast_id = config["podcasts"]["channel_id"]
@@ -12,6 +15,10 @@ class TestPodcasts:
         assert len(channel_episodes) >= 150
         assert len(channel_episodes[0]) == 9
 
+        models = yt_oauth.get_channel_episodes(channel_id, channel["episodes"]["params"], output="models")
+        assert isinstance(models[0], Episode)
+        assert models[0].videoId == channel_episodes[0]["videoId"]
+
     def test_get_podcast(self, config, yt, yt_brand):
         podcast_id = config["podcasts"]["podcast_id"]
         podcast = yt.get_podcast(podcast_id)
@@ -49,3 +56,6 @@ class TestPodcasts:
     def test_get_episodes_playlist(self, yt_brand):
         playlist = yt_brand.get_episodes_playlist()
         assert len(playlist["episodes"]) > 90
+
+        playlist = yt_brand.get_episodes_playlist(output="models")
+        assert all(isinstance(episode, Episode) for episode in playlist["episodes"])
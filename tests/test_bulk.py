@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from ytmusicapi.bulk import BulkRequest
+from ytmusicapi.exceptions import YTMusicServerError
+
+
+async def fetch(item_id: str) -> str:
+    await asyncio.sleep(0.001 * int(item_id))
+    if item_id == "3":
+        raise YTMusicServerError(item_id)
+    if item_id == "4":
+        raise KeyError(item_id)
+    if item_id == "6":
+        raise Abort(item_id)
+    return item_id * 2
+
+
+class Abort(BaseException):
+    pass
+
+
+class TestBulk:
+    def test_results_in_input_order(self):
+        async def run():
+            return await BulkRequest(fetch, ["5", "1", "3", "2"], asyncio.Semaphore(10), 4)
+
+        results = asyncio.run(run())
+        assert results[0] == "55"
+        assert results[1] == "11"
+        assert isinstance(results[2], YTMusicServerError)
+        assert results[3] == "22"
+
+    def test_parser_errors_returned(self):
+        async def run():
+            return await BulkRequest(fetch, ["1", "4", "5"], asyncio.Semaphore(10), 2)
+
+        results = asyncio.run(run())
+        assert isinstance(results[1], KeyError)
+        assert results[2] == "55"
+
+    def test_base_exceptions_raised(self):
+        async def run():
+            return await BulkRequest(fetch, ["1", "6", "5"], asyncio.Semaphore(10), 2)
+
+        with pytest.raises(Abort, match="6"):
+            asyncio.run(run())
+
+    def test_completion_order(self):
+        async def run():
+            return [index async for index, _ in BulkRequest(fetch, ["5", "1", "2"], asyncio.Semaphore(10), 3)]
+
+        assert asyncio.run(run()) == [1, 2, 0]
+
+    def test_concurrency_limit(self):
+        running = peak = 0
+
+        async def tracked(item_id: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return item_id
+
+        async def run():
+            semaphore = asyncio.Semaphore(3)
+            # two batches share the semaphore of the session
+            return await asyncio.gather(
+                BulkRequest(tracked, [str(i) for i in range(20)], semaphore, 10),
+                BulkRequest(tracked, [str(i) for i in range(20)], semaphore, 2),
+            )
+
+        first, second = asyncio.run(run())
+        assert len(first) == len(second) == 20
+        assert peak == 3
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            BulkRequest(fetch, ["1"], asyncio.Semaphore(1), 0)
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from tests.conftest import mock_post, mock_response
+from ytmusicapi import ResponseCache, YTMusic
+from ytmusicapi.cache import DiskCacheBackend, MemoryCacheBackend
+
+BROWSER_AUTH = {"cookie": "__Secure-3PAPISID=a", "authorization": "SAPISIDHASH x"}
+
+
+class TestCache:
+    def test_memory_backend_lru(self):
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.set("a", "1", 60)
+        backend.set("b", "2", 60)
+        assert backend.get("a") == "1"
+        backend.set("c", "3", 60)
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert len(backend) == 2
+        backend.delete("a")
+        backend.delete("a")
+        assert backend.get("a") is None
+
+    def test_memory_backend_ttl(self):
+        backend = MemoryCacheBackend()
+        backend.set("a", "1", 60)
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            assert backend.get("a") is None
+
+    def test_disk_backend(self, tmp_path):
+        backend = DiskCacheBackend(tmp_path, maxsize=10)
+        backend.set("a", '{"x": 1}', 60)
+        assert DiskCacheBackend(tmp_path).get("a") == '{"x": 1}'
+        with mock.patch("time.time", return_value=time.time() + 61):
+            assert backend.get("a") is None
+        for i in range(12):
+            backend.set(str(i), "", 60)
+        assert len(list(tmp_path.glob("*.json"))) <= 10
+        backend.delete("11")
+        assert backend.get("11") is None
+
+    def test_disk_backend_concurrent_writes(self, tmp_path):
+        backend = DiskCacheBackend(tmp_path)
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda i: backend.set("a", str(i), 60), range(200)))
+        assert backend.get("a") in {str(i) for i in range(200)}
+        assert [path.name for path in tmp_path.iterdir()] == ["a.json"]
+
+    def test_disk_backend_failed_write(self, tmp_path):
+        backend = DiskCacheBackend(tmp_path)
+        with mock.patch("pathlib.Path.replace", side_effect=OSError("disk full")):
+            backend.set("a", "1", 60)
+        assert backend.get("a") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_backend_in_executor(self, tmp_path):
+        threads = []
+        backend = DiskCacheBackend(tmp_path)
+        get = backend.get
+
+        def record_get(key):
+            threads.append(threading.current_thread())
+            return get(key)
+
+        async def run():
+            cache = ResponseCache(backend)
+            with mock.patch.object(backend, "get", record_get):
+                await cache.set("a", {"x": 1}, 60)
+                return await cache.get("a")
+
+        assert asyncio.run(run()) == {"x": 1}
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_ttl_rules(self):
+        cache = ResponseCache()
+        assert cache.ttl("browse", {"browseId": "MPREb_4pL8gzRtw1p"}) == 86400
+        assert cache.ttl("browse", {"browseId": "FEmusic_liked_videos"}) == 0
+        assert cache.ttl("browse", {"browseId": "VLPL123"}) == 300
+        assert cache.ttl("browse", {"browseId": "FEmusic_tastebuilder", "formData": {}}) == 0
+        assert cache.ttl("browse", {"continuation": "4qmFsgK..."}) == 0
+        assert cache.ttl("browse/edit_playlist", {"playlistId": "PL123"}) == 0
+        assert cache.ttl("next", {"videoId": "hpSrLjc5SMs"}) == 60
+
+    def test_key_includes_context(self):
+        body = {"browseId": "MPREb_4pL8gzRtw1p", "context": {"client": {"hl": "en"}}}
+        other = {"browseId": "MPREb_4pL8gzRtw1p", "context": {"client": {"hl": "de"}}}
+        assert ResponseCache.key("browse", body) == ResponseCache.key("browse", dict(body))
+        assert ResponseCache.key("browse", body) != ResponseCache.key("browse", other)
+        assert ResponseCache.key("browse", body) != ResponseCache.key("browse", body, "&ctoken=abc")
+
+    def test_key_includes_account(self):
+        def key(yt):
+            return yt.cache.key("browse", {"browseId": "VLLM"}, "", "", yt._auth_identity)
+
+        cache = ResponseCache()
+        first = YTMusic(BROWSER_AUTH, cache=cache)
+        second = YTMusic({"cookie": "__Secure-3PAPISID=b", "authorization": "SAPISIDHASH x"}, cache=cache)
+        assert first._auth_identity != second._auth_identity
+        assert key(first) != key(second) != key(YTMusic(cache=cache))
+        assert YTMusic()._auth_identity == ""
+
+    def test_send_request_cached(self, offline_yt, sample_album):
+        cache = ResponseCache()
+        yt = offline_yt(cache=cache)
+
+        async def send():
+            first = await yt._send_request("browse", {"browseId": sample_album})
+            first["contents"]["modified"] = True
+            second = await yt._send_request("browse", {"browseId": sample_album})
+            await yt._send_request("browse", {"browseId": "FEmusic_liked_videos"})
+            await yt._send_request("browse", {"browseId": "FEmusic_liked_videos"})
+            return second
+
+        second, post = mock_post(yt, mock_response({"contents": {}}), send)
+        assert post.await_count == 3
+        assert second == {"contents": {}}
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_invalidate_after_edit(self, offline_yt):
+        cache = ResponseCache()
+        yt = offline_yt(BROWSER_AUTH, cache=cache)
+
+        async def send():
+            await yt._send_request("browse", {"browseId": "VLPL123"})
+            await yt._send_request("browse", {"browseId": "VLPL123"})
+            await yt.edit_playlist("PL123", title="title")
+            await yt._send_request("browse", {"browseId": "VLPL123"})
+
+        _, post = mock_post(yt, mock_response({"status": "STATUS_SUCCEEDED"}), send)
+        assert post.await_count == 3
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_invalidation_index_pruned(self):
+        async def run():
+            cache = ResponseCache(MemoryCacheBackend(maxsize=2))
+            for i in range(3):
+                await cache.set(str(i), {}, 60, f"VLPL{i}")
+            assert set(cache._browse_keys) == {"VLPL1", "VLPL2"}
+            with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+                assert await cache.get("1") is None
+            assert set(cache._browse_keys) == {"VLPL2"}
+            await cache.invalidate(["VLPL2"])
+            assert cache._browse_keys == {} and not cache._key_browse_ids
+
+        asyncio.run(run())
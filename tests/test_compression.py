@@ -0,0 +1,56 @@
+import gzip
+import json
+
+from tests.conftest import mock_post, mock_response
+from ytmusicapi.compression import TransferStats, accept_encoding, compress_body
+from ytmusicapi.helpers import initialize_headers
+
+
+def send(yt, body):
+    response = mock_response({"status": "STATUS_SUCCEEDED"}, headers={"Content-Length": "20"})
+    _, post = mock_post(yt, response, lambda: yt._send_request("browse/edit_playlist", body))
+    return post.call_args.kwargs
+
+
+class TestCompression:
+    def test_compress_body(self):
+        body = json.dumps({"actions": [{"action": "ACTION_ADD_VIDEO"}] * 100}).encode()
+        compressed, encoding = compress_body(body)
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == body
+        assert len(compressed) < len(body) / 10
+        assert compress_body(b"{}") == (b"{}", None)
+        assert compress_body(body, None) == (body, None)
+
+    def test_accept_encoding(self):
+        assert accept_encoding().startswith("gzip, deflate")
+        assert "content-encoding" not in initialize_headers()
+
+    def test_send_request(self, offline_yt):
+        actions = [{"action": "ACTION_ADD_VIDEO", "addedVideoId": "kTJczUoc26U"}] * 100
+
+        def run(body, **kwargs):
+            yt = offline_yt(**kwargs)
+            return yt, send(yt, body)
+
+        yt, large = run({"playlistId": "PL", "actions": actions})
+        assert large["headers"]["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(large["data"]))["actions"] == actions
+        stats = yt.transfer_stats
+        assert stats.requests == 1
+        assert stats.request_bytes_sent == len(large["data"]) < stats.request_bytes
+        assert stats.response_bytes_received == 20
+        assert stats.saved_bytes == stats.request_bytes - stats.request_bytes_sent + stats.response_bytes - 20
+
+        _, small = run({"playlistId": "PL", "actions": actions[:1]})
+        assert "content-encoding" not in small["headers"]
+        assert json.loads(small["data"])["actions"] == actions[:1]
+
+        _, disabled = run({"playlistId": "PL", "actions": actions}, compress_threshold=None)
+        assert "content-encoding" not in disabled["headers"]
+
+    def test_stats_without_content_length(self):
+        stats = TransferStats()
+        stats.record_response(100, {})
+        assert stats.response_bytes == stats.response_bytes_received == 100
+        assert stats.saved_bytes == 0
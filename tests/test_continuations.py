@@ -0,0 +1,230 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from ytmusicapi import ContinuationCursor, YTMusic
+from ytmusicapi.continuations import (
+    CONTINUATION_2025,
+    get_continuation_cursor,
+    get_continuations,
+    get_continuations_2025,
+    iter_continuations,
+    iter_continuations_2025,
+    iter_items,
+)
+from ytmusicapi.exceptions import YTMusicUserError
+
+
+def shelf(page: int, last: int) -> dict:
+    results: dict = {"contents": [{"id": f"{page}-{i}"} for i in range(3)]}
+    if page < last:
+        results["continuations"] = [{"nextContinuationData": {"continuation": str(page + 1)}}]
+    return results
+
+
+class RequestRecorder:
+    def __init__(self, last: int = 3):
+        self.last = last
+        self.requests: list[str] = []
+
+    async def __call__(self, additionalParams: str) -> dict:
+        self.requests.append(additionalParams)
+        page = int(additionalParams.rsplit("=", 1)[1])
+        return {"continuationContents": {"musicShelfContinuation": shelf(page, self.last)}}
+
+
+def parse(contents: list) -> list:
+    return [item["id"] for item in contents]  # type: ignore[misc]
+
+
+class TestContinuations:
+    def test_iter_continuations_is_lazy(self):
+        request_func = RequestRecorder()
+
+        async def run():
+            pages = iter_continuations(shelf(0, 3), "musicShelfContinuation", request_func, parse)
+            first = await pages.__anext__()
+            assert len(request_func.requests) == 1
+            return [first] + [page async for page in pages]
+
+        pages = asyncio.run(run())
+        assert pages == [["1-0", "1-1", "1-2"], ["2-0", "2-1", "2-2"], ["3-0", "3-1", "3-2"]]
+        assert len(request_func.requests) == 3
+
+    def test_get_continuations_limit(self):
+        request_func = RequestRecorder()
+        items = asyncio.run(get_continuations(shelf(0, 3), "musicShelfContinuation", 4, request_func, parse))
+        assert len(items) == 6
+        assert len(request_func.requests) == 2
+
+        items = asyncio.run(get_continuations(shelf(0, 3), "musicShelfContinuation", 0, request_func, parse))
+        assert items == []
+        assert len(request_func.requests) == 2
+
+    def test_iter_items_limit(self):
+        request_func = RequestRecorder()
+
+        async def run(limit):
+            pages = iter_continuations(shelf(0, 3), "musicShelfContinuation", request_func, parse)
+            return [item async for item in iter_items(parse(shelf(0, 3)["contents"]), pages, limit)]
+
+        assert asyncio.run(run(3)) == ["0-0", "0-1", "0-2"]
+        assert request_func.requests == []
+        assert len(asyncio.run(run(5))) == 5
+        assert len(request_func.requests) == 1
+        assert len(asyncio.run(run(None))) == 12
+
+    def test_continuations_2025(self):
+        def page(index: int, last: int) -> list:
+            items: list = [{"id": f"{index}-{i}"} for i in range(2)]
+            if index < last:
+                continuation = {"continuationCommand": {"token": str(index + 1)}}
+                items.append({"continuationItemRenderer": {"continuationEndpoint": continuation}})
+            return items
+
+        async def request_func(body: dict) -> dict:
+            contents = page(int(body["continuation"]), 2)
+            return {
+                "onResponseReceivedActions": [
+                    {"appendContinuationItemsAction": {"continuationItems": contents}}
+                ]
+            }
+
+        def parse_2025(contents: list) -> list:
+            return [item["id"] for item in contents if "id" in item]
+
+        results = {"contents": page(0, 2)}
+
+        async def run():
+            return [page async for page in iter_continuations_2025(results, request_func, parse_2025)]
+
+        assert asyncio.run(run()) == [["1-0", "1-1"], ["2-0", "2-1"]]
+        assert asyncio.run(get_continuations_2025(results, 1, request_func, parse_2025)) == ["1-0", "1-1"]
+        assert asyncio.run(get_continuations_2025({"contents": []}, None, request_func, parse_2025)) == []
+
+    def test_prefetch(self):
+        request_func = RequestRecorder()
+
+        async def run():
+            pages = iter_continuations(
+                shelf(0, 3), "musicShelfContinuation", request_func, parse, prefetch=True
+            )
+            first = await pages.__anext__()
+            # the second page was requested before the first was consumed
+            assert len(request_func.requests) == 2
+            return [first] + [page async for page in pages]
+
+        assert len(asyncio.run(run())) == 3
+        assert len(request_func.requests) == 3
+
+    def test_prefetch_cancelled(self):
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def slow_request(additionalParams: str) -> dict:
+            started.append(additionalParams)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(additionalParams)
+                raise
+            return {}
+
+        async def run():
+            async def request_func(additionalParams: str) -> dict:
+                if not started:
+                    started.append(additionalParams)
+                    return {"continuationContents": {"musicShelfContinuation": shelf(1, 3)}}
+                return await slow_request(additionalParams)
+
+            pages = iter_continuations(
+                shelf(0, 3), "musicShelfContinuation", request_func, parse, prefetch=True
+            )
+            items = [item async for item in iter_items([], pages, 2)]
+            await asyncio.sleep(0)
+            return items
+
+        assert asyncio.run(run()) == ["1-0", "1-1"]
+        assert len(started) == 2
+        assert cancelled == [started[1]]
+
+    def test_prefetch_limit(self):
+        request_func = RequestRecorder()
+        items = asyncio.run(
+            get_continuations(shelf(0, 3), "musicShelfContinuation", 3, request_func, parse, prefetch=True)
+        )
+        assert len(items) == 3
+        assert len(request_func.requests) == 1
+
+    def test_cursor(self):
+        body = {"browseId": "FEmusic_liked_videos", "context": {"client": {}}}
+        cursor = get_continuation_cursor(
+            shelf(0, 3), "playlist_items", "browse", body, "musicShelfContinuation"
+        )
+        assert cursor is not None
+        assert cursor.token == "1"
+        assert "context" not in cursor.body
+        assert ContinuationCursor.loads(cursor.dumps()) == cursor
+        assert (
+            get_continuation_cursor(shelf(3, 3), "playlist_items", "browse", body, "musicShelfContinuation")
+            is None
+        )
+        with pytest.raises(YTMusicUserError, match="Invalid continuation cursor"):
+            ContinuationCursor.loads("not a cursor")
+
+    def test_cursor_fields(self):
+        cursor = get_continuation_cursor(
+            shelf(0, 3),
+            "playlist_items",
+            "browse",
+            {},
+            "musicShelfContinuation",
+            fields=frozenset({"b", "a"}),
+        )
+        assert cursor is not None
+        assert cursor.params == {"fields": ["a", "b"]}
+        assert ContinuationCursor.loads(cursor.dumps()).fields == frozenset({"a", "b"})
+        assert cursor.with_token("2").fields == cursor.fields
+        assert (
+            ContinuationCursor("playlist_items", "browse", {}, "musicShelfContinuation", "1").fields is None
+        )
+
+    def test_cursor_advances(self):
+        request_func = RequestRecorder()
+        cursor = get_continuation_cursor(
+            shelf(0, 3), "playlist_items", "browse", {}, "musicShelfContinuation"
+        )
+        items = asyncio.run(
+            get_continuations(shelf(0, 3), "musicShelfContinuation", 4, request_func, parse, cursor=cursor)
+        )
+        assert items.cursor.token == "3"
+        items = asyncio.run(
+            get_continuations(shelf(0, 3), "musicShelfContinuation", None, request_func, parse, cursor=cursor)
+        )
+        assert items.cursor is None
+        items = asyncio.run(
+            get_continuations(shelf(0, 3), "musicShelfContinuation", 0, request_func, parse, cursor=cursor)
+        )
+        assert items.cursor == cursor
+
+    @pytest.mark.parametrize("continuation_type", ["musicShelfContinuation", CONTINUATION_2025])
+    def test_resume(self, continuation_type):
+        body = {"browseId": "FEmusic_liked_videos"}
+        cursor = ContinuationCursor("playlist_items", "browse", body, continuation_type, "token")
+
+        async def run():
+            yt = YTMusic()
+            send_request = mock.AsyncMock(return_value={})
+            with mock.patch.object(yt, "_send_request", send_request):
+                items = await yt.resume(cursor.dumps())
+            await yt._session.close()
+            return items, send_request.await_args.args
+
+        items, args = asyncio.run(run())
+        assert items == []
+        assert items.cursor == cursor
+        if continuation_type == CONTINUATION_2025:
+            assert args == ("browse", {"continuation": "token"})
+        else:
+            assert args == ("browse", body, "&ctoken=token&continuation=token")
@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ytmusicapi.constants import SUPPORTED_LANGUAGES
+from ytmusicapi.navigation import MTRIR
+from ytmusicapi.parsers.albums import parse_album_response
+from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.parsers.search import ALL_RESULT_TYPES, get_search_result_type
+
+
+def carousel(title: str) -> dict:
+    return {
+        "musicCarouselShelfRenderer": {
+            "header": {"musicCarouselShelfBasicHeaderRenderer": {"title": {"runs": [{"text": title}]}}},
+            "contents": [{MTRIR: {}}],
+        }
+    }
+
+
+@pytest.mark.parametrize("language", SUPPORTED_LANGUAGES)
+def test_parser_tables(language):
+    parser = Parser(language)
+    assert parser.tables is Parser(language).tables
+    result_types = parser.get_search_result_types()
+    assert set(result_types.values()) == set(ALL_RESULT_TYPES)
+    for label, result_type in result_types.items():
+        assert get_search_result_type(label, result_types) == result_type
+        assert label in parser.get_api_result_types()
+    assert get_search_result_type("unknown", result_types) == "album"
+    assert get_search_result_type("Song", Parser("en").get_search_result_types()) == "song"
+    assert get_search_result_type("", result_types) is None
+
+
+def test_parse_channel_contents_languages():
+    german, english = Parser("de"), Parser("en")
+    results = [carousel("Alben"), carousel("Albums")]
+    assert list(german.parse_channel_contents(results, lazy=True)) == ["albums"]
+    assert list(english.parse_channel_contents(results, lazy=True)) == ["albums"]
+    assert english.parse_channel_contents([carousel("Alben")]) == {}
+
+
+@pytest.mark.parametrize(
+    "language, text, count",
+    [
+        ("en", "1.2M views", 1_200_000),
+        ("en", "2.91K", 2_910),
+        ("en", "1,234,567 views", 1_234_567),
+        ("en", "12 songs", 12),
+        ("de", "12 Mio. Aufrufe", 12_000_000),
+        ("de", "3,4 Tsd.", 3_400),
+        ("de", "1.234 Aufrufe", 1_234),
+        ("fr", "3,4 k", 3_400),
+        ("fr", "1\u202f234\u202f567 vues", 1_234_567),
+        ("ja", "1.2万回視聴", 12_000),
+        ("ar", "\u0661\u066b\u0662 مليون", 1_200_000),
+        ("en", "no views", None),
+        ("en", None, None),
+    ],
+)
+def test_parse_count(language, text, count):
+    assert Parser(language).parse_count(text) == count
+
+
+def test_parse_channel_contents_counts():
+    related = carousel("Das könnte Fans auch gefallen")
+    related["musicCarouselShelfRenderer"]["contents"] = [
+        {
+            MTRIR: {
+                "title": {
+                    "runs": [
+                        {"text": "The Verve", "navigationEndpoint": {"browseEndpoint": {"browseId": "UC"}}}
+                    ]
+                },
+                "subtitle": {"runs": [{"text": "3,4 Mio. Abonnenten"}]},
+                "thumbnailRenderer": {"musicThumbnailRenderer": {"thumbnail": {"thumbnails": []}}},
+            }
+        }
+    ]
+    for lazy in (False, True):
+        artist = Parser("de").parse_channel_contents([related], lazy=lazy)["related"]["results"][0]
+        assert artist["subscribers"] == "3,4"
+        assert artist["subscribers_count"] == 3_400_000
+
+
+def test_album_play_counts():
+    response = json.loads((Path(__file__).parent / "data" / "2024_03_get_album.json").read_text())
+    album = parse_album_response(response, "MPREb_test")
+    assert album["tracks"][0]["views"] == "155M plays"
+    assert album["tracks"][0]["views_count"] == 155_000_000
+    assert all(isinstance(track["views_count"], int) for track in album["tracks"])
+
+    tracks = parse_album_response(response, "MPREb_test", fields=frozenset(["views_count"]))["tracks"]
+    assert tracks[0] == {"views_count": 155_000_000}
+    models = parse_album_response(response, "MPREb_test", output="models")["tracks"]
+    assert [track.views_count for track in models] == [track["views_count"] for track in album["tracks"]]
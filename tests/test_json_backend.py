@@ -0,0 +1,66 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ytmusicapi import ResponseCache
+from ytmusicapi.auth.oauth import OAuthToken, RefreshingToken
+from ytmusicapi.auth.oauth.credentials import Credentials
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.json_backend import get_json_backend
+
+BACKENDS = [
+    pytest.param(
+        name, marks=pytest.mark.skipif(not importlib.util.find_spec(name), reason=f"{name} not installed")
+    )
+    for name in ["json", "orjson", "msgspec"]
+]
+
+DATA = {"title": "Nach Hause · 家", "count": 12, "items": [None, True, 1.5], "nested": {"a": []}}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend_roundtrip(name):
+    backend = get_json_backend(name)
+    assert backend.name == name
+    assert backend.loads(backend.dumps(DATA)) == DATA
+    assert backend.loads(backend.dumps(DATA).decode("utf-8")) == DATA
+    assert backend.loads(backend.dumps_indented(DATA)) == DATA
+    assert b"\n" in backend.dumps_indented(DATA)
+    with pytest.raises(backend.decode_error):
+        backend.loads(b"<html></html>")
+
+
+def test_auto_backend():
+    installed = [name for name in ["orjson", "msgspec"] if importlib.util.find_spec(name)]
+    assert get_json_backend().name == (installed[0] if installed else "json")
+    with pytest.raises(YTMusicUserError, match="Unknown JSON backend"):
+        get_json_backend("simplejson")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_cache_roundtrip(name):
+    async def roundtrip():
+        cache = ResponseCache(json_backend=name)
+        await cache.set("key", DATA, 60)
+        return await cache.get("key")
+
+    assert asyncio.run(roundtrip()) == DATA
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_store_token(name, tmp_path: Path):
+    token = RefreshingToken(
+        credentials=mock.Mock(spec=Credentials),
+        json_backend=get_json_backend(name),
+        scope="https://www.googleapis.com/auth/youtube",
+        token_type="Bearer",
+        access_token="access",
+        refresh_token="refresh",
+        expires_at=2**40,
+    )
+    token.store_token(str(tmp_path / "oauth.json"))
+    stored = OAuthToken.from_json(tmp_path / "oauth.json")
+    assert stored.as_dict() == token.as_dict()
@@ -0,0 +1,70 @@
+import pytest
+
+from ytmusicapi.lazy import LazyList
+from ytmusicapi.navigation import MTRIR
+from ytmusicapi.parsers.browsing import parse_mixed_content
+
+
+def playlist_item(i: int) -> dict:
+    return {
+        MTRIR: {
+            "title": {
+                "runs": [
+                    {
+                        "text": f"Playlist {i}",
+                        "navigationEndpoint": {
+                            "browseEndpoint": {
+                                "browseId": f"VLPL{i}",
+                                "browseEndpointContextSupportedConfigs": {
+                                    "browseEndpointContextMusicConfig": {
+                                        "pageType": "MUSIC_PAGE_TYPE_PLAYLIST"
+                                    }
+                                },
+                            }
+                        },
+                    }
+                ]
+            },
+            "subtitle": {"runs": [{"text": "Playlist"}]},
+            "thumbnailRenderer": {"musicThumbnailRenderer": {"thumbnail": {"thumbnails": []}}},
+        }
+    }
+
+
+def test_lazy_list():
+    calls = []
+
+    def parse(raw: int) -> int:
+        calls.append(raw)
+        return raw * 2
+
+    items = LazyList([1, 2, 3], parse)
+    assert len(items) == 3
+    assert calls == []
+    assert items[1] == 4
+    assert items[-1] == 6
+    assert items[1] == 4
+    assert calls == [2, 3]
+    assert items[:2] == [2, 4]
+    assert list(items) == [2, 4, 6]
+    assert calls == [2, 3, 1]
+    assert items == [2, 4, 6]
+    with pytest.raises(IndexError):
+        items[3]
+
+
+def test_parse_mixed_content_lazy():
+    rows = [
+        {
+            "musicCarouselShelfRenderer": {
+                "header": {"musicCarouselShelfBasicHeaderRenderer": {"title": {"runs": [{"text": "Mixes"}]}}},
+                "contents": [playlist_item(i) for i in range(3)] + [{"unknownRenderer": {}}],
+            }
+        }
+    ]
+    eager = parse_mixed_content(rows)
+    lazy = parse_mixed_content(rows, lazy=True)
+    assert isinstance(lazy[0]["contents"], LazyList)
+    assert len(lazy[0]["contents"]) == len(eager[0]["contents"]) == 3
+    assert lazy[0]["contents"][2]["playlistId"] == "PL2"
+    assert lazy == eager
@@ -0,0 +1,24 @@
+import pytest
+
+from ytmusicapi.navigation import THUMBNAILS, nav
+
+ITEM = {
+    "title": {"runs": [{"text": "Song", "navigationEndpoint": {"browseEndpoint": {"browseId": "MPREb"}}}]},
+    "thumbnail": {"musicThumbnailRenderer": {"thumbnail": {"thumbnails": [{"url": "a"}]}}},
+}
+
+
+def test_nav():
+    assert nav(ITEM, THUMBNAILS) == [{"url": "a"}]
+    assert nav(None, THUMBNAILS) is None
+    assert nav({"thumbnail": {}}, THUMBNAILS, True) is None
+    assert nav({}, []) == {}
+
+
+def test_nav_error():
+    huge = {"thumbnail": {"croppedSquareThumbnailRenderer": list(range(100_000))}}
+    with pytest.raises(KeyError, match="Unable to find 'musicThumbnailRenderer'") as e:
+        nav(huge, THUMBNAILS)
+    assert len(str(e.value)) < 300
+    with pytest.raises(IndexError, match="Unable to find '1'"):
+        nav({"runs": []}, ["runs", 1])
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from tests.conftest import mock_post, mock_response
+from ytmusicapi.navigation import MRLIR, nav
+from ytmusicapi.offload import LoopLagMonitor
+from ytmusicapi.parsers.albums import parse_album_response
+from ytmusicapi.parsers.browsing import parse_artist
+from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.parsers.playlists import PLAYLIST_SHELF_PATHS, parse_playlist_items, parse_playlist_response
+
+
+def block(seconds):
+    time.sleep(seconds)
+
+
+class TestOffload:
+    def test_offload_threshold(self, offline_yt):
+        threads = []
+
+        def parse(response):
+            threads.append(threading.current_thread().name)
+            return len(response["contents"])
+
+        def run(payload):
+            with ThreadPoolExecutor(1, thread_name_prefix="parser") as executor:
+                yt = offline_yt(offload_threshold=100, executor=executor)
+                send = lambda: yt._send_parsed_request("browse", {"browseId": "FEmusic_charts"}, parse)
+                parsed, _ = mock_post(yt, mock_response(payload), send)
+                return parsed
+
+        assert run({"contents": ["x" * 100]}) == 1
+        assert run({"contents": []}) == 0
+        assert threads[0].startswith("parser")
+        assert threads[1] == threading.current_thread().name
+
+    def test_parse_playlist_response(self):
+        response = json.loads((Path(__file__).parent / "data" / "2024_03_get_playlist.json").read_text())
+        shelf = next(nav(response, path, True) for path in PLAYLIST_SHELF_PATHS if nav(response, path, True))
+        contents = shelf["contents"]
+        remaining, tracks = parse_playlist_response(response)
+        assert tracks == parse_playlist_items(contents)
+        assert len(tracks) > 0
+        assert shelf["contents"] is contents
+        remaining_shelf = next(
+            nav(remaining, path, True) for path in PLAYLIST_SHELF_PATHS if nav(remaining, path, True)
+        )
+        assert not any(MRLIR in item for item in remaining_shelf["contents"])
+
+    def test_parse_album_response(self):
+        response = json.loads((Path(__file__).parent / "data" / "2024_03_get_album.json").read_text())
+        number_format = Parser("de").tables.number_format
+        parse = pickle.loads(
+            pickle.dumps(
+                partial(
+                    parse_album_response, browse_id="MPREb_test", output="models", number_format=number_format
+                )
+            )
+        )
+        assert parse.keywords["number_format"] == number_format
+        album = parse(response)
+        assert len(album["tracks"]) > 0
+        assert all(track.album.id == "MPREb_test" for track in album["tracks"])
+        assert album == pickle.loads(pickle.dumps(album))
+
+    def test_parse_artist_picklable(self):
+        parser = Parser("de")
+        assert parser.tables.channel_categories
+        parse = pickle.loads(pickle.dumps(partial(parse_artist, parser=parser, lazy=True)))
+        assert parse.keywords["parser"].language == "de"
+        assert parse.keywords["parser"].tables is parser.tables
+
+    def test_loop_lag_monitor(self):
+        async def run():
+            monitor = LoopLagMonitor(interval=0.001)
+            monitor.start()
+            await asyncio.sleep(0.01)
+            block(0.05)
+            await asyncio.sleep(0.01)
+            await monitor.stop()
+            return monitor.stats()
+
+        stats = asyncio.run(run())
+        assert stats["samples"] > 2
+        assert stats["max_ms"] >= 40
+        assert stats["mean_ms"] <= stats["max_ms"]
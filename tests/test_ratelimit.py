@@ -0,0 +1,48 @@
+import pytest
+
+from tests.conftest import mock_post, mock_response
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.ratelimit import RateLimiter, TokenBucket, is_throttled, parse_retry_after
+
+
+class TestRateLimit:
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_backoff_and_recovery(self):
+        limiter = RateLimiter({"browse": 10}, recovery=0.1)
+        assert limiter.bucket("player") is None
+        limiter.throttled("browse", retry_after=5)
+        bucket = limiter.bucket("browse")
+        assert bucket.rate == 5
+        assert bucket.reserve() >= 4.9
+        limiter.succeeded("browse")
+        assert bucket.rate == 6
+        for _ in range(10):
+            limiter.succeeded("browse")
+        assert bucket.rate == 10
+
+    def test_is_throttled(self):
+        assert is_throttled(429)
+        assert is_throttled(403, {"status": "RESOURCE_EXHAUSTED", "message": ""})
+        assert is_throttled(403, {"message": "Quota exceeded for quota metric"})
+        assert not is_throttled(400, {"status": "INVALID_ARGUMENT"})
+        assert not is_throttled(200)
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+    def test_send_request_throttled(self, offline_yt, sample_album):
+        limiter = RateLimiter({"browse": 10})
+        yt = offline_yt(rate_limiter=limiter)
+        response = mock_response(
+            {"error": {"message": "slow down"}}, 429, {"Retry-After": "2"}, reason="Too Many Requests"
+        )
+        with pytest.raises(YTMusicServerError, match="slow down"):
+            mock_post(yt, response, lambda: yt._send_request("browse", {"browseId": sample_album}))
+        bucket = limiter.bucket("browse")
+        assert bucket.rate == 5
+        assert bucket.reserve() > 1.5
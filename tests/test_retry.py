@@ -0,0 +1,55 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from tests.conftest import mock_post, mock_response
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.retry import RetryBudget, RetryPolicy
+
+
+def send(yt, endpoint, side_effect, body=None):
+    body = body or {"browseId": "MPREb_4pL8gzRtw1p"}
+    response, post = mock_post(yt, side_effect, lambda: yt._send_request(endpoint, body))
+    return response, post.await_count
+
+
+class TestRetry:
+    def test_retry_delay(self):
+        policy = RetryPolicy(max_attempts=3, budget=None)
+        assert policy.retry_delay(1, status=503) is not None
+        assert policy.retry_delay(1, status=404) is None
+        assert policy.retry_delay(3, status=503) is None
+        assert policy.retry_delay(1, aiohttp.ServerDisconnectedError()) is not None
+        assert policy.retry_delay(1, asyncio.TimeoutError()) is not None
+        assert policy.retry_delay(1, ValueError()) is None
+        assert policy.retry_delay(1, YTMusicServerError("", 502, retry_after=7)) == 7
+        assert policy.retry_delay(1, YTMusicServerError("")) is None
+        assert 0 <= policy.backoff(10) <= policy.backoff_max
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, initial=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+    def test_retries_transient_errors(self, offline_yt):
+        yt = offline_yt(retry_policy=RetryPolicy(backoff_base=0.001))
+        side_effect = [aiohttp.ServerDisconnectedError(), mock_response({}, 503), mock_response({"a": 1})]
+        assert send(yt, "browse", side_effect) == ({"a": 1}, 3)
+
+    def test_no_retry_for_writes(self, offline_yt):
+        yt = offline_yt(retry_policy=RetryPolicy(backoff_base=0.001))
+        with pytest.raises(YTMusicServerError) as e:
+            send(yt, "browse/edit_playlist", [mock_response({}, 503), mock_response({})])
+        assert e.value.status == 503
+
+    def test_no_retry_for_form_data(self, offline_yt):
+        yt = offline_yt(retry_policy=RetryPolicy(backoff_base=0.001))
+        body = {"browseId": "FEmusic_home", "formData": {"selectedValues": ["artist"]}}
+        with pytest.raises(YTMusicServerError):
+            send(yt, "browse", [mock_response({}, 503), mock_response({})], body)
+        assert RetryPolicy().applies_to("browse", {"browseId": "FEmusic_home"})
+        assert not RetryPolicy().applies_to("browse", body)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from tests.test_ytmusic import html_response, iter_chunks
+from ytmusicapi import YTMusic
+from ytmusicapi.visitor import FileVisitorIdStore, MemoryVisitorIdStore, read_visitor_id
+
+HTML = b'<html><head><script>ytcfg.set({"VISITOR_DATA":"Cgt2aXNpdG9yJTNE"});</script></head>'
+
+
+def test_read_visitor_id():
+    page = HTML + b"<body>" + b"x" * 100000 + b"</body></html>"
+    consumed = []
+
+    async def chunks(size):
+        for i in range(0, len(page), size):
+            consumed.append(i)
+            yield page[i : i + size]
+
+    # the match is split across chunks
+    assert asyncio.run(read_visitor_id(chunks(50))) == "Cgt2aXNpdG9yJTNE"
+    assert len(consumed) == 2
+    assert asyncio.run(read_visitor_id(iter_chunks(b'"VISITOR_DATA": "a\\u003db"'))) == "a=b"
+    assert asyncio.run(read_visitor_id(iter_chunks(b"<html></html>"))) == ""
+
+
+def test_file_store(tmp_path):
+    path = tmp_path / "visitor" / "visitor_id.json"
+    store, other = FileVisitorIdStore(path), FileVisitorIdStore(path)
+    assert store.get() is None
+    store.set("Cgt2aXNpdG9y")
+    assert other.get() == "Cgt2aXNpdG9y"
+    assert list(path.parent.glob("*.tmp")) == []
+
+    assert store.acquire()
+    assert not other.acquire()
+    assert not store.acquire()
+    store.release()
+    assert other.acquire()
+    other.release()
+
+    expired = FileVisitorIdStore(path, ttl=-1)
+    expired.set("expired")
+    assert store.get() is None
+    path.write_text("{")
+    assert store.get() is None
+    path.write_text(json.dumps({"visitor_id": 1, "expires_at": time.time() + 60}))
+    assert store.get() is None
+
+
+def test_file_store_concurrent_writes(tmp_path):
+    path = tmp_path / "visitor_id.json"
+    store = FileVisitorIdStore(path)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda i: store.set(f"visitor{i}"), range(200)))
+    assert store.get() in {f"visitor{i}" for i in range(200)}
+    assert [file.name for file in tmp_path.iterdir()] == ["visitor_id.json"]
+
+
+def test_memory_store():
+    store = MemoryVisitorIdStore(ttl=60)
+    assert store.get() is None
+    store.set("Cgt2aXNpdG9y")
+    assert store.get() == "Cgt2aXNpdG9y"
+    assert store.acquire()
+    assert not store.acquire()
+    store.release()
+    assert MemoryVisitorIdStore(ttl=-1).get() is None
+
+
+def test_ytmusic_visitor_id_store(tmp_path):
+    path = tmp_path / "visitor_id.json"
+
+    async def run():
+        instances = [YTMusic(visitor_id_store=FileVisitorIdStore(path)) for _ in range(5)]
+
+        async def get(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return html_response(HTML)
+
+        patches = [
+            mock.patch.object(yt, "_send_get_request", mock.AsyncMock(side_effect=get)) for yt in instances
+        ]
+        gets = [patch.start() for patch in patches]
+        try:
+            await asyncio.gather(*(yt._ensure_visitor_id() for yt in instances))
+        finally:
+            for patch in patches:
+                patch.stop()
+        assert sum(get.await_count for get in gets) == 1
+        assert {yt.visitor_id for yt in instances} == {"Cgt2aXNpdG9yJTNE"}
+
+        # a new process reads the stored visitor id
+        yt = YTMusic(visitor_id_store=FileVisitorIdStore(path))
+        with mock.patch.object(yt, "_send_get_request", mock.AsyncMock()) as get:
+            await yt._ensure_visitor_id()
+        get.assert_not_awaited()
+        assert yt.visitor_id == "Cgt2aXNpdG9yJTNE"
+
+    asyncio.run(run())
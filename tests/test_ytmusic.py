@@ -1,9 +1,18 @@
+import asyncio
+import copy
+import dataclasses
+import json
 from functools import partial
+from hashlib import sha1
+from unittest import mock
 
 import pytest
 import requests
 
+from tests.conftest import mock_post, mock_response
 from ytmusicapi import YTMusic
+from ytmusicapi.cache import request_key
+from ytmusicapi.constants import YTM_DOMAIN
 from ytmusicapi.exceptions import YTMusicUserError
 
 
@@ -26,3 +35,172 @@ def test_ytmusic_session():
     ytmusic = YTMusic()
     assert isinstance(ytmusic._session, requests.Session)
     assert ytmusic._session != test_session
+
+
+async def delayed_response(*args, **kwargs):
+    await asyncio.sleep(0.01)
+    return mock_response({"contents": {}})
+
+
+def test_ytmusic_coalesce_requests(offline_yt, sample_album):
+    yt = offline_yt(coalesce_requests=True)
+
+    async def send():
+        return await asyncio.gather(
+            *(yt._send_request("browse", {"browseId": sample_album}) for _ in range(10)),
+            yt._send_request("browse", {"browseId": "MPREb_other"}),
+        )
+
+    responses, post = mock_post(yt, delayed_response, send)
+    assert not yt._inflight
+    assert post.await_count == 2
+    assert all(response is responses[0] for response in responses[:10])
+
+
+def test_ytmusic_construction_without_io():
+    with (
+        mock.patch("aiohttp.ClientSession._request") as request,
+        mock.patch("ytmusicapi.parsers.i18n.get_language_tables") as get_language_tables,
+    ):
+        yt = YTMusic(
+            auth={
+                "cookie": "__Secure-3PAPISID=abc",
+                "authorization": "SAPISIDHASH 1_a",
+                "x-origin": YTM_DOMAIN,
+            },
+            language="de",
+        )
+        assert "SAPISIDHASH" in yt.headers["authorization"]
+        assert yt.headers["cookie"] == "__Secure-3PAPISID=abc"
+    request.assert_not_called()
+    get_language_tables.assert_not_called()
+    assert yt._client_session is None
+    assert yt.sapisid == "abc"
+
+
+async def iter_chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def html_response(html: bytes, chunk_size: int = 100) -> mock.Mock:
+    response = mock.Mock()
+    response.content.iter_chunked = lambda _: iter_chunks(
+        *(html[i : i + chunk_size] for i in range(0, len(html), chunk_size))
+    )
+    return response
+
+
+def test_ytmusic_visitor_id():
+    html = b'<head><script>ytcfg.set({"VISITOR_DATA": "Cgt2aXNpdG9y"});</script></head>'
+
+    async def run():
+        yt = YTMusic()
+        response = html_response(html)
+        with mock.patch.object(yt, "_send_get_request", mock.AsyncMock(return_value=response)) as get:
+            await asyncio.gather(*(yt._ensure_visitor_id() for _ in range(5)))
+        assert get.await_count == 1
+        assert yt.headers["X-Goog-Visitor-Id"] == yt.visitor_id == "Cgt2aXNpdG9y"
+        response.close.assert_called_once()
+
+        provided = YTMusic(visitor_id=yt.visitor_id)
+        with mock.patch.object(provided, "_send_get_request", mock.AsyncMock()) as get:
+            await provided._ensure_visitor_id()
+        get.assert_not_awaited()
+        assert provided.headers["X-Goog-Visitor-Id"] == "Cgt2aXNpdG9y"
+
+    asyncio.run(run())
+
+
+def test_ytmusic_request_headers():
+    yt = YTMusic(
+        auth={"cookie": "__Secure-3PAPISID=abc", "authorization": "SAPISIDHASH 1_a", "x-origin": YTM_DOMAIN}
+    )
+    with (
+        mock.patch("time.time", return_value=1700000000.5),
+        mock.patch("ytmusicapi.helpers.sha1", wraps=sha1) as sha1_mock,
+    ):
+        headers = [yt._request_headers() for _ in range(10)]
+    # the hash only changes once per second
+    sha1_mock.assert_called_once()
+    assert headers[0]["authorization"].startswith("SAPISIDHASH 1700000000_")
+    assert all(h == headers[0] and h is not headers[0] for h in headers[1:])
+
+    template = yt._header_template
+    assert yt._header_template is template
+    with pytest.raises(TypeError):
+        template["cookie"] = "changed"  # type: ignore[index]
+    assert "x-goog-visitor-id" not in template
+    yt._visitor_id = "Cgt2aXNpdG9y"
+    assert yt._header_template["x-goog-visitor-id"] == "Cgt2aXNpdG9y"
+    assert yt.headers["X-Goog-Visitor-Id"] == "Cgt2aXNpdG9y"
+
+
+def test_ytmusic_client_context(offline_yt):
+    yt = offline_yt(location="GB")
+    context = copy.deepcopy(yt.context)
+
+    async def mobile(browse_id):
+        with yt.as_mobile():
+            await yt._send_request("browse", {"browseId": browse_id})
+
+    async def nested(browse_id):
+        with yt.client_context(location="DE", user="123"), yt.client_context(language="de"):
+            await yt._send_request("browse", {"browseId": browse_id})
+
+    async def send():
+        await asyncio.gather(
+            mobile("mobile"), yt._send_request("browse", {"browseId": "web"}), nested("nested")
+        )
+
+    _, post = mock_post(yt, delayed_response, send)
+    assert yt.context == context
+    contexts = {
+        body["browseId"]: body["context"]
+        for body in (json.loads(call.kwargs["data"]) for call in post.call_args_list)
+    }
+    assert contexts["mobile"]["client"]["clientName"] == "ANDROID_MUSIC"
+    assert contexts["mobile"]["client"]["gl"] == "GB"
+    assert contexts["web"]["client"]["clientName"] == "WEB_REMIX"
+    assert contexts["nested"]["client"] | {"gl": "DE", "hl": "de"} == contexts["nested"]["client"]
+    assert contexts["nested"]["user"] == {"onBehalfOfUser": "123"}
+    assert contexts["web"]["user"] == {}
+
+    with pytest.raises(YTMusicUserError, match="Location"), YTMusic().client_context(location="XX"):
+        pass
+
+
+def test_ytmusic_request_body(offline_yt):
+    yt = offline_yt()
+    context = copy.deepcopy(yt.context)
+    body = {"browseId": "VLPL"}
+    dumps = mock.Mock(wraps=yt.json_backend.dumps)
+    yt.json_backend = dataclasses.replace(yt.json_backend, dumps=dumps)
+
+    async def send():
+        # a continuation loop sends the same body for every page
+        for _ in range(3):
+            await yt._send_request("browse", body, "&ctoken=abc")
+        with yt.as_mobile():
+            await yt._send_request("browse", body)
+        yt.context["context"]["client"]["gl"] = "DE"
+        await yt._send_request("browse", body)
+        await yt._send_request("browse", {})
+
+    _, post = mock_post(yt, mock_response(), send)
+    assert body == {"browseId": "VLPL"}
+    # the context is encoded once, and again after it was overridden or changed
+    assert dumps.call_count == 6 + 3
+    sent = [json.loads(call.kwargs["data"]) for call in post.call_args_list]
+    assert sent[0] == sent[1] == sent[2] == {"browseId": "VLPL", **context}
+    assert sent[3]["context"]["client"]["clientName"] == "ANDROID_MUSIC"
+    assert sent[4]["context"]["client"]["gl"] == "DE"
+    assert sent[5] == {"context": sent[4]["context"]}
+
+
+def test_ytmusic_request_key():
+    yt = YTMusic(location="GB")
+    key = request_key("browse", {"browseId": "VLPL"}, "", yt._serialized_context().key)
+    with yt.client_context(location="DE"):
+        assert key != request_key("browse", {"browseId": "VLPL"}, "", yt._serialized_context().key)
+    assert key == request_key("browse", {"browseId": "VLPL"}, "", yt._serialized_context().key)
@@ -1,6 +1,8 @@
 from importlib.metadata import PackageNotFoundError, version
 
 from ytmusicapi.auth.oauth.credentials import OAuthCredentials
+from ytmusicapi.cache import ResponseCache
+from ytmusicapi.continuations import ContinuationCursor
 from ytmusicapi.models.content.enums import LikeStatus
 from ytmusicapi.setup import setup, setup_oauth
 from ytmusicapi.ytmusic import YTMusic
@@ -14,4 +16,12 @@ except PackageNotFoundError:
 __copyright__ = "Copyright 2024 sigma67"
 __license__ = "MIT"
 __title__ = "ytmusicapi"
-__all__ = ["LikeStatus", "OAuthCredentials", "YTMusic", "setup", "setup_oauth"]
+__all__ = [
+    "ContinuationCursor",
+    "LikeStatus",
+    "OAuthCredentials",
+    "ResponseCache",
+    "YTMusic",
+    "setup",
+    "setup_oauth",
+]
@@ -70,9 +70,15 @@ class OAuthCredentials(Credentials):
         self.client_id = client_id
         self.client_secret = client_secret
 
-        self._session = session if session else ClientSession()  # for auth requests
-        if proxies:
-            self._session.proxies.update(proxies)
+        # for auth requests, created on first use inside the event loop
+        self._client_session = session
+        self.proxies = proxies
+
+    @property
+    def _session(self) -> ClientSession:
+        if self._client_session is None:
+            self._client_session = ClientSession()
+        return self._client_session
 
     async def get_code(self) -> AuthCodeDict:
         """Method for obtaining a new user auth code. First step of token creation."""
@@ -83,7 +89,12 @@ class OAuthCredentials(Credentials):
         """Method for sending post requests with required client_id and User-Agent modifications"""
 
         data.update({"client_id": self.client_id})
-        response = await self._session.post(url, data=data, headers={"User-Agent": OAUTH_USER_AGENT})
+        response = await self._session.post(
+            url,
+            data=data,
+            headers={"User-Agent": OAUTH_USER_AGENT},
+            proxy=self.proxies.get("https") if self.proxies else None,
+        )
         if response.status == 401:
             data = await response.json()
             issue = data.get("error")
@@ -1,15 +1,26 @@
+import asyncio
+import contextlib
+import inspect
 import json
 import time
 import webbrowser
 from collections.abc import KeysView
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.auth.oauth.credentials import Credentials, OAuthCredentials
 from ytmusicapi.auth.oauth.models import BaseTokenDict, Bearer, DefaultScope, RefreshableTokenDict
+from ytmusicapi.filelock import FileLock, atomic_write
+from ytmusicapi.json_backend import JsonBackend, get_json_backend
+
+#: seconds before expiration at which tokens are renewed in the background,
+#: well ahead of ``is_expiring``, so requests do not wait for a refresh
+RENEW_MARGIN = 300
+
+#: seconds until a failed background renewal is retried, and minimum seconds between renewals
+RENEW_RETRY_DELAY = 10
 
 
 @dataclass(kw_only=True)
@@ -69,10 +80,10 @@ class OAuthToken(Token):
         return self.expires_at - int(time.time()) < 60
 
     @classmethod
-    def from_json(cls, file_path: Path) -> "OAuthToken":
+    def from_json(cls, file_path: Path, json_backend: JsonBackend | None = None) -> "OAuthToken":
+        """:param json_backend: JSON library to decode the file. Default: see :py:func:`get_json_backend`"""
         if file_path.is_file():
-            with open(file_path) as json_file:
-                file_pack = json.load(json_file)
+            file_pack = (json_backend or get_json_backend()).loads(file_path.read_bytes())
 
         return cls(**file_pack)
 
@@ -80,9 +91,14 @@ class OAuthToken(Token):
 @dataclass
 class RefreshingToken(OAuthToken):
     """
-    Compositional implementation of Token that automatically refreshes
+    Compositional implementation of Token that refreshes
     an underlying OAuthToken when required (credential expiration <= 1 min)
-    upon access_token attribute access.
+    with :py:meth:`ensure_fresh`. :py:meth:`start_renewal` renews it in the background before it expires.
+    Concurrent refreshes share a single request.
+
+    Processes sharing the ``local_cache`` file refresh the token once per expiry:
+    the refresh holds a lock on ``<local_cache>.lock``, and a token refreshed by another
+    process is read from the file instead of being refreshed again.
     """
 
     #: credentials used for access_token refreshing
@@ -91,14 +107,104 @@ class RefreshingToken(OAuthToken):
     #: protected/property attribute enables auto writing token values to new file location via setter
     _local_cache: Path | None = None
 
-    def __getattribute__(self, item: str) -> Any:
-        """access token setter to auto-refresh if it is expiring"""
-        if item == "access_token" and self.is_expiring:
-            fresh = self.credentials.refresh_token(self.refresh_token)
-            self.update(fresh)
-            self.store_token()
+    #: JSON library used to store the token
+    json_backend: JsonBackend = field(default_factory=get_json_backend, repr=False, compare=False)
+
+    #: refresh in flight, shared by concurrent callers
+    _refresh_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False, compare=False)
+
+    #: background renewal, see :py:meth:`start_renewal`
+    _renew_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False, compare=False)
+
+    async def ensure_fresh(self) -> None:
+        """Refreshes the access token if it is expiring"""
+        if self.is_expiring:
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Refreshes the access token. Concurrent calls wait for the same refresh."""
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._refresh_task = asyncio.ensure_future(self._refresh())
+        # shield the shared refresh, so a cancelled caller does not cancel it for the others
+        await asyncio.shield(task)
+
+    async def _refresh(self) -> None:
+        if self.local_cache is None:
+            await self._request_refresh()
+            return
+        expires_at = self.expires_at
+        # refreshed by another process since this process read the token
+        if self.reload() and self.expires_at > expires_at:
+            return
+        lock = FileLock(self.local_cache.with_name(self.local_cache.name + ".lock"))
+        await lock.wait()
+        try:
+            # refreshed by the process holding the lock before
+            if not (self.reload() and self.expires_at > expires_at):
+                await self._request_refresh()
+        finally:
+            lock.release()
+
+    async def _request_refresh(self) -> None:
+        fresh = self.credentials.refresh_token(self.refresh_token)
+        # OAuthCredentials is asynchronous, custom credentials may not be
+        if inspect.isawaitable(fresh):
+            fresh = await fresh
+        self.update(fresh)
+        self.store_token()
 
-        return super().__getattribute__(item)
+    def reload(self) -> bool:
+        """
+        Reads the token from ``local_cache`` if it was refreshed by another process,
+        i.e. if it expires later than this token.
+
+        :return: True if the token was updated
+        """
+        if self.local_cache is None:
+            return False
+        try:
+            stored = self.json_backend.loads(self.local_cache.read_bytes())
+            if int(stored["expires_at"]) <= self.expires_at:
+                return False
+            self.access_token = stored["access_token"]
+            self.refresh_token = stored.get("refresh_token", self.refresh_token)
+            self.expires_at = int(stored["expires_at"])
+        except (OSError, KeyError, TypeError, ValueError, self.json_backend.decode_error):
+            return False
+        return True
+
+    def start_renewal(self) -> None:
+        """
+        Starts renewing the access token in the background, ``RENEW_MARGIN`` seconds before it expires.
+        Tokens valid for less than ``RENEW_MARGIN`` seconds are renewed halfway through their lifetime.
+        The renewal stops if it fails after the token expired, the next :py:meth:`ensure_fresh` refreshes it.
+        Does nothing if the renewal is already running in the current event loop.
+        """
+        task = self._renew_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._renew_task = asyncio.ensure_future(self._renew())
+
+    def stop_renewal(self) -> None:
+        """Stops the background renewal"""
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            self._renew_task = None
+
+    async def _renew(self) -> None:
+        delay = self.expires_at - RENEW_MARGIN - time.time()
+        while True:
+            await asyncio.sleep(max(delay, 0))
+            refreshed = False
+            # on failure, the token is refreshed again by the next request, which raises the error
+            with contextlib.suppress(Exception):
+                await self.refresh()
+                refreshed = True
+            if not refreshed and self.is_expiring:
+                return
+            remaining = self.expires_at - time.time()
+            # short-lived tokens would be within the margin again right away
+            delay = max(remaining - RENEW_MARGIN, remaining / 2 if refreshed else 0, RENEW_RETRY_DELAY)
 
     @property
     def local_cache(self) -> Path | None:
@@ -137,11 +243,11 @@ class RefreshingToken(OAuthToken):
     def store_token(self, path: str | None = None) -> None:
         """
         Write token values to json file at specified path, defaulting to self.local_cache.
+        The file is replaced atomically, so other processes never read a partially written token.
         Operation does not update instance local_cache attribute.
         Automatically called when local_cache is set post init.
         """
         file_path = path if path else self.local_cache
 
         if file_path:
-            with open(file_path, encoding="utf8", mode="w") as file:
-                json.dump(self.as_dict(), file, indent=True)
+            atomic_write(file_path, self.json_backend.dumps_indented(self.as_dict()))
@@ -0,0 +1,92 @@
+"""bounded-concurrency batch requests"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Sequence
+from typing import Any, Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class BulkRequest(Generic[T]):
+    """
+    A batch of requests, one per id, run concurrently with bounded concurrency.
+
+    Await it to get the results in input order,
+    or iterate over it to get ``(index, result)`` tuples in completion order.
+    A failed item is returned as the exception its request or parser raised, the remaining items are not affected.
+    Only exceptions that are not an ``Exception``, i.e. ``KeyboardInterrupt``, cancel the remaining items.
+
+    Example::
+
+        albums = await yt.get_albums(browseIds)
+        for browseId, album in zip(browseIds, albums):
+            if isinstance(album, Exception):
+                ...
+
+        async for index, album in yt.get_albums(browseIds):
+            ...
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[T]],
+        ids: Sequence[str],
+        semaphore: asyncio.Semaphore,
+        concurrency: int,
+    ):
+        """
+        :param fetch: coroutine function fetching a single item by its id
+        :param ids: ids of the items to fetch
+        :param semaphore: semaphore shared by all batches of a session
+        :param concurrency: maximum number of concurrent requests of this batch
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.fetch = fetch
+        self.ids = list(ids)
+        self.semaphore = semaphore
+        self.concurrency = concurrency
+
+    def __await__(self) -> Generator[Any, None, list[T | Exception]]:
+        return self._gather().__await__()
+
+    def __aiter__(self) -> AsyncIterator[tuple[int, T | Exception]]:
+        return self._iterate()
+
+    async def _gather(self) -> list[T | Exception]:
+        results: list[T | Exception] = [None] * len(self.ids)  # type: ignore[list-item]
+        async for index, result in self._iterate():
+            results[index] = result
+        return results
+
+    async def _iterate(self) -> AsyncIterator[tuple[int, T | Exception]]:
+        done: asyncio.Queue[tuple[int, T | Exception]] = asyncio.Queue()
+        pending = iter(enumerate(self.ids))
+
+        async def worker() -> None:
+            # workers share the iterator, so each id is fetched exactly once
+            for index, item_id in pending:
+                async with self.semaphore:
+                    try:
+                        result: T | Exception = await self.fetch(item_id)
+                    except Exception as e:  # noqa: BLE001 - any error of an item is its result
+                        result = e
+                done.put_nowait((index, result))
+
+        def stop_on_error(task: asyncio.Future[None]) -> None:
+            # a BaseException ends the worker, the batch raises it instead of waiting for its items
+            if not task.cancelled() and (error := task.exception()) is not None:
+                done.put_nowait((-1, cast(Exception, error)))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(self.ids)))]
+        for task in workers:
+            task.add_done_callback(stop_on_error)
+        try:
+            for _ in range(len(self.ids)):
+                index, result = await done.get()
+                if index < 0:
+                    raise cast(Exception, result)
+                yield index, result
+        finally:
+            for task in workers:
+                task.cancel()
@@ -0,0 +1,349 @@
+"""response cache for innertube requests"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ytmusicapi.json_backend import JsonBackendName, get_json_backend
+from ytmusicapi.offload import run_offloaded
+from ytmusicapi.type_alias import JsonDict
+
+T = TypeVar("T")
+
+#: Default time-to-live in seconds per endpoint.
+#: A key of the form ``endpoint:prefix`` applies to requests whose ``browseId`` starts with ``prefix``,
+#: the longest matching prefix wins. Endpoints that are not listed are never cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "browse": 300,
+    "browse:MPREb_": 86400,  # albums
+    "browse:MPLA": 3600,  # artists
+    "browse:UC": 3600,  # artists and channels
+    "browse:FEmusic_": 0,  # library, history, home - personalized or frequently changing
+    "next": 60,
+    "player": 60,
+    "search": 600,
+    "music/get_search_suggestions": 600,
+}
+
+#: maximum number of keys :py:class:`ResponseCache` tracks for invalidation, if the backend has no ``maxsize``
+MAX_TRACKED_KEYS = 10000
+
+
+def request_key(
+    endpoint: str, body: JsonDict, additional_params: str = "", context: str = "", identity: str = ""
+) -> str:
+    """
+    Returns a key identifying a request. The key includes the client context and the account,
+    so different languages, locations, clients and accounts result in different keys.
+
+    :param context: the serialized client context, if it is not part of ``body``
+    :param identity: fingerprint of the account of an authenticated request, empty without authentication
+    """
+    # the standard library, so keys of persistent caches do not depend on the installed JSON backend
+    serialized = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(
+        (endpoint + "?" + additional_params + serialized + context + "#" + identity).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a :py:class:`ResponseCache`"""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(ABC):
+    """Base class for cache storage. Values are serialized responses."""
+
+    #: True if operations perform blocking I/O, :py:class:`ResponseCache` then runs them
+    #: in the default executor of the event loop
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Returns the value stored for key or None if it is absent or expired"""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Stores value for key for ttl seconds"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the entry of key, if there is one"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory LRU cache with per-entry expiration"""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :param maxsize: Maximum number of entries. The least recently used entry is evicted first.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    On-disk cache storing one file per entry. Recency is tracked by file modification time,
+    so the cache can be shared by several processes.
+    """
+
+    blocking = True
+
+    def __init__(self, directory: str | Path, maxsize: int = 10000):
+        """
+        :param directory: Directory to store entries in. Created if it does not exist.
+        :param maxsize: Maximum number of entries. The least recently used entries are evicted first.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self._size: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + ".json")
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf8") as file:
+                expires_at = float(file.readline())
+                value = file.read()
+        except (OSError, ValueError):
+            return None
+        if expires_at <= time.time():
+            self._remove(path)
+            return None
+        os.utime(path)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Stores value for key for ttl seconds. A failed write is dropped, the entry is then missing."""
+        path = self._path(key)
+        is_new = not path.exists()
+        tmp_path = None
+        try:
+            # unique per write, concurrent writes of the same key by several threads or processes do not collide
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with open(fd, encoding="utf8", mode="w") as file:
+                file.write(f"{time.time() + ttl}\n")
+                file.write(value)
+            tmp_path.replace(path)
+        except OSError:
+            if tmp_path is not None:
+                self._remove(tmp_path)
+            return
+        if is_new:
+            self._size = self._count() if self._size is None else self._size + 1
+            if self._size > self.maxsize:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            self._remove(path)
+        self._size = 0
+
+    def _count(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def _evict(self) -> None:
+        """remove the least recently used entries, down to 90% of maxsize"""
+        paths = []
+        for path in self.directory.glob("*.json"):
+            try:
+                paths.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        paths.sort()
+        excess = len(paths) - int(self.maxsize * 0.9)
+        for _, path in paths[: max(excess, 0)]:
+            self._remove(path)
+        self._size = len(paths) - max(excess, 0)
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class ResponseCache:
+    """
+    Cache for decoded innertube responses, with per-endpoint time-to-live.
+    Operations of blocking backends like :py:class:`DiskCacheBackend` run in the default executor of the event loop.
+
+    Example::
+
+        from ytmusicapi import YTMusic, ResponseCache
+        from ytmusicapi.cache import DiskCacheBackend
+
+        yt = YTMusic(cache=ResponseCache())  # in-memory
+        yt = YTMusic(cache=ResponseCache(DiskCacheBackend("/tmp/ytmusicapi")))
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+        json_backend: JsonBackendName = "auto",
+    ):
+        """
+        :param backend: Storage for cached responses. Default: :py:class:`MemoryCacheBackend`
+        :param ttls: Time-to-live in seconds per endpoint, see :py:data:`DEFAULT_TTLS` for the format.
+            Endpoints not contained are not cached. Default: :py:data:`DEFAULT_TTLS`
+        :param json_backend: JSON library serializing the responses,
+            see :py:func:`ytmusicapi.json_backend.get_json_backend`. Default: ``auto``
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.json_backend = get_json_backend(json_backend)
+        self.stats = CacheStats()
+        #: keys of the entries stored by this cache per ``browseId``, see :py:meth:`invalidate`
+        self._browse_keys: dict[str, set[str]] = {}
+        #: ``browseId`` per tracked key, oldest first, so the index is pruned with the entries
+        self._key_browse_ids: OrderedDict[str, str] = OrderedDict()
+        #: maximum number of tracked keys, older keys are evicted from the backend as well
+        self._max_tracked = getattr(self.backend, "maxsize", MAX_TRACKED_KEYS)
+
+    def ttl(self, endpoint: str, body: JsonDict) -> float:
+        """
+        Returns the time-to-live for a request, 0 if it must not be cached.
+
+        :param endpoint: innertube endpoint, i.e. ``browse``
+        :param body: request body
+        """
+        if "formData" in body:  # browse requests that modify the account, i.e. set_tasteprofile
+            return 0
+        # continuation pages have no browseId, so invalidate could not remove them with their first page
+        if "continuation" in body:
+            return 0
+        ttl = self.ttls.get(endpoint, 0)
+        browse_id = body.get("browseId")
+        if isinstance(browse_id, str):
+            matched = 0
+            for rule, rule_ttl in self.ttls.items():
+                rule_endpoint, _, prefix = rule.partition(":")
+                if (
+                    prefix
+                    and rule_endpoint == endpoint
+                    and len(prefix) > matched
+                    and browse_id.startswith(prefix)
+                ):
+                    ttl, matched = rule_ttl, len(prefix)
+        return ttl
+
+    key = staticmethod(request_key)
+
+    async def get(self, key: str) -> JsonDict | None:
+        value = await self._run(self.backend.get, key)
+        if value is None:
+            self.stats.misses += 1
+            self._untrack(key)
+            return None
+        self.stats.hits += 1
+        if key in self._key_browse_ids:
+            # same recency as the LRU order of the backend
+            self._key_browse_ids.move_to_end(key)
+        response: JsonDict = self.json_backend.loads(value)
+        return response
+
+    async def set(self, key: str, response: JsonDict, ttl: float, browse_id: str | None = None) -> None:
+        """
+        :param browse_id: ``browseId`` of the request, whose entries :py:meth:`invalidate` removes
+        """
+        await self._run(self.backend.set, key, self.json_backend.dumps(response).decode("utf-8"), ttl)
+        if browse_id is not None:
+            self._track(key, browse_id)
+
+    async def invalidate(self, browse_ids: Iterable[str]) -> None:
+        """
+        Removes the entries stored for requests of the browse ids, i.e. of a playlist after it was edited.
+        Entries stored by other processes sharing a :py:class:`DiskCacheBackend` expire with their time-to-live.
+        """
+        keys = [key for browse_id in browse_ids for key in self._browse_keys.pop(browse_id, ())]
+        for key in keys:
+            self._key_browse_ids.pop(key, None)
+        if keys:
+            await self._run(self._delete, keys)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self._browse_keys.clear()
+        self._key_browse_ids.clear()
+
+    def _track(self, key: str, browse_id: str) -> None:
+        self._untrack(key)
+        self._browse_keys.setdefault(browse_id, set()).add(key)
+        self._key_browse_ids[key] = browse_id
+        while len(self._key_browse_ids) > self._max_tracked:
+            self._untrack(next(iter(self._key_browse_ids)))
+
+    def _untrack(self, key: str) -> None:
+        """removes key from the invalidation index, i.e. after it expired or was evicted"""
+        browse_id = self._key_browse_ids.pop(key, None)
+        if browse_id is None:
+            return
+        keys = self._browse_keys[browse_id]
+        keys.discard(key)
+        if not keys:
+            del self._browse_keys[browse_id]
+
+    def _delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self.backend.delete(key)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """runs a backend operation, in the default executor if it blocks the event loop"""
+        if self.backend.blocking:
+            return await run_offloaded(None, func, *args)
+        return func(*args)
@@ -0,0 +1,75 @@
+"""compression of request bodies, negotiation of compressed responses and byte counters"""
+
+import gzip
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+#: default size in bytes from which request bodies are compressed.
+#: Smaller bodies, like most ``browse`` requests, do not benefit from the gzip overhead of about 20 bytes
+COMPRESS_THRESHOLD = 1024
+
+#: gzip level of request bodies, a trade-off of speed and size for JSON of a few kilobytes
+COMPRESS_LEVEL = 6
+
+
+def accept_encoding() -> str:
+    """Returns the ``accept-encoding`` header with the codecs aiohttp can decode in this environment"""
+    try:
+        from aiohttp import compression_utils
+    except ImportError:  # aiohttp < 3.9
+        return "gzip, deflate"
+    encodings = ["gzip", "deflate"]
+    if getattr(compression_utils, "HAS_BROTLI", False):
+        encodings.append("br")
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+def compress_body(body: bytes, threshold: int | None = COMPRESS_THRESHOLD) -> tuple[bytes, str | None]:
+    """
+    Compresses a request body with gzip if it has at least ``threshold`` bytes.
+
+    :param threshold: minimum size in bytes, None to never compress
+    :return: the body to send and the value of the ``content-encoding`` header, None if uncompressed
+    """
+    if threshold is None or len(body) < threshold:
+        return body, None
+    return gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0), "gzip"
+
+
+@dataclass
+class TransferStats:
+    """
+    Byte counters of the innertube requests of a :py:class:`ytmusicapi.YTMusic` instance.
+
+    Compressed response sizes are taken from the ``Content-Length`` header.
+    Responses without it count with their decoded size, so the savings are a lower bound.
+    """
+
+    requests: int = 0
+    #: request bodies before compression
+    request_bytes: int = 0
+    #: request bodies as sent
+    request_bytes_sent: int = 0
+    #: decoded response bodies
+    response_bytes: int = 0
+    #: response bodies as received
+    response_bytes_received: int = 0
+
+    def record_request(self, size: int, sent: int) -> None:
+        self.requests += 1
+        self.request_bytes += size
+        self.request_bytes_sent += sent
+
+    def record_response(self, size: int, headers: Mapping[str, str]) -> None:
+        self.response_bytes += size
+        length = headers.get("Content-Length")
+        self.response_bytes_received += int(length) if length and length.isdigit() else size
+
+    @property
+    def saved_bytes(self) -> int:
+        """bytes not transferred thanks to compression"""
+        return (
+            self.request_bytes - self.request_bytes_sent + self.response_bytes - self.response_bytes_received
+        )
@@ -0,0 +1,73 @@
+"""per-call overrides of the client context, scoped to the current task with contextvars"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from ytmusicapi.type_alias import JsonDict
+
+#: client of the Android app, which returns lyrics with timestamps
+MOBILE_CLIENT = {"clientName": "ANDROID_MUSIC", "clientVersion": "7.21.50"}
+
+
+@dataclass(frozen=True)
+class ContextOverrides:
+    """Fields replacing those of the ``client`` and ``user`` objects of the context of an instance"""
+
+    client: Mapping[str, str] = field(default_factory=dict)
+    user: Mapping[str, str] = field(default_factory=dict)
+
+    def merge(self, inner: "ContextOverrides") -> "ContextOverrides":
+        """Returns these overrides updated with those of a nested :py:meth:`ytmusicapi.YTMusic.client_context`"""
+        return ContextOverrides({**self.client, **inner.client}, {**self.user, **inner.user})
+
+    def apply(self, context: JsonDict) -> JsonDict:
+        """Returns a copy of ``context`` with the overridden fields, ``context`` is not modified"""
+        inner = context["context"]
+        return {
+            **context,
+            "context": {
+                **inner,
+                "client": {**inner["client"], **self.client},
+                "user": {**inner["user"], **self.user},
+            },
+        }
+
+
+@dataclass(frozen=True)
+class SerializedContext:
+    """A context serialized once for all requests using it"""
+
+    #: copy of the serialized context
+    context: JsonDict
+    #: encoded members of the context after a comma, followed by the closing brace of the body
+    suffix: bytes
+    #: the context serialized with sorted keys by the standard library, part of cache keys
+    key: str
+
+
+#: overrides of the current task per instance, keyed by ``id`` of the instance.
+#: Tasks created inside :py:meth:`ytmusicapi.YTMusic.client_context` inherit them.
+_overrides: ContextVar[Mapping[int, ContextOverrides]] = ContextVar(
+    "ytmusicapi_context_overrides", default=MappingProxyType({})
+)
+
+
+def get_overrides(owner: object) -> ContextOverrides | None:
+    """Returns the overrides of ``owner`` in the current task, None if there are none"""
+    return _overrides.get().get(id(owner))
+
+
+@contextmanager
+def override(owner: object, overrides: ContextOverrides) -> Iterator[None]:
+    """Applies ``overrides`` to the requests of ``owner`` in the current task until the block exits"""
+    current = _overrides.get()
+    if (outer := current.get(id(owner))) is not None:
+        overrides = outer.merge(overrides)
+    token = _overrides.set(MappingProxyType({**current, id(owner): overrides}))
+    try:
+        yield
+    finally:
+        _overrides.reset(token)
@@ -1,10 +1,19 @@
-from collections.abc import Callable
+import asyncio
+import base64
+import binascii
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field, replace
 from typing import Any
 
+from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.navigation import nav
 from ytmusicapi.type_alias import (
+    FieldsType,
     JsonDict,
     JsonList,
+    OutputType,
     ParseFuncDictType,
     ParseFuncType,
     RequestFuncBodyType,
@@ -13,33 +22,190 @@ from ytmusicapi.type_alias import (
 
 CONTINUATION_TOKEN = ["continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"]
 CONTINUATION_ITEMS = ["onResponseReceivedActions", 0, "appendContinuationItemsAction", "continuationItems"]
+#: continuation type of cursors for the 2025 continuation format
+CONTINUATION_2025 = "appendContinuationItemsAction"
+
+
+@dataclass(frozen=True)
+class ContinuationCursor:
+    """
+    Opaque position in a paginated result, returned as ``cursor`` attribute of the result list.
+    Pass it to :py:func:`YTMusic.resume` to retrieve the items after that position.
+    Use :py:meth:`dumps` and :py:meth:`loads` to store it, i.e. as a checkpoint of a crawl.
+
+    Example::
+
+        songs = await yt.get_library_songs(limit=1000)
+        checkpoint = songs.cursor.dumps()
+        ...
+        more_songs = await yt.resume(ContinuationCursor.loads(checkpoint), limit=1000)
+    """
+
+    #: the kind of items, determines how the continuations are parsed
+    kind: str
+    endpoint: str
+    #: the request body without client context
+    body: JsonDict = field(hash=False)
+    continuation_type: str
+    token: str
+    ctoken_path: str = ""
+    #: additional parse parameters of the kind
+    params: JsonDict = field(default_factory=dict, hash=False)
+
+    def dumps(self) -> str:
+        """Serializes the cursor to a url-safe string"""
+        serialized = json.dumps(asdict(self), separators=(",", ":"))
+        return base64.urlsafe_b64encode(serialized.encode("utf-8")).decode("ascii")
+
+    @classmethod
+    def loads(cls, value: str) -> "ContinuationCursor":
+        """Restores a cursor serialized with :py:meth:`dumps`"""
+        try:
+            return cls(**json.loads(base64.urlsafe_b64decode(value.encode("ascii"))))
+        except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+            raise YTMusicUserError("Invalid continuation cursor") from e
+
+    def with_token(self, token: str) -> "ContinuationCursor":
+        return replace(self, token=token)
+
+    @property
+    def fields(self) -> FieldsType:
+        """the fields of the items requested by the original call, None for all fields"""
+        fields = self.params.get("fields")
+        return None if fields is None else frozenset(fields)
+
+    @property
+    def output(self) -> OutputType:
+        """the result format requested by the original call"""
+        return self.params.get("output", "dicts")  # type: ignore[no-any-return]
+
+    def initial_results(self) -> JsonDict:
+        """results in the format of the original response, which continue at this cursor"""
+        if self.continuation_type == CONTINUATION_2025:
+            return {
+                "contents": [
+                    {
+                        CONTINUATION_TOKEN[0]: {
+                            CONTINUATION_TOKEN[1]: {CONTINUATION_TOKEN[2]: {"token": self.token}}
+                        }
+                    }
+                ]
+            }
+        return {
+            "continuations": [{"next" + self.ctoken_path + "ContinuationData": {"continuation": self.token}}]
+        }
+
+
+class CursorList(list[Any]):
+    """
+    List of parsed items with the ``cursor`` to resume after the last item.
+    The cursor is None if there are no further items.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), cursor: ContinuationCursor | None = None):
+        super().__init__(items)
+        self.cursor = cursor
+
+    def extend_continuation(self, continuation: list[Any]) -> None:
+        """appends the items of a continuation and moves the cursor past them"""
+        self.extend(continuation)
+        if isinstance(continuation, CursorList):
+            self.cursor = continuation.cursor
+
+
+def get_continuation_cursor(
+    results: JsonDict,
+    kind: str,
+    endpoint: str,
+    body: JsonDict,
+    continuation_type: str,
+    ctoken_path: str = "",
+    params: JsonDict | None = None,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+) -> ContinuationCursor | None:
+    """
+    Returns a cursor for the first continuation of results, None if there is no continuation
+
+    :param results: result list from request data
+    :param kind: the kind of items, see :py:func:`YTMusic.resume`
+    :param endpoint: endpoint of the original request
+    :param body: body of the original request
+    :param continuation_type: type of continuation, :py:data:`CONTINUATION_2025` for the 2025 format
+    :param fields: requested fields of the items, stored in the cursor params
+    :param output: requested result format, stored in the cursor params if not the default
+    """
+    if continuation_type == CONTINUATION_2025:
+        contents = results.get("contents")
+        token = get_continuation_token(contents) if contents else None
+    else:
+        token = get_continuation_ctoken(results, ctoken_path) if "continuations" in results else None
+    if token is None:
+        return None
+    body = {key: value for key, value in body.items() if key != "context"}
+    params = dict(params or {})
+    if fields is not None:
+        params["fields"] = sorted(fields)
+    if output != "dicts":
+        params["output"] = output
+    return ContinuationCursor(kind, endpoint, body, continuation_type, token, ctoken_path, params)
 
 
 def get_continuation_token(results: JsonList) -> str | None:
     return nav(results[-1], CONTINUATION_TOKEN, True)
 
 
-def get_continuations_2025(
+async def get_continuations_2025(
     results: JsonDict,
     limit: int | None,
     request_func: RequestFuncBodyType,
     parse_func: ParseFuncType,
-) -> JsonList:
-    items: JsonList = []
-    continuation_token = get_continuation_token(results["contents"])
-    while continuation_token and (limit is None or len(items) < limit):
-        response = request_func({"continuation": continuation_token})
-        continuation_items = nav(response, CONTINUATION_ITEMS, True)
-        if not continuation_items:
-            break
-
-        contents = parse_func(continuation_items)
-        if len(contents) == 0:
-            break
-        items.extend(contents)
-        continuation_token = get_continuation_token(continuation_items)
+    prefetch: bool = False,
+    cursor: ContinuationCursor | None = None,
+) -> CursorList:
+    pages = iter_continuations_2025(results, request_func, parse_func, prefetch, limit, cursor)
+    return await collect_continuations(pages, limit, cursor)
 
-    return items
+
+async def iter_continuations_2025(
+    results: JsonDict,
+    request_func: RequestFuncBodyType,
+    parse_func: ParseFuncType,
+    prefetch: bool = False,
+    limit: int | None = None,
+    cursor: ContinuationCursor | None = None,
+) -> AsyncGenerator[JsonList, None]:
+    """
+    Yields the parsed items of each continuation page of the 2025 response format.
+    See :py:func:`iter_continuations` for the parameters.
+    """
+    contents = results.get("contents")
+    continuation_token = get_continuation_token(contents) if contents else None
+    count = 0
+    next_response: asyncio.Future[JsonDict] | None = None
+    try:
+        while continuation_token and (limit is None or count < limit):
+            if next_response is None:
+                response = await request_func({"continuation": continuation_token})
+            else:
+                response, next_response = await next_response, None
+            continuation_items = nav(response, CONTINUATION_ITEMS, True)
+            if not continuation_items:
+                break
+
+            continuation_token = get_continuation_token(continuation_items)
+            if prefetch and continuation_token and (limit is None or count + len(continuation_items) < limit):
+                next_response = await _start_request(request_func({"continuation": continuation_token}))
+            page = parse_func(continuation_items)
+            if len(page) == 0:
+                break
+            count += len(page)
+            if cursor is not None:
+                page = CursorList(page, cursor.with_token(continuation_token) if continuation_token else None)
+            yield page
+    finally:
+        if next_response is not None:
+            _discard(next_response)
 
 
 async def get_reloadable_continuations(
@@ -64,7 +230,9 @@ async def get_continuations(
     parse_func: ParseFuncType,
     ctoken_path: str = "",
     additionalParams: str | None = None,
-) -> JsonList:
+    prefetch: bool = False,
+    cursor: ContinuationCursor | None = None,
+) -> CursorList:
     """
 
     :param results: result list from request data
@@ -77,24 +245,157 @@ async def get_continuations(
     :param ctoken_path: rarely used specifier applied to retrieve the ctoken ("next<ctoken_path>ContinuationData").
             Default empty string
     :param additionalParams: Optional additional params to pass to the request func. Default: use get_continuation_params
+    :param prefetch: request the next page while the current page is parsed. Default: False
+    :param cursor: cursor at the first continuation of results, see :py:func:`get_continuation_cursor`.
+            The returned list's cursor is advanced past the retrieved items. Default: no cursor
     :return: list of parsed continuation results
     """
-    items: JsonList = []
-    while "continuations" in results and (limit is None or len(items) < limit):
-        additional_params = additionalParams or get_continuation_params(results, ctoken_path)
-        response = await request_func(additional_params)
-        if "continuationContents" in response:
-            results = response["continuationContents"][continuation_type]
-        else:
-            break
-        contents = get_continuation_contents(results, parse_func)
-        if len(contents) == 0:
-            break
-        items.extend(contents)
+    pages = iter_continuations(
+        results,
+        continuation_type,
+        request_func,
+        parse_func,
+        ctoken_path,
+        additionalParams,
+        prefetch,
+        limit,
+        cursor,
+    )
+    return await collect_continuations(pages, limit, cursor)
+
+
+async def iter_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    request_func: RequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+    prefetch: bool = False,
+    limit: int | None = None,
+    cursor: ContinuationCursor | None = None,
+) -> AsyncGenerator[JsonList, None]:
+    """
+    Yields the parsed items of each continuation page, see :py:func:`get_continuations` for the parameters.
+    The next page is only requested when the previous page was consumed,
+    so only a single page is held in memory.
+
+    :param prefetch: Request the next page as soon as its token is known, before the current page
+        is parsed and consumed. A prefetched page that is not consumed is cancelled. Default: False
+    :param limit: No further pages are requested once limit items were yielded. Default: no limit
+    :param cursor: If set, pages are yielded as :py:class:`CursorList` with a cursor to the next page
+    """
+    count = 0
+    next_response: asyncio.Future[JsonDict] | None = None
+    try:
+        while "continuations" in results and (limit is None or count < limit):
+            if next_response is None:
+                response = await request_func(
+                    additionalParams or get_continuation_params(results, ctoken_path)
+                )
+            else:
+                response, next_response = await next_response, None
+            if "continuationContents" in response:
+                results = response["continuationContents"][continuation_type]
+            else:
+                break
+            if (
+                prefetch
+                and "continuations" in results
+                and (limit is None or count + _count_contents(results) < limit)
+            ):
+                next_params = additionalParams or get_continuation_params(results, ctoken_path)
+                next_response = await _start_request(request_func(next_params))
+            page = get_continuation_contents(results, parse_func)
+            if len(page) == 0:
+                break
+            count += len(page)
+            if cursor is not None:
+                next_token = (
+                    get_continuation_ctoken(results, ctoken_path) if "continuations" in results else None
+                )
+                page = CursorList(page, cursor.with_token(next_token) if next_token else None)
+            yield page
+    finally:
+        if next_response is not None:
+            _discard(next_response)
+
+
+async def _start_request(request: Awaitable[JsonDict]) -> asyncio.Future[JsonDict]:
+    """schedules a request and yields to the event loop once, so it is sent before parsing continues"""
+    future = asyncio.ensure_future(request)
+    await asyncio.sleep(0)
+    return future
+
+
+def _discard(future: asyncio.Future[JsonDict]) -> None:
+    """cancels an unused prefetched request, and retrieves its exception if it already failed"""
+    if not future.cancel() and not future.cancelled():
+        future.exception()
+
+
+def _count_contents(continuation: JsonDict) -> int:
+    """number of unparsed items of a continuation, an estimate of the number of parsed items"""
+    for term in ["contents", "items"]:
+        if term in continuation:
+            return len(continuation[term])
+
+    return 0
+
+
+async def collect_continuations(
+    pages: AsyncGenerator[JsonList, None], limit: int | None, cursor: ContinuationCursor | None = None
+) -> CursorList:
+    """
+    Collects continuation pages into a list until at least limit items were retrieved
+
+    :param pages: continuation pages, i.e. from :py:func:`iter_continuations`
+    :param limit: minimum number of items to retrieve. None to retrieve all pages
+    :param cursor: cursor before the first page, advanced with each page
+    """
+    items = CursorList(cursor=cursor)
+    if limit is not None and limit <= 0:
+        return items
+    async with aclosing(pages):
+        async for page in pages:
+            items.extend_continuation(page)
+            if limit is not None and len(items) >= limit:
+                break
 
     return items
 
 
+async def iter_items(
+    first_page: JsonList, pages: AsyncGenerator[JsonList, None] | None, limit: int | None = None
+) -> AsyncGenerator[JsonDict, None]:
+    """
+    Yields the items of the first page and of the continuation pages one by one.
+
+    :param first_page: items parsed from the initial response
+    :param pages: continuation pages, None if there are none
+    :param limit: maximum number of items to yield. None to yield all items
+    """
+    try:
+        if limit is not None and limit <= 0:
+            return
+        count = 0
+        for item in first_page:
+            yield item
+            count += 1
+            if count == limit:
+                return
+        if pages is not None:
+            async for page in pages:
+                for item in page:
+                    yield item
+                    count += 1
+                    if count == limit:
+                        return
+    finally:
+        if pages is not None:
+            await pages.aclose()
+
+
 async def get_validated_continuations(
     results: JsonDict,
     continuation_type: str,
@@ -129,8 +430,11 @@ def get_parsed_continuation_items(
 
 
 def get_continuation_params(results: JsonDict, ctoken_path: str = "") -> str:
-    ctoken = nav(results, ["continuations", 0, "next" + ctoken_path + "ContinuationData", "continuation"])
-    return get_continuation_string(ctoken)
+    return get_continuation_string(get_continuation_ctoken(results, ctoken_path))
+
+
+def get_continuation_ctoken(results: JsonDict, ctoken_path: str = "") -> str:
+    return nav(results, ["continuations", 0, "next" + ctoken_path + "ContinuationData", "continuation"])
 
 
 def get_reloadable_continuation_params(results: JsonDict) -> str:
@@ -155,7 +459,6 @@ def get_continuation_contents(continuation: JsonDict, parse_func: ParseFuncType)
     return []
 
 
-
 async def resend_request_until_parsed_response_is_valid(
     request_func: RequestFuncType,
     request_additional_params: str,
@@ -14,3 +14,13 @@ class YTMusicUserError(YTMusicError):
 
 class YTMusicServerError(YTMusicError):
     """error caused by the YouTube Music backend"""
+
+    def __init__(self, message: str = "", status: int | None = None, retry_after: float | None = None):
+        """
+        :param message: error message
+        :param status: HTTP status code of the response, if any
+        :param retry_after: seconds the server asked to wait before retrying, if any
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,79 @@
+"""advisory file locks and atomic file replacement for files shared by several processes"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+#: seconds between attempts to acquire a lock held by another process
+LOCK_POLL_INTERVAL = 0.05
+
+
+class FileLock:
+    """
+    Exclusive OS file lock on ``path``, held by at most one instance, also within a process.
+    The lock is released if the process holding it exits.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: Lock file, created if it does not exist
+        """
+        self.path = Path(path)
+        self._file: IO[bytes] | None = None
+
+    def acquire(self) -> bool:
+        """Acquires the lock without blocking. Returns False if it is held by another instance."""
+        if self._file is not None:
+            return False
+        file = open(self.path, "a+b")  # noqa: SIM115 held until release
+        try:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            file.close()
+            return False
+        self._file = file
+        return True
+
+    async def wait(self) -> None:
+        """Acquires the lock, waiting for other instances without blocking the event loop"""
+        while not self.acquire():
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Releases the lock"""
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+def atomic_write(path: str | Path, data: bytes) -> None:
+    """Replaces the file at ``path``, so readers see either the old or the new content, never a partial write"""
+    path = Path(path)
+    # unique per write, concurrent writes of several threads or processes do not collide
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -1,27 +1,27 @@
-import json
-import locale
 import re
 import time
-import unicodedata
-from collections.abc import Callable
+from functools import lru_cache
 from hashlib import sha1
 from http.cookies import SimpleCookie
 
-from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from ytmusicapi.compression import accept_encoding
 from ytmusicapi.constants import *
+from ytmusicapi.models.results import Track
 from ytmusicapi.type_alias import JsonDict
 
+#: response encodings supported by the installed aiohttp codecs, i.e. brotli if installed
+ACCEPT_ENCODING = accept_encoding()
+
 
 def initialize_headers() -> CaseInsensitiveDict[str]:
     return CaseInsensitiveDict(
         {
             "user-agent": USER_AGENT,
             "accept": "*/*",
-            "accept-encoding": "gzip, deflate",
+            "accept-encoding": ACCEPT_ENCODING,
             "content-type": "application/json",
-            "content-encoding": "gzip",
             "origin": YTM_DOMAIN,
         }
     )
@@ -39,16 +39,6 @@ def initialize_context() -> JsonDict:
     }
 
 
-
-def get_visitor_id(request_func: Callable[[str], Response]) -> dict[str, str]:
-    response = request_func(YTM_DOMAIN)
-    matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", response.text)
-    visitor_id = ""
-    if len(matches) > 0:
-        ytcfg = json.loads(matches[0])
-        visitor_id = ytcfg.get("VISITOR_DATA")
-    return {"X-Goog-Visitor-Id": visitor_id}
-
 def sapisid_from_cookie(raw_cookie: str) -> str:
     cookie = SimpleCookie()
     cookie.load(raw_cookie.replace('"', ""))
@@ -58,43 +48,44 @@ def sapisid_from_cookie(raw_cookie: str) -> str:
 # SAPISID Hash reverse engineered by
 # https://stackoverflow.com/a/32065323/5726546
 def get_authorization(auth: str) -> str:
-    """Returns SAPISIDHASH value based on headers and current time
+    """Returns SAPISIDHASH value based on headers and current time.
+    The value changes once per second, so it is computed once per second.
 
     :param auth: SAPISID and Origin value from headers concatenated with space
     """
+    return _sapisid_hash(auth, int(time.time()))
+
+
+@lru_cache(maxsize=64)
+def _sapisid_hash(auth: str, unix_timestamp: int) -> str:
     sha_1 = sha1()
-    unix_timestamp = str(int(time.time()))
-    sha_1.update((unix_timestamp + " " + auth).encode("utf-8"))
-    return "SAPISIDHASH " + unix_timestamp + "_" + sha_1.hexdigest()
+    sha_1.update(f"{unix_timestamp} {auth}".encode())
+    return f"SAPISIDHASH {unix_timestamp}_{sha_1.hexdigest()}"
+
+
+_NON_DIGIT = re.compile(r"\D")
 
 
 def to_int(string: str) -> int:
-    """Attempts to cast a string to an integer using locale or Python int cast
+    """Casts the digits of a string to an integer, ignoring separators and other characters.
+    Independent of the process locale. Digits of other scripts are supported by :py:class:`int`.
+    For abbreviated counts like "1.2M" use :py:meth:`ytmusicapi.parsers.i18n.Parser.parse_count`
 
-    :param string: string that can be cast to an integer
+    :param string: string that contains an integer, i.e. "1,234 views"
 
-    :return Integer if string is a valid integer
+    :return Integer of the digits in string
 
-    :raise ValueError if string is not a valid integer
+    :raise ValueError if string contains no digits
     """
-    string = unicodedata.normalize("NFKD", string)
-    number_string = re.sub(r"\D", "", string)
-    try:
-        int_value = locale.atoi(number_string)
-    except ValueError:
-        number_string = number_string.replace(",", "")
-        int_value = int(number_string)
-    return int_value
+    return int(_NON_DIGIT.sub("", string))
 
 
 def sum_total_duration(item: JsonDict) -> int:
     if "tracks" not in item:
         return 0
-    return sum(
-        [
-            track["duration_seconds"]
-            if ("duration_seconds" in track and isinstance(track["duration_seconds"], int))
-            else 0
-            for track in item["tracks"]
-        ]
-    )
+    total = 0
+    for track in item["tracks"]:
+        duration = track.duration_seconds if isinstance(track, Track) else track.get("duration_seconds")
+        if isinstance(duration, int):
+            total += duration
+    return total
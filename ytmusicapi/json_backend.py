@@ -0,0 +1,93 @@
+"""pluggable JSON encoding and decoding: orjson or msgspec if installed, the standard library otherwise"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Literal
+
+from ytmusicapi.exceptions import YTMusicUserError
+
+JsonBackendName = Literal["auto", "orjson", "msgspec", "json"]
+
+#: backends tried by ``auto``, fastest first
+AUTO_ORDER: tuple[JsonBackendName, ...] = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """Functions of a JSON library. Encoded JSON is UTF-8 and identical in meaning for all backends."""
+
+    #: name of the backend, i.e. ``orjson``
+    name: JsonBackendName
+    #: decodes bytes or str
+    loads: Callable[[bytes | str], Any]
+    #: encodes to compact bytes
+    dumps: Callable[[Any], bytes]
+    #: encodes to indented bytes, for files read by humans
+    dumps_indented: Callable[[Any], bytes]
+    #: raised by ``loads`` for invalid JSON
+    decode_error: type[Exception]
+
+
+def _stdlib() -> JsonBackend:
+    return JsonBackend(
+        "json",
+        json.loads,
+        lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        lambda obj: json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8"),
+        json.JSONDecodeError,
+    )
+
+
+def _orjson() -> JsonBackend:
+    import orjson
+
+    return JsonBackend(
+        "orjson",
+        orjson.loads,
+        orjson.dumps,
+        lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2),
+        orjson.JSONDecodeError,
+    )
+
+
+def _msgspec() -> JsonBackend:
+    import msgspec
+
+    encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+    return JsonBackend(
+        "msgspec",
+        decoder.decode,
+        encoder.encode,
+        lambda obj: msgspec.json.format(encoder.encode(obj), indent=2),
+        msgspec.DecodeError,
+    )
+
+
+_FACTORIES: dict[str, Callable[[], JsonBackend]] = {"json": _stdlib, "orjson": _orjson, "msgspec": _msgspec}
+
+
+@cache
+def get_json_backend(name: JsonBackendName = "auto") -> JsonBackend:
+    """
+    Returns a JSON backend.
+
+    :param name: ``orjson``, ``msgspec`` or ``json`` for the standard library.
+        ``auto`` returns the first installed of orjson, msgspec and the standard library. Default: ``auto``
+    :raises YTMusicUserError: if the backend is unknown or not installed
+    """
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            try:
+                return get_json_backend(candidate)
+            except YTMusicUserError:
+                continue
+    if name not in _FACTORIES:
+        raise YTMusicUserError(
+            f"Unknown JSON backend {name}. Available backends: auto, {', '.join(_FACTORIES)}"
+        )
+    try:
+        return _FACTORIES[name]()
+    except ImportError as e:
+        raise YTMusicUserError(f"JSON backend {name} is not installed") from e
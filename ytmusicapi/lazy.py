@@ -0,0 +1,69 @@
+"""lazily parsed result lists"""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+#: marks items which were not parsed yet, since parsers may return None
+_UNPARSED = object()
+
+
+class LazyList(Sequence[T], Generic[T]):
+    """
+    Read-only list of results which keeps the raw renderers of the response
+    and parses each item on first access. Parsed items are memoized.
+
+    Returned by methods called with ``lazy=True``. Use ``list(items)`` to parse all items at once,
+    i.e. to serialize the result with :py:mod:`json`.
+    """
+
+    __slots__ = ("_items", "_parse", "_raw")
+
+    def __init__(self, raw: list[Any], parse: Callable[[Any], T]):
+        """
+        :param raw: raw renderers of the items, one per item
+        :param parse: parser for a single raw renderer
+        """
+        self._raw = raw
+        self._parse = parse
+        self._items: list[Any] = [_UNPARSED] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        """overload for mypy only"""
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]:
+        """overload for mypy only"""
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("LazyList index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self._raw)):
+            yield self._get(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyList | list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        parsed = sum(item is not _UNPARSED for item in self._items)
+        return f"<LazyList of {len(self._raw)} items, {parsed} parsed>"
+
+    def _get(self, index: int) -> T:
+        item = self._items[index]
+        if item is _UNPARSED:
+            item = self._items[index] = self._parse(self._raw[index])
+        return item  # type: ignore[no-any-return]
@@ -1,16 +1,19 @@
 """protocol that defines the functions available to mixins"""
 
-from collections.abc import Iterator
+from collections.abc import Awaitable, Callable, Iterator, Sequence
 from contextlib import contextmanager
-from typing import Protocol
+from typing import Protocol, TypeVar
 
 from aiohttp import ClientResponse
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.auth.types import AuthType
+from ytmusicapi.bulk import BulkRequest
 from ytmusicapi.parsers.i18n import Parser
 from ytmusicapi.type_alias import JsonDict
 
+T = TypeVar("T")
+
 
 class MixinProtocol(Protocol):
     """protocol that defines the functions available to mixins"""
@@ -21,12 +24,25 @@ class MixinProtocol(Protocol):
 
     proxies: dict[str, str] | None
 
+    prefetch_continuations: bool
+
     def _check_auth(self) -> None:
         """checks if self has authentication"""
 
     async def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
         """for sending post requests to YouTube Music"""
 
+    async def _invalidate(self, *browse_ids: str) -> None:
+        """for removing cached responses changed by a request"""
+
+    async def _send_parsed_request(self, endpoint: str, body: JsonDict, parse: Callable[[JsonDict], T]) -> T:
+        """for sending post requests, whose large responses are decoded and parsed outside of the event loop"""
+
+    def _bulk(
+        self, fetch: Callable[[str], Awaitable[T]], ids: Sequence[str], concurrency: int | None = None
+    ) -> BulkRequest[T]:
+        """for running a batch of requests with bounded concurrency"""
+
     async def _send_get_request(self, url: str, params: JsonDict | None = None) -> ClientResponse:
         """for sending get requests to YouTube Music"""
 
@@ -34,6 +50,17 @@ class MixinProtocol(Protocol):
     def as_mobile(self) -> Iterator[None]:
         """context-manager, that allows requests as the YouTube Music Mobile-App"""
 
+    @contextmanager
+    def client_context(
+        self,
+        client_name: str | None = None,
+        client_version: str | None = None,
+        language: str | None = None,
+        location: str | None = None,
+        user: str | None = None,
+    ) -> Iterator[None]:
+        """context-manager, that overrides the client context of the requests of the current task"""
+
     @property
     def headers(self) -> CaseInsensitiveDict[str]:
         """property for getting request headers"""
@@ -1,9 +1,11 @@
 import re
+from collections.abc import Iterable
 from datetime import date
 from typing import Literal
 
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.models.content.enums import LikeStatus
+from ytmusicapi.type_alias import FieldsType, OutputType
 
 LibraryOrderType = Literal["a_to_z", "z_to_a", "recently_added"]
 
@@ -43,6 +45,27 @@ def prepare_order_params(order: LibraryOrderType) -> str:
     return order_params[orders.index(order)]
 
 
+def prepare_fields(fields: Iterable[str] | None) -> FieldsType:
+    """Returns the requested result fields as a set, None if all fields are requested
+
+    :raises YTMusicUserError: if a single string is passed instead of a collection of field names
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        raise YTMusicUserError(f"fields must be a collection of field names, i.e. ['{fields}']")
+    return frozenset(fields)
+
+
+def validate_output(output: OutputType) -> None:
+    """Validate the requested result format
+
+    :raises YTMusicUserError: if the format is neither ``dicts`` nor ``models``
+    """
+    if output not in ("dicts", "models"):
+        raise YTMusicUserError(f"Invalid output format {output!r}. Use one of 'dicts', 'models'.")
+
+
 def html_to_txt(html_text: str) -> str:
     """
     Sanitize tags from html
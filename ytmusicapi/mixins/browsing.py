@@ -1,40 +1,43 @@
 import re
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from functools import partial
 from typing import Literal, cast, overload
 
+from ytmusicapi.bulk import BulkRequest
 from ytmusicapi.continuations import (
     get_continuations,
     get_reloadable_continuation_params,
 )
-from ytmusicapi.helpers import YTM_DOMAIN, sum_total_duration
+from ytmusicapi.helpers import YTM_DOMAIN
 from ytmusicapi.models.lyrics import LyricLine, Lyrics, TimedLyrics
-from ytmusicapi.parsers.albums import parse_album_header_2024
+from ytmusicapi.parsers.albums import parse_album_response
 from ytmusicapi.parsers.browsing import (
-    parse_album,
+    parse_artist,
     parse_content_list,
     parse_mixed_content,
     parse_playlist,
     parse_video,
 )
 from ytmusicapi.parsers.library import parse_albums
-from ytmusicapi.parsers.playlists import parse_playlist_items
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, OutputType, ParseFuncType, RequestFuncType
 
 from ..exceptions import YTMusicError, YTMusicUserError
 from ..navigation import *
 from ._protocol import MixinProtocol
-from ._utils import get_datestamp
+from ._utils import get_datestamp, prepare_fields, validate_output
 
 
 class BrowsingMixin(MixinProtocol):
-    async def get_home(self, limit: int = 3) -> JsonList:
+    async def get_home(self, limit: int = 3, lazy: bool = False) -> JsonList:
         """
         Get the home page.
         The home page is structured as titled rows, returning 3 rows of music suggestions at a time.
         Content varies and may contain artist, album, song or playlist suggestions, sometimes mixed within the same row
 
         :param limit: Number of rows on the home page to return
+        :param lazy: Return the contents of each row as :py:class:`ytmusicapi.lazy.LazyList`,
+            which parses an item only when it is accessed. Default: False
         :return: List of dictionaries keyed with 'title' text and 'contents' list
 
         Example list::
@@ -118,7 +121,7 @@ class BrowsingMixin(MixinProtocol):
         response = await self._send_request(endpoint, body)
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
         home = []
-        home.extend(parse_mixed_content(results))
+        home.extend(parse_mixed_content(results, lazy))
 
         section_list = nav(response, [*SINGLE_COLUMN_TAB, "sectionListRenderer"])
         if "continuations" in section_list:
@@ -126,17 +129,22 @@ class BrowsingMixin(MixinProtocol):
                 endpoint, body, additionalParams
             )
 
-            parse_func: Callable[[JsonList], JsonList] = lambda contents: parse_mixed_content(contents)
+            parse_func: Callable[[JsonList], JsonList] = lambda contents: parse_mixed_content(contents, lazy)
 
             home.extend(
                 await get_continuations(
-                    section_list, "sectionListContinuation", limit - len(home), request_func, parse_func
+                    section_list,
+                    "sectionListContinuation",
+                    limit - len(home),
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
                 )
             )
 
         return home
 
-    async def get_artist(self, channelId: str) -> JsonDict:
+    async def get_artist(self, channelId: str, lazy: bool = False) -> JsonDict:
         """
         Get information about an artist and their top releases (songs,
         albums, singles, videos, and related artists). The top lists
@@ -160,6 +168,8 @@ class BrowsingMixin(MixinProtocol):
         - For albums/singles/shows, pass browseId and params to :py:func:`get_artist_albums`.
 
         :param channelId: channel id of the artist
+        :param lazy: Return the ``results`` of the releases as :py:class:`ytmusicapi.lazy.LazyList`,
+            which parses an item only when it is accessed. ``songs`` are always parsed. Default: False
         :return: Dictionary with requested information.
 
         .. warning::
@@ -172,11 +182,13 @@ class BrowsingMixin(MixinProtocol):
             {
                 "description": "Oasis were ...",
                 "views": "3,693,390,359 views",
+                "views_count": 3693390359,
                 "name": "Oasis",
                 "channelId": "UCUDVBtnOQi4c7E8jebpjc9Q",
                 "shuffleId": "RDAOkjHYJjL1a3xspEyVkhHAsg",
                 "radioId": "RDEMkjHYJjL1a3xspEyVkhHAsg",
                 "subscribers": "3.86M",
+                "subscribers_count": 3860000,
                 "subscribed": false,
                 "thumbnails": [...],
                 "songs": {
@@ -221,6 +233,7 @@ class BrowsingMixin(MixinProtocol):
                             "title": "Wonderwall",
                             "thumbnails": [...],
                             "views": "358M",
+                            "views_count": 358000000,
                             "videoId": "bx1Bh8ZvH84",
                             "playlistId": "PLMpM3Z0118S5xuNckw1HUcj1D021AnMEB"
                         }
@@ -232,6 +245,7 @@ class BrowsingMixin(MixinProtocol):
                         {
                             "browseId": "UCt2KxZpY5D__kapeQ8cauQw",
                             "subscribers": "450K",
+                            "subscribers_count": 450000,
                             "title": "The Verve"
                         },
                         {
@@ -247,40 +261,25 @@ class BrowsingMixin(MixinProtocol):
         if channelId.startswith("MPLA"):
             channelId = channelId[4:]
         body = {"browseId": channelId}
-        endpoint = "browse"
-        response = await self._send_request(endpoint, body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
-
-        artist: JsonDict = {"description": None, "views": None}
-        header = response["header"]["musicImmersiveHeaderRenderer"]
-        artist["name"] = nav(header, TITLE_TEXT)
-        descriptionShelf = find_object_by_key(results, DESCRIPTION_SHELF[0], is_key=True)
-        if descriptionShelf:
-            artist["description"] = nav(descriptionShelf, DESCRIPTION)
-            artist["views"] = (
-                None
-                if "subheader" not in descriptionShelf
-                else descriptionShelf["subheader"]["runs"][0]["text"]
-            )
-        subscription_button = header["subscriptionButton"]["subscribeButtonRenderer"]
-        artist["channelId"] = subscription_button["channelId"]
-        artist["shuffleId"] = nav(header, ["playButton", "buttonRenderer", *NAVIGATION_PLAYLIST_ID], True)
-        artist["radioId"] = nav(header, ["startRadioButton", "buttonRenderer", *NAVIGATION_PLAYLIST_ID], True)
-        artist["subscribers"] = nav(subscription_button, ["subscriberCountText", "runs", 0, "text"], True)
-        artist["subscribed"] = subscription_button["subscribed"]
-        artist["thumbnails"] = nav(header, THUMBNAILS, True)
-        artist["songs"] = {"browseId": None}
-        if "musicShelfRenderer" in results[0]:  # API sometimes does not return songs
-            musicShelf = nav(results[0], MUSIC_SHELF)
-            if "navigationEndpoint" in nav(musicShelf, TITLE):
-                artist["songs"]["browseId"] = nav(musicShelf, TITLE + NAVIGATION_BROWSE_ID)
-            artist["songs"]["results"] = parse_playlist_items(musicShelf["contents"])
-
-        artist.update(self.parser.parse_channel_contents(results))
-        return artist
+        return await self._send_parsed_request(
+            "browse", body, partial(parse_artist, parser=self.parser, lazy=lazy)
+        )
 
     ArtistOrderType = Literal["Recency", "Popularity", "Alphabetical order"]
 
+    def get_artists(self, channelIds: list[str], concurrency: int | None = None) -> BulkRequest[JsonDict]:
+        """
+        Get information about several artists concurrently. See :py:func:`get_artist`.
+
+        :param channelIds: channel ids of the artists
+        :param concurrency: Maximum number of concurrent requests for this batch.
+            Default: the ``bulk_concurrency`` of this instance
+        :return: :py:class:`BulkRequest`. Await it for a list of results in input order,
+            or iterate over it asynchronously for ``(index, result)`` tuples in completion order.
+            Items that failed are returned as the raised exception.
+        """
+        return self._bulk(self.get_artist, channelIds, concurrency)
+
     async def get_artist_albums(
         self, channelId: str, params: str, limit: int | None = 100, order: ArtistOrderType | None = None
     ) -> JsonList:
@@ -360,7 +359,12 @@ class BrowsingMixin(MixinProtocol):
             remaining_limit = None if limit is None else (limit - len(albums))
             albums.extend(
                 await get_continuations(
-                    results, "gridContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
                 )
             )
 
@@ -400,7 +404,8 @@ class BrowsingMixin(MixinProtocol):
                         "height": 450
                       }
                     ],
-                    "views": "19K"
+                    "views": "19K",
+                    "views_count": 19000
                   }
                 ]
               },
@@ -494,12 +499,19 @@ class BrowsingMixin(MixinProtocol):
             browse_id = matches.group().strip('"')
         return browse_id
 
-    async def get_album(self, browseId: str) -> JsonDict:
+    async def get_album(
+        self, browseId: str, fields: Iterable[str] | None = None, output: OutputType = "dicts"
+    ) -> JsonDict:
         """
         Get information and tracks of an album
 
         :param browseId: browseId of the album, for example
             returned by :py:func:`search`
+        :param fields: Fields of the tracks to return, i.e. ``["videoId", "title", "trackNumber"]``.
+            Other fields are not parsed at all. Default: ``None``, all fields
+        :param output: Format of the tracks, ``dicts`` or ``models``, see :py:func:`get_playlist`.
+            The ``album`` of a track model is an :py:class:`ytmusicapi.models.Album` with the album title
+            and browseId. Default: ``dicts``
         :return: Dictionary with album and track metadata.
 
         The result is in the following format::
@@ -534,6 +546,8 @@ class BrowsingMixin(MixinProtocol):
                   "thumbnails": null,
                   "isAvailable": true,
                   "isExplicit": true,
+                  "views": "155M plays",
+                  "views_count": 155000000,
                   "duration": "5:03",
                   "duration_seconds": 303,
                   "trackNumber": 0,
@@ -558,25 +572,34 @@ class BrowsingMixin(MixinProtocol):
         if not browseId or not browseId.startswith("MPRE"):
             raise YTMusicUserError("Invalid album browseId provided, must start with MPRE.")
 
+        projection = prepare_fields(fields)
+        validate_output(output)
         body = {"browseId": browseId}
-        endpoint = "browse"
-        response = await self._send_request(endpoint, body)
-        album: JsonDict = parse_album_header_2024(response)
-        
-        results = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
-        album["tracks"] = parse_playlist_items(results["contents"], is_album=True)
-
-        other_versions = nav(
-            response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST, 1, *CAROUSEL], True
+        parse = partial(
+            parse_album_response,
+            browse_id=browseId,
+            fields=projection,
+            output=output,
+            number_format=self.parser.tables.number_format,
         )
-        if other_versions is not None:
-            album["other_versions"] = parse_content_list(other_versions["contents"], parse_album)
-        album["duration_seconds"] = sum_total_duration(album)
-        for i, track in enumerate(album["tracks"]):
-            album["tracks"][i]["album"] = album["title"]
-            album["tracks"][i]["artists"] = album["tracks"][i]["artists"] or album["artists"]
+        return await self._send_parsed_request("browse", body, parse)
 
-        return album
+    def get_albums(
+        self, browseIds: list[str], concurrency: int | None = None, fields: Iterable[str] | None = None
+    ) -> BulkRequest[JsonDict]:
+        """
+        Get information and tracks of several albums concurrently. See :py:func:`get_album`.
+
+        :param browseIds: browseIds of the albums
+        :param concurrency: Maximum number of concurrent requests for this batch.
+            Default: the ``bulk_concurrency`` of this instance
+        :param fields: Fields of the tracks to return, see :py:func:`get_album`. Default: ``None``, all fields
+        :return: :py:class:`BulkRequest`. Await it for a list of results in input order,
+            or iterate over it asynchronously for ``(index, result)`` tuples in completion order.
+            Items that failed are returned as the raised exception.
+        """
+        fields = None if fields is None else list(fields)
+        return self._bulk(lambda browseId: self.get_album(browseId, fields), browseIds, concurrency)
 
     async def get_song(self, videoId: str, signatureTimestamp: int | None = None) -> JsonDict:
         """
@@ -759,17 +782,32 @@ class BrowsingMixin(MixinProtocol):
         }
         response = await self._send_request(endpoint, params)
         keys = ["videoDetails", "playabilityStatus", "streamingData", "microformat", "playbackTracking"]
-        for k in list(response.keys()):
-            if k not in keys:
-                del response[k]
-        return response
+        return {k: v for k, v in response.items() if k in keys}
+
+    def get_songs(
+        self, videoIds: list[str], signatureTimestamp: int | None = None, concurrency: int | None = None
+    ) -> BulkRequest[JsonDict]:
+        """
+        Returns metadata and streaming information about several songs concurrently. See :py:func:`get_song`.
+
+        :param videoIds: Video ids
+        :param signatureTimestamp: Provide the current YouTube signatureTimestamp.
+        :param concurrency: Maximum number of concurrent requests for this batch.
+            Default: the ``bulk_concurrency`` of this instance
+        :return: :py:class:`BulkRequest`. Await it for a list of results in input order,
+            or iterate over it asynchronously for ``(index, result)`` tuples in completion order.
+            Items that failed are returned as the raised exception.
+        """
+        return self._bulk(lambda videoId: self.get_song(videoId, signatureTimestamp), videoIds, concurrency)
 
-    async def get_song_related(self, browseId: str) -> JsonList:
+    async def get_song_related(self, browseId: str, lazy: bool = False) -> JsonList:
         """
         Gets related content for a song. Equivalent to the content
         shown in the "Related" tab of the watch panel.
 
         :param browseId: The ``related`` key  in the ``get_watch_playlist`` response.
+        :param lazy: Return the contents of each section as :py:class:`ytmusicapi.lazy.LazyList`,
+            which parses an item only when it is accessed. Default: False
 
         Example::
 
@@ -843,7 +881,7 @@ class BrowsingMixin(MixinProtocol):
 
         response = await self._send_request("browse", {"browseId": browseId})
         sections = nav(response, ["contents", *SECTION_LIST])
-        return parse_mixed_content(sections)
+        return parse_mixed_content(sections, lazy)
 
     @overload
     async def get_lyrics(self, browseId: str, timestamps: Literal[False] = False) -> Lyrics | None:
@@ -898,7 +936,7 @@ class BrowsingMixin(MixinProtocol):
             raise YTMusicUserError("Invalid browseId provided. This song might not have lyrics.")
 
         if timestamps:
-            # changes and restores the client to get lyrics with timestamps (mobile only)
+            # requests lyrics with timestamps as the mobile client, concurrent requests are not affected
             with self.as_mobile():
                 response = await self._send_request("browse", {"browseId": browseId})
         else:
@@ -1,9 +1,8 @@
-from collections.abc import Callable
-from typing import Any
+from functools import partial
 
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.parsers.explore import *
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncDictType
+from ytmusicapi.type_alias import JsonDict, JsonList
 
 
 class ExploreMixin(MixinProtocol):
@@ -194,67 +193,4 @@ class ExploreMixin(MixinProtocol):
         if country:
             body["formData"] = {"selectedValues": [country]}
 
-        response = await self._send_request("browse", body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
-        charts: JsonDict = {"countries": {}}
-        menu = nav(
-            results[0],
-            [
-                *MUSIC_SHELF,
-                "subheaders",
-                0,
-                "musicSideAlignedItemRenderer",
-                "startItems",
-                0,
-                "musicSortFilterButtonRenderer",
-            ],
-        )
-        charts["countries"]["selected"] = nav(menu, TITLE)
-        charts["countries"]["options"] = list(
-            filter(
-                None,
-                [
-                    nav(m, ["payload", "musicFormBooleanChoice", "opaqueToken"], True)
-                    for m in nav(response, FRAMEWORK_MUTATIONS)
-                ],
-            )
-        )
-        charts_categories = ["videos", "artists"]
-
-        has_genres = country == "US"
-        has_trending = country != "ZZ"
-
-        # use result length to determine if songs category is present
-        # could also be done via an is_premium attribute on YTMusic instance
-        has_songs = (len(results) - 1) > (len(charts_categories) + has_genres + has_trending)
-
-        if has_songs:
-            charts_categories.insert(0, "songs")
-        if has_genres:
-            charts_categories.append("genres")
-        if has_trending:
-            charts_categories.append("trending")
-
-        parse_chart: Callable[[int, ParseFuncDictType, str], list[dict[str, Any]]] = (
-            lambda index, parse_func, key: parse_content_list(
-                nav(results[index + has_songs], CAROUSEL_CONTENTS), parse_func, key
-            )
-        )
-        for i, c in enumerate(charts_categories):
-            charts[c] = {
-                "playlist": nav(results[1 + i], CAROUSEL + CAROUSEL_TITLE + NAVIGATION_BROWSE_ID, True)
-            }
-
-        if has_songs:
-            charts["songs"].update({"items": parse_chart(0, parse_chart_song, MRLIR)})
-
-        charts["videos"]["items"] = parse_chart(1, parse_video, MTRIR)
-        charts["artists"]["items"] = parse_chart(2, parse_chart_artist, MRLIR)
-
-        if has_genres:
-            charts["genres"] = parse_chart(3, parse_playlist, MTRIR)
-
-        if has_trending:
-            charts["trending"]["items"] = parse_chart(3 + has_genres, parse_chart_trending, MRLIR)
-
-        return charts
+        return await self._send_parsed_request("browse", body, partial(parse_charts, country=country))
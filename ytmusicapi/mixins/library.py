@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable, Iterable
+from contextlib import aclosing
 from random import randint
 
 from requests import Response
@@ -8,8 +9,15 @@ from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.models.content.enums import LikeStatus
 from ytmusicapi.parsers.browsing import *
 from ytmusicapi.parsers.library import *
-from ytmusicapi.parsers.playlists import parse_playlist_items
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncDictType, ParseFuncType, RequestFuncType
+from ytmusicapi.parsers.playlists import parse_playlist_items, validate_playlist_id
+from ytmusicapi.type_alias import (
+    JsonDict,
+    JsonList,
+    OutputType,
+    ParseFuncDictType,
+    ParseFuncType,
+    RequestFuncType,
+)
 
 from ..exceptions import YTMusicServerError
 from ._protocol import MixinProtocol
@@ -17,11 +25,17 @@ from ._utils import *
 
 
 class LibraryMixin(MixinProtocol):
-    async def get_library_playlists(self, limit: int | None = 25) -> JsonList:
+    async def get_library_playlists(
+        self, limit: int | None = 25, fields: Iterable[str] | None = None, output: OutputType = "dicts"
+    ) -> JsonList:
         """
         Retrieves the playlists in the user's library.
 
         :param limit: Number of playlists to retrieve. ``None`` retrieves them all.
+        :param fields: Fields of the playlists to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        :param output: Format of the playlists. ``models`` returns :py:class:`ytmusicapi.models.Playlist` objects,
+            with the ``title`` as ``name`` and the ``playlistId`` as ``id``. Default: ``dicts``
         :return: List of owned playlists.
 
         Each item is in the following format::
@@ -34,6 +48,8 @@ class LibraryMixin(MixinProtocol):
             }
         """
         self._check_auth()
+        validate_output(output)
+        projection = prepare_fields(fields)
         body = {"browseId": "FEmusic_liked_playlists"}
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
@@ -41,24 +57,71 @@ class LibraryMixin(MixinProtocol):
         results = get_library_contents(response, GRID)
         if results is None:
             return []
-        playlists = parse_content_list(results["items"][1:], parse_playlist)
+        cursor = get_continuation_cursor(
+            results, "playlists", endpoint, body, "gridContinuation", fields=projection, output=output
+        )
+        playlists = CursorList(parse_playlists(results["items"][1:], projection, output), cursor)
 
         if "continuations" in results:
             request_func: RequestFuncType = lambda additionalParams: self._send_request(
                 endpoint, body, additionalParams
             )
-            parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_playlist)
+            parse_func: ParseFuncType = lambda contents: parse_playlists(contents, projection, output)
             remaining_limit = None if limit is None else (limit - len(playlists))
-            playlists.extend(
+            playlists.extend_continuation(
                 await get_continuations(
-                    results, "gridContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
                 )
             )
 
         return playlists
 
+    async def iter_library_playlists(
+        self, limit: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the playlists in the user's library one by one, requesting further pages as they are consumed.
+        Same format as :py:func:`get_library_playlists`.
+
+        :param limit: Maximum number of playlists to yield. Default: ``None``, yield all playlists.
+        :param fields: Fields of the playlists to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        """
+        self._check_auth()
+        projection = prepare_fields(fields)
+        body = {"browseId": "FEmusic_liked_playlists"}
+        endpoint = "browse"
+        response = await self._send_request(endpoint, body)
+
+        results = get_library_contents(response, GRID)
+        if results is None:
+            return
+        parse_func: ParseFuncType = lambda contents: parse_content_list(
+            contents, parse_playlist, fields=projection
+        )
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        pages = iter_continuations(
+            results, "gridContinuation", request_func, parse_func, prefetch=self.prefetch_continuations
+        )
+        async with aclosing(iter_items(parse_func(results["items"][1:]), pages, limit)) as playlists:
+            async for playlist in playlists:
+                yield playlist
+
     async def get_library_songs(
-        self, limit: int = 25, validate_responses: bool = False, order: LibraryOrderType | None = None
+        self,
+        limit: int = 25,
+        validate_responses: bool = False,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+        output: OutputType = "dicts",
     ) -> JsonList:
         """
         Gets the songs in the user's library (liked videos are not included).
@@ -68,9 +131,16 @@ class LibraryMixin(MixinProtocol):
         :param validate_responses: Flag indicating if responses from YTM should be validated and retried in case
             when some songs are missing. Default: False
         :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
-        :return: List of songs. Same format as :py:func:`get_playlist`
+        :param fields: Fields of the songs to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        :param output: Format of the songs, ``dicts`` or ``models``, see :py:func:`get_playlist`. Default: ``dicts``
+        :return: List of songs. Same format as :py:func:`get_playlist`.
+            Its ``cursor`` attribute resumes after the last song with :py:func:`resume`,
+            unless ``validate_responses`` is set.
         """
         self._check_auth()
+        projection = prepare_fields(fields)
+        validate_output(output)
         body = {"browseId": "FEmusic_liked_videos"}
         validate_order_parameter(order)
         if order is not None:
@@ -79,7 +149,9 @@ class LibraryMixin(MixinProtocol):
         per_page = 25
 
         request_func: RequestFuncType = lambda additionalParams: self._send_request(endpoint, body)
-        parse_func: ParseFuncDictType = lambda raw_response: parse_library_songs(raw_response)
+        parse_func: ParseFuncDictType = lambda raw_response: parse_library_songs(
+            raw_response, projection, output
+        )
 
         if validate_responses and limit is None:
             raise YTMusicUserError("Validation is not supported without a limit parameter.")
@@ -95,19 +167,32 @@ class LibraryMixin(MixinProtocol):
             response = parse_func(await request_func(""))
 
         results = response["results"]
-        songs: JsonList | None = response["parsed"]
-        if songs is None:
+        if response["parsed"] is None:
             return []
+        cursor = None
+        if not validate_responses:
+            cursor = get_continuation_cursor(
+                results,
+                "playlist_items",
+                endpoint,
+                body,
+                "musicShelfContinuation",
+                fields=projection,
+                output=output,
+            )
+        songs = CursorList(response["parsed"], cursor)
 
         if "continuations" in results:
             request_continuations_func = lambda additionalParams: self._send_request(
                 endpoint, body, additionalParams
             )
-            parse_continuations_func = lambda contents: parse_playlist_items(contents)
+            parse_continuations_func = lambda contents: parse_playlist_items(
+                contents, fields=projection, output=output
+            )
 
             if validate_responses:
                 songs.extend(
-                    get_validated_continuations(
+                    await get_validated_continuations(
                         results,
                         "musicShelfContinuation",
                         limit - len(songs),
@@ -118,24 +203,79 @@ class LibraryMixin(MixinProtocol):
                 )
             else:
                 remaining_limit = None if limit is None else (limit - len(songs))
-                songs.extend(
+                songs.extend_continuation(
                     await get_continuations(
                         results,
                         "musicShelfContinuation",
                         remaining_limit,
                         request_continuations_func,
                         parse_continuations_func,
+                        prefetch=self.prefetch_continuations,
+                        cursor=cursor,
                     )
                 )
 
         return songs
 
-    async def get_library_albums(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    async def iter_library_songs(
+        self,
+        limit: int | None = None,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the songs in the user's library one by one, requesting further pages as they are consumed.
+        Same format as :py:func:`get_library_songs`.
+
+        Example::
+
+            async for song in yt.iter_library_songs():
+                print(song["title"])
+
+        :param limit: Maximum number of songs to yield. Default: ``None``, yield all songs.
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the songs to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        """
+        self._check_auth()
+        projection = prepare_fields(fields)
+        body = {"browseId": "FEmusic_liked_videos"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = "browse"
+        response = parse_library_songs(await self._send_request(endpoint, body), projection)
+        results = response["results"]
+        if results is None:
+            return
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents, fields=projection)
+        pages = iter_continuations(
+            results, "musicShelfContinuation", request_func, parse_func, prefetch=self.prefetch_continuations
+        )
+        async with aclosing(iter_items(response["parsed"], pages, limit)) as songs:
+            async for song in songs:
+                yield song
+
+    async def get_library_albums(
+        self,
+        limit: int = 25,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+        output: OutputType = "dicts",
+    ) -> JsonList:
         """
         Gets the albums in the user's library.
 
         :param limit: Number of albums to return
         :param order: Order of albums to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the albums to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        :param output: Format of the albums. ``models`` returns :py:class:`ytmusicapi.models.Album` objects,
+            with the ``title`` as ``name`` and the ``browseId`` as ``id``. Default: ``dicts``
         :return: List of albums.
 
         Each item is in the following format::
@@ -154,6 +294,7 @@ class LibraryMixin(MixinProtocol):
             }
         """
         self._check_auth()
+        validate_output(output)
         body = {"browseId": "FEmusic_liked_albums"}
         validate_order_parameter(order)
         if order is not None:
@@ -162,15 +303,69 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_albums(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
+            fields=prepare_fields(fields),
+            output=output,
         )
 
-    async def get_library_artists(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    async def iter_library_albums(
+        self,
+        limit: int | None = None,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the albums in the user's library one by one, requesting further pages as they are consumed.
+        Same format as :py:func:`get_library_albums`.
+
+        :param limit: Maximum number of albums to yield. Default: ``None``, yield all albums.
+        :param order: Order of albums to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the albums to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        """
+        self._check_auth()
+        projection = prepare_fields(fields)
+        body = {"browseId": "FEmusic_liked_albums"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = "browse"
+        response = await self._send_request(endpoint, body)
+        results = get_library_contents(response, GRID)
+        if results is None:
+            return
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_albums(contents, projection)
+        pages = iter_continuations(
+            results, "gridContinuation", request_func, parse_func, prefetch=self.prefetch_continuations
+        )
+        async with aclosing(iter_items(parse_func(results["items"]), pages, limit)) as albums:
+            async for album in albums:
+                yield album
+
+    async def get_library_artists(
+        self,
+        limit: int = 25,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+        output: OutputType = "dicts",
+    ) -> JsonList:
         """
         Gets the artists of the songs in the user's library.
 
         :param limit: Number of artists to return
         :param order: Order of artists to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the artists to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        :param output: Format of the artists. ``models`` returns :py:class:`ytmusicapi.models.Artist` objects,
+            with the ``artist`` as ``name`` and the ``browseId`` as ``id``. Default: ``dicts``
         :return: List of artists.
 
         Each item is in the following format::
@@ -179,10 +374,12 @@ class LibraryMixin(MixinProtocol):
               "browseId": "UCxEqaQWosMHaTih-tgzDqug",
               "artist": "WildVibes",
               "subscribers": "2.91K",
+              "subscribers_count": 2910,
               "thumbnails": [...]
             }
         """
         self._check_auth()
+        validate_output(output)
         body = {"browseId": "FEmusic_library_corpus_track_artists"}
         validate_order_parameter(order)
         if order is not None:
@@ -190,18 +387,75 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_artists(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
+            fields=prepare_fields(fields),
+            output=output,
+            number_format=self.parser.tables.number_format,
         )
 
-    async def get_library_subscriptions(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    async def iter_library_artists(
+        self,
+        limit: int | None = None,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the artists of the songs in the user's library one by one,
+        requesting further pages as they are consumed. Same format as :py:func:`get_library_artists`.
+
+        :param limit: Maximum number of artists to yield. Default: ``None``, yield all artists.
+        :param order: Order of artists to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the artists to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        """
+        self._check_auth()
+        projection = prepare_fields(fields)
+        body = {"browseId": "FEmusic_library_corpus_track_artists"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = "browse"
+        response = await self._send_request(endpoint, body)
+        results = get_library_contents(response, MUSIC_SHELF)
+        if results is None:
+            return
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_artists(
+            contents, fields=projection, number_format=self.parser.tables.number_format
+        )
+        pages = iter_continuations(
+            results, "musicShelfContinuation", request_func, parse_func, prefetch=self.prefetch_continuations
+        )
+        async with aclosing(iter_items(parse_func(results["contents"]), pages, limit)) as artists:
+            async for artist in artists:
+                yield artist
+
+    async def get_library_subscriptions(
+        self,
+        limit: int = 25,
+        order: LibraryOrderType | None = None,
+        fields: Iterable[str] | None = None,
+        output: OutputType = "dicts",
+    ) -> JsonList:
         """
         Gets the artists the user has subscribed to.
 
         :param limit: Number of artists to return
         :param order: Order of artists to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the artists to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
+        :param output: Format of the artists, see :py:func:`get_library_artists`. Default: ``dicts``
         :return: List of artists. Same format as :py:func:`get_library_artists`
         """
         self._check_auth()
+        validate_output(output)
         body = {"browseId": "FEmusic_library_corpus_artists"}
         validate_order_parameter(order)
         if order is not None:
@@ -209,15 +463,26 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_artists(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
+            fields=prepare_fields(fields),
+            output=output,
+            number_format=self.parser.tables.number_format,
         )
 
-    async def get_library_podcasts(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    async def get_library_podcasts(
+        self, limit: int = 25, order: LibraryOrderType | None = None, fields: Iterable[str] | None = None
+    ) -> JsonList:
         """
         Get podcasts the user has added to the library
 
         :param limit: Number of podcasts to return
         :param order: Order of podcasts to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the podcasts to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
         :return: List of podcasts. New Episodes playlist is the first podcast returned, but only if subscribed to relevant podcasts.
 
         Example::
@@ -255,15 +520,24 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_podcasts(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
+            fields=prepare_fields(fields),
         )
 
-    async def get_library_channels(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    async def get_library_channels(
+        self, limit: int = 25, order: LibraryOrderType | None = None, fields: Iterable[str] | None = None
+    ) -> JsonList:
         """
         Get channels the user has added to the library
 
         :param limit: Number of channels to return
         :param order: Order of channels to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param fields: Fields of the channels to return. Other fields are not parsed at all.
+            Default: ``None``, all fields
         :return: List of channels.
 
         Example::
@@ -273,12 +547,14 @@ class LibraryMixin(MixinProtocol):
                     "browseId": "UCRFF8xw5dg9mL4r5ryFOtKw",
                     "artist": "Jumpers Jump",
                     "subscribers": "1.54M",
+                    "subscribers_count": 1540000,
                     "thumbnails": [...]
                 },
                 {
                     "browseId": "UCQ3f2_sO3NJyDkuCxCNSOVA",
                     "artist": "BROWN BAG",
                     "subscribers": "74.2K",
+                    "subscribers_count": 74200,
                     "thumbnails": [...]
                 }
             ]
@@ -291,7 +567,13 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_artists(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
+            fields=prepare_fields(fields),
+            number_format=self.parser.tables.number_format,
         )
 
     async def get_history(self) -> JsonList:
@@ -374,7 +656,9 @@ class LibraryMixin(MixinProtocol):
         self._check_auth()
         body = {"target": {"videoId": videoId}}
         endpoint = prepare_like_endpoint(rating)
-        return await self._send_request(endpoint, body)
+        response = await self._send_request(endpoint, body)
+        await self._invalidate("VLLM")  # liked songs
+        return response
 
     async def edit_song_library_status(self, feedbackTokens: list[str] | None = None) -> JsonDict:
         """
@@ -405,7 +689,9 @@ class LibraryMixin(MixinProtocol):
         self._check_auth()
         body = {"target": {"playlistId": playlistId}}
         endpoint = prepare_like_endpoint(rating)
-        return await self._send_request(endpoint, body)
+        response = await self._send_request(endpoint, body)
+        await self._invalidate("VL" + validate_playlist_id(playlistId))
+        return response
 
     async def subscribe_artists(self, channelIds: list[str]) -> JsonDict:
         """
@@ -417,7 +703,9 @@ class LibraryMixin(MixinProtocol):
         self._check_auth()
         body = {"channelIds": channelIds}
         endpoint = "subscription/subscribe"
-        return await self._send_request(endpoint, body)
+        response = await self._send_request(endpoint, body)
+        await self._invalidate(*channelIds)
+        return response
 
     async def unsubscribe_artists(self, channelIds: list[str]) -> JsonDict:
         """
@@ -429,7 +717,9 @@ class LibraryMixin(MixinProtocol):
         self._check_auth()
         body = {"channelIds": channelIds}
         endpoint = "subscription/unsubscribe"
-        return await self._send_request(endpoint, body)
+        response = await self._send_request(endpoint, body)
+        await self._invalidate(*channelIds)
+        return response
 
     async def get_account_info(self) -> JsonDict:
         """
@@ -0,0 +1,99 @@
+from ytmusicapi.continuations import (
+    CONTINUATION_2025,
+    ContinuationCursor,
+    CursorList,
+    get_continuations,
+    get_continuations_2025,
+)
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.mixins._protocol import MixinProtocol
+from ytmusicapi.parsers.browsing import parse_content_list
+from ytmusicapi.parsers.library import parse_albums, parse_artists, parse_playlists
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.parsers.podcasts import parse_podcast
+from ytmusicapi.parsers.search import parse_search_results
+from ytmusicapi.parsers.uploads import parse_uploaded_items
+from ytmusicapi.parsers.watch import parse_watch_playlist
+from ytmusicapi.type_alias import JsonDict, ParseFuncType, RequestFuncBodyType, RequestFuncType
+
+
+class PaginationMixin(MixinProtocol):
+    async def resume(self, cursor: ContinuationCursor | str, limit: int | None = 100) -> CursorList:
+        """
+        Resumes a paginated result after the position of a cursor.
+
+        Cursors are returned as ``cursor`` attribute of the item lists of
+        :py:func:`get_playlist` (``tracks``), :py:func:`get_watch_playlist` (``tracks``),
+        :py:func:`search` with a filter, :py:func:`get_library_songs`, :py:func:`get_library_albums`,
+        :py:func:`get_library_artists`, :py:func:`get_library_playlists`, :py:func:`get_library_subscriptions`,
+        :py:func:`get_library_podcasts`, :py:func:`get_library_channels` and the upload library methods.
+        The cursor is None if the list is complete.
+
+        Example::
+
+            songs = await yt.get_library_songs(limit=None)
+            ...
+            # after a failure, continue at the last checkpoint
+            checkpoint = songs.cursor.dumps()
+            songs = await yt.resume(checkpoint, limit=None)
+
+        :param cursor: The cursor, or its serialized form from :py:meth:`ContinuationCursor.dumps`
+        :param limit: Minimum number of items to return. ``None`` retrieves all remaining items. Default: 100
+        :return: List of items in the format and ``output`` of the method that returned the cursor.
+            Its ``cursor`` attribute resumes after the last returned item.
+        """
+        if isinstance(cursor, str):
+            cursor = ContinuationCursor.loads(cursor)
+        parse_func = self._get_cursor_parse_func(cursor)
+        endpoint, body = cursor.endpoint, cursor.body
+        if cursor.continuation_type == CONTINUATION_2025:
+            request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
+            return await get_continuations_2025(
+                cursor.initial_results(),
+                limit,
+                request_func_continuations,
+                parse_func,
+                prefetch=self.prefetch_continuations,
+                cursor=cursor,
+            )
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, dict(body), additionalParams
+        )
+        return await get_continuations(
+            cursor.initial_results(),
+            cursor.continuation_type,
+            limit,
+            request_func,
+            parse_func,
+            cursor.ctoken_path,
+            prefetch=self.prefetch_continuations,
+            cursor=cursor,
+        )
+
+    def _get_cursor_parse_func(self, cursor: ContinuationCursor) -> ParseFuncType:
+        """returns the parse function for the continuations of a cursor's kind"""
+        params: JsonDict = cursor.params
+        fields, output = cursor.fields, cursor.output
+        parse_funcs: dict[str, ParseFuncType] = {
+            "playlist_items": lambda contents: parse_playlist_items(contents, fields=fields, output=output),
+            "watch_playlist": lambda contents: parse_watch_playlist(contents),
+            "uploaded_items": lambda contents: parse_uploaded_items(contents),
+            "albums": lambda contents: parse_albums(contents, fields, output),
+            "artists": lambda contents: parse_artists(
+                contents, fields=fields, output=output, number_format=self.parser.tables.number_format
+            ),
+            "playlists": lambda contents: parse_playlists(contents, fields, output),
+            "podcasts": lambda contents: parse_content_list(contents, parse_podcast, fields=fields),
+            "search_results": lambda contents: parse_search_results(
+                contents,
+                self.parser.get_api_result_types(),
+                params.get("resultType"),
+                params.get("category"),
+                fields,
+                self.parser.tables.number_format,
+            ),
+        }
+        if cursor.kind not in parse_funcs:
+            raise YTMusicUserError(f"Unsupported cursor kind: {cursor.kind}")
+        return parse_funcs[cursor.kind]
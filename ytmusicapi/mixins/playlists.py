@@ -1,10 +1,24 @@
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
+from functools import partial
+from typing import Any
+
+from ytmusicapi.bulk import BulkRequest
 from ytmusicapi.continuations import *
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.helpers import sum_total_duration
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.browsing import parse_content_list, parse_playlist
 from ytmusicapi.parsers.playlists import *
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncBodyType, RequestFuncType
+from ytmusicapi.type_alias import (
+    FieldsType,
+    JsonDict,
+    JsonList,
+    OutputType,
+    ParseFuncType,
+    RequestFuncBodyType,
+    RequestFuncType,
+)
 
 from ._protocol import MixinProtocol
 from ._utils import *
@@ -12,7 +26,13 @@ from ._utils import *
 
 class PlaylistsMixin(MixinProtocol):
     async def get_playlist(
-        self, playlistId: str, limit: int | None = 100, related: bool = False, suggestions_limit: int = 0
+        self,
+        playlistId: str,
+        limit: int | None = 100,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        fields: Iterable[str] | None = None,
+        output: OutputType = "dicts",
     ) -> JsonDict:
         """
         Returns a list of playlist items
@@ -23,8 +43,16 @@ class PlaylistsMixin(MixinProtocol):
         :param suggestions_limit: How many suggestions to return. The result is a list of
             suggested playlist items (videos) contained in a "suggestions" key.
             7 items are retrieved in each internal request. Default: 0
+        :param fields: Fields of the tracks to return, i.e. ``["videoId", "title", "artists"]``.
+            Other fields are not parsed at all, which saves time and memory for large playlists.
+            ``duration_seconds`` of the playlist only counts tracks with the ``duration_seconds`` field.
+            Default: ``None``, all fields
+        :param output: Format of the tracks. ``models`` returns :py:class:`ytmusicapi.models.Track` objects,
+            which use less memory than dictionaries. Attributes of fields which were not requested are None.
+            Default: ``dicts``
         :return: Dictionary with information about the playlist.
-            The key ``tracks`` contains a List of playlistItem dictionaries
+            The key ``tracks`` contains a List of playlistItem dictionaries.
+            Its ``cursor`` attribute resumes the playlist after the last track with :py:func:`resume`
 
         The result is in the following format::
 
@@ -104,28 +132,41 @@ class PlaylistsMixin(MixinProtocol):
         The setVideoId is the unique id of this playlist item and
         needed for moving/removing playlist items
         """
+        projection = prepare_fields(fields)
+        validate_output(output)
         browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
         body = {"browseId": browseId}
         endpoint = "browse"
         request_func: RequestFuncType = lambda additionalParams: self._send_request(
             endpoint, body, additionalParams
         )
-        response = await request_func("")
-
         request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
         if playlistId.startswith("OLA") or playlistId.startswith("VLOLA"):
-            return parse_audio_playlist(response, limit, request_func_continuations)
+            response = await request_func("")
+            return await parse_audio_playlist(
+                response,
+                limit,
+                request_func_continuations,
+                prefetch=self.prefetch_continuations,
+                body=body,
+                fields=projection,
+                output=output,
+            )
 
+        # the tracks of the first page are parsed with the response, outside of the event loop if it is large
+        response, tracks = await self._send_parsed_request(
+            endpoint, body, partial(parse_playlist_response, fields=projection, output=output)
+        )
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"], True)
         if not results:
             return await self._parse_new_playlist_format(
-                response, endpoint, body, suggestions_limit, related, limit
+                response, endpoint, body, suggestions_limit, related, limit, projection, output, tracks
             )
 
         playlist = {"id": results["playlistId"]}
         playlist.update(parse_playlist_header(response))
         if playlist["trackCount"] is None:
-            playlist["trackCount"] = len(results["contents"])
+            playlist["trackCount"] = len(tracks)
 
         # suggestions and related are missing e.g. on liked songs
         section_list = nav(response, [*SINGLE_COLUMN_TAB, "sectionListRenderer"])
@@ -142,13 +183,12 @@ class PlaylistsMixin(MixinProtocol):
 
                 parse_func = lambda results: parse_playlist_items(results)
                 playlist["suggestions"].extend(
-                    await get_continuations(
+                    await get_reloadable_continuations(
                         suggestions_shelf,
                         "musicShelfContinuation",
                         suggestions_limit - len(playlist["suggestions"]),
                         request_func,
                         parse_func,
-                        reloadable=True,
                     )
                 )
 
@@ -161,25 +201,134 @@ class PlaylistsMixin(MixinProtocol):
                         nav(continuation, CONTENT + CAROUSEL), parse_func
                     )
 
-        playlist["tracks"] = []
+        playlist["tracks"] = CursorList()
         if "contents" in results:
-            playlist["tracks"] = parse_playlist_items(results["contents"])
+            cursor = get_continuation_cursor(
+                results,
+                "playlist_items",
+                endpoint,
+                body,
+                "musicPlaylistShelfContinuation",
+                fields=projection,
+                output=output,
+            )
+            playlist["tracks"] = CursorList(tracks, cursor)
 
-            parse_func = lambda contents: parse_playlist_items(contents)
+            parse_func = lambda contents: parse_playlist_items(contents, fields=projection, output=output)
             if "continuations" in results:
-                playlist["tracks"].extend(
+                playlist["tracks"].extend_continuation(
                     await get_continuations(
-                        results, "musicPlaylistShelfContinuation", limit, request_func, parse_func
+                        results,
+                        "musicPlaylistShelfContinuation",
+                        limit,
+                        request_func,
+                        parse_func,
+                        prefetch=self.prefetch_continuations,
+                        cursor=cursor,
                     )
                 )
 
         playlist["duration_seconds"] = sum_total_duration(playlist)
         return playlist
 
+    async def iter_playlist_tracks(
+        self, playlistId: str, limit: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the tracks of a playlist one by one, requesting further pages as they are consumed,
+        so arbitrarily long playlists can be processed with constant memory use.
+        Same format as the ``tracks`` of :py:func:`get_playlist`.
+
+        Example::
+
+            async for track in yt.iter_playlist_tracks("PLQwVIlKxHM6qv-o99iX9R85og7IzF9YS_"):
+                print(track["videoId"])
+
+        :param playlistId: Playlist id
+        :param limit: Maximum number of tracks to yield. Default: ``None``, yield all tracks.
+        :param fields: Fields of the tracks to return, see :py:func:`get_playlist`. Default: ``None``, all fields
+        """
+        projection = prepare_fields(fields)
+        browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
+        body = {"browseId": browseId}
+        endpoint = "browse"
+        response = await self._send_request(endpoint, body)
+
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents, fields=projection)
+        pages: AsyncGenerator[JsonList, None]
+        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"], True)
+        if results:
+            request_func: RequestFuncType = lambda additionalParams: self._send_request(
+                endpoint, body, additionalParams
+            )
+            pages = iter_continuations(
+                results,
+                "musicPlaylistShelfContinuation",
+                request_func,
+                parse_func,
+                prefetch=self.prefetch_continuations,
+            )
+        else:  # new playlist format and audio playlists
+            results = nav(
+                response,
+                [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION, *CONTENT, "musicPlaylistShelfRenderer"],
+            )
+            request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
+            pages = iter_continuations_2025(
+                results, request_func_continuations, parse_func, prefetch=self.prefetch_continuations
+            )
+
+        async with aclosing(iter_items(parse_func(results.get("contents", [])), pages, limit)) as tracks:
+            async for track in tracks:
+                yield track
+
+    def get_playlists(
+        self,
+        playlistIds: list[str],
+        limit: int | None = 100,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        concurrency: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> BulkRequest[JsonDict]:
+        """
+        Returns several playlists concurrently. See :py:func:`get_playlist`.
+
+        :param playlistIds: Playlist ids
+        :param limit: How many songs to return per playlist. ``None`` retrieves them all. Default: 100
+        :param related: Whether to fetch 10 related playlists or not. Default: False
+        :param suggestions_limit: How many suggestions to return per playlist. Default: 0
+        :param concurrency: Maximum number of concurrent requests for this batch.
+            Default: the ``bulk_concurrency`` of this instance
+        :param fields: Fields of the tracks to return, see :py:func:`get_playlist`. Default: ``None``, all fields
+        :return: :py:class:`BulkRequest`. Await it for a list of results in input order,
+            or iterate over it asynchronously for ``(index, result)`` tuples in completion order.
+            Items that failed are returned as the raised exception.
+        """
+        fields = None if fields is None else list(fields)
+        return self._bulk(
+            lambda playlistId: self.get_playlist(playlistId, limit, related, suggestions_limit, fields),
+            playlistIds,
+            concurrency,
+        )
+
     async def _parse_new_playlist_format(
-        self, response: dict, endpoint, body, suggestions_limit, related, limit
+        self,
+        response: dict,
+        endpoint,
+        body,
+        suggestions_limit,
+        related,
+        limit,
+        fields: FieldsType = None,
+        output: OutputType = "dicts",
+        tracks: list[Any] | None = None,
     ) -> dict:  # pragma: no cover
         """temporary function to avoid too many ifs in get_playlist during a/b test"""
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
 
         header_data = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM])
         section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
@@ -243,14 +392,32 @@ class PlaylistsMixin(MixinProtocol):
                         nav(continuation, CONTENT + CAROUSEL), parse_func
                     )
 
-        playlist["tracks"] = []
+        playlist["tracks"] = CursorList()
         content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
         if "contents" in content_data:
-            playlist["tracks"] = parse_playlist_items(content_data["contents"])
-
-            parse_func = lambda contents: parse_playlist_items(contents)
-            playlist["tracks"].extend(
-                await get_continuations_2025(content_data, limit, request_func_continuations, parse_func)
+            cursor = get_continuation_cursor(
+                content_data,
+                "playlist_items",
+                endpoint,
+                body,
+                CONTINUATION_2025,
+                fields=fields,
+                output=output,
+            )
+            if tracks is None:
+                tracks = parse_playlist_items(content_data["contents"], fields=fields, output=output)
+            playlist["tracks"] = CursorList(tracks, cursor)
+
+            parse_func = lambda contents: parse_playlist_items(contents, fields=fields, output=output)
+            playlist["tracks"].extend_continuation(
+                await get_continuations_2025(
+                    content_data,
+                    limit,
+                    request_func_continuations,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
+                )
             )
 
         playlist["duration_seconds"] = sum_total_duration(playlist)
@@ -373,6 +540,7 @@ class PlaylistsMixin(MixinProtocol):
         body["actions"] = actions
         endpoint = "browse/edit_playlist"
         response = await self._send_request(endpoint, body)
+        await self._invalidate("VL" + body["playlistId"])
         return response["status"] if "status" in response else response
 
     async def delete_playlist(self, playlistId: str) -> str | JsonDict:
@@ -386,6 +554,7 @@ class PlaylistsMixin(MixinProtocol):
         body = {"playlistId": validate_playlist_id(playlistId)}
         endpoint = "playlist/delete"
         response = await self._send_request(endpoint, body)
+        await self._invalidate("VL" + body["playlistId"])
         return response["status"] if "status" in response else response
 
     async def add_playlist_items(
@@ -428,6 +597,7 @@ class PlaylistsMixin(MixinProtocol):
 
         endpoint = "browse/edit_playlist"
         response = await self._send_request(endpoint, body)
+        await self._invalidate("VL" + body["playlistId"])
         if "status" in response and "SUCCEEDED" in response["status"]:
             result_dict = [
                 result_data.get("playlistEditVideoAddedResultData")
@@ -465,4 +635,5 @@ class PlaylistsMixin(MixinProtocol):
 
         endpoint = "browse/edit_playlist"
         response = await self._send_request(endpoint, body)
+        await self._invalidate("VL" + body["playlistId"])
         return response["status"] if "status" in response else response
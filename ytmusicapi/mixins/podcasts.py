@@ -1,10 +1,9 @@
 from ytmusicapi.continuations import *
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.navigation import *
-from ytmusicapi.parsers.browsing import parse_content_list
 from ytmusicapi.parsers.playlists import parse_playlist_header
 from ytmusicapi.parsers.podcasts import *
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, OutputType, ParseFuncType, RequestFuncType
 
 from ._utils import *
 
@@ -79,22 +78,29 @@ class PodcastsMixin(MixinProtocol):
 
         return channel
 
-    async def get_channel_episodes(self, channelId: str, params: str) -> JsonList:
+    async def get_channel_episodes(
+        self, channelId: str, params: str, output: OutputType = "dicts"
+    ) -> JsonList:
         """
         Get all channel episodes. This endpoint is currently unlimited
 
         :param channelId: channelId of the user
         :param params: params obtained by :py:func:`get_channel`
+        :param output: Format of the episodes. ``models`` returns :py:class:`ytmusicapi.models.Episode` objects.
+            Default: ``dicts``
 
         :return: List of channel episodes in the format of :py:func:`get_channel` "episodes" key
         """
+        validate_output(output)
         body = {"browseId": channelId, "params": params}
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + GRID_ITEMS)
-        return parse_content_list(results, parse_episode, MMRIR)
+        return parse_episodes(results, output)
 
-    async def get_podcast(self, playlistId: str, limit: int | None = 100) -> JsonDict:
+    async def get_podcast(
+        self, playlistId: str, limit: int | None = 100, output: OutputType = "dicts"
+    ) -> JsonDict:
         """
         Returns podcast metadata and episodes
 
@@ -104,6 +110,8 @@ class PodcastsMixin(MixinProtocol):
 
         :param playlistId: Playlist id
         :param limit: How many songs to return. ``None`` retrieves them all. Default: 100
+        :param output: Format of the episodes. ``models`` returns :py:class:`ytmusicapi.models.Episode` objects.
+            Default: ``dicts``
         :return: Dict with podcast information
 
         Example::
@@ -133,6 +141,7 @@ class PodcastsMixin(MixinProtocol):
                 ]
             }
         """
+        validate_output(output)
         browseId = "MPSP" + playlistId if not playlistId.startswith("MPSP") else playlistId
         body = {"browseId": browseId}
         endpoint = "browse"
@@ -142,7 +151,7 @@ class PodcastsMixin(MixinProtocol):
         podcast: JsonDict = parse_podcast_header(header)
 
         results = nav(two_columns, ["secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
-        parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_episode, MMRIR)
+        parse_func: ParseFuncType = lambda contents: parse_episodes(contents, output)
         episodes = parse_func(results["contents"])
 
         if "continuations" in results:
@@ -152,7 +161,12 @@ class PodcastsMixin(MixinProtocol):
             remaining_limit = None if limit is None else (limit - len(episodes))
             episodes.extend(
                 await get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
                 )
             )
 
@@ -231,14 +245,19 @@ class PodcastsMixin(MixinProtocol):
 
         return episode
 
-    async def get_episodes_playlist(self, playlist_id: str = "RDPN") -> JsonDict:
+    async def get_episodes_playlist(
+        self, playlist_id: str = "RDPN", output: OutputType = "dicts"
+    ) -> JsonDict:
         """
         Get all episodes in an episodes playlist. Currently the only known playlist is the
         "New Episodes" auto-generated playlist
 
         :param playlist_id: Playlist ID, defaults to "RDPN", the id of the New Episodes playlist
+        :param output: Format of the episodes. ``models`` returns :py:class:`ytmusicapi.models.Episode` objects.
+            Default: ``dicts``
         :return: Dictionary in the format of :py:func:`get_podcast`
         """
+        validate_output(output)
         browseId = "VL" + playlist_id if not playlist_id.startswith("VL") else playlist_id
         body = {"browseId": browseId}
         endpoint = "browse"
@@ -246,7 +265,6 @@ class PodcastsMixin(MixinProtocol):
         playlist = parse_playlist_header(response)
 
         results = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
-        parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_episode, MMRIR)
-        playlist["episodes"] = parse_func(results["contents"])
+        playlist["episodes"] = parse_episodes(results["contents"], output)
 
         return playlist
@@ -1,8 +1,12 @@
-from ytmusicapi.continuations import get_continuations
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
+
+from ytmusicapi.continuations import CursorList, get_continuation_cursor, iter_continuations, iter_items
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.mixins._protocol import MixinProtocol
+from ytmusicapi.mixins._utils import prepare_fields
 from ytmusicapi.parsers.search import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import FieldsType, JsonDict, JsonList, ParseFuncType, RequestFuncType
 
 
 class SearchMixin(MixinProtocol):
@@ -13,6 +17,7 @@ class SearchMixin(MixinProtocol):
         scope: str | None = None,
         limit: int = 20,
         ignore_spelling: bool = False,
+        fields: Iterable[str] | None = None,
     ) -> JsonList:
         """
         Search YouTube music
@@ -32,10 +37,14 @@ class SearchMixin(MixinProtocol):
           If True, the exact search term will be searched for, and will not be corrected.
           This does not have any effect when the filter is set to ``uploads``.
           Default: False, will use YTM's default behavior of autocorrecting the search.
+        :param fields: Fields of the results to return, i.e. ``["resultType", "videoId", "title"]``.
+          Other fields are not parsed at all. Default: ``None``, all fields
         :return: List of results depending on filter.
           resultType specifies the type of item (important for default search).
           albums, artists and playlists additionally contain a browseId, corresponding to
-          albumId, channelId and playlistId (browseId=`VL`+playlistId)
+          albumId, channelId and playlistId (browseId=`VL`+playlistId).
+          With a filter, the ``cursor`` attribute of the list resumes the search after the
+          last result with :py:func:`resume`.
 
           Example list for default search with one result per resultType for brevity. Normally
           there are 3 results per resultType and an additional ``thumbnails`` key::
@@ -53,6 +62,7 @@ class SearchMixin(MixinProtocol):
                   }
                 ],
                 "views": "1.4M",
+                "views_count": 1400000,
                 "videoType": "MUSIC_VIDEO_TYPE_OMV",
                 "duration": "4:38",
                 "duration_seconds": 278
@@ -111,6 +121,7 @@ class SearchMixin(MixinProtocol):
                   }
                 ],
                 "views": "386M",
+                "views_count": 386000000,
                 "duration": "4:38",
                 "duration_seconds": 278
               },
@@ -134,9 +145,55 @@ class SearchMixin(MixinProtocol):
 
 
         """
+        search_results = CursorList()
+        pages = self._iter_search_pages(query, filter, scope, ignore_spelling, limit, prepare_fields(fields))
+        async with aclosing(pages):
+            async for page in pages:
+                search_results.extend_continuation(page)
+
+        return search_results
+
+    async def iter_search(
+        self,
+        query: str,
+        filter: str | None = None,
+        scope: str | None = None,
+        limit: int | None = None,
+        ignore_spelling: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Search YouTube music, yielding results one by one as they are retrieved.
+        See :py:func:`search` for the parameters and the result format.
+
+        :param limit: Maximum number of results to yield.
+          Default: ``None``, yield all results. With a filter, further pages are requested
+          while results are consumed, until the server returns no more results.
+
+        Example::
+
+            async for result in yt.iter_search("Oasis", filter="songs"):
+                ...
+        """
+        pages = self._iter_search_pages(query, filter, scope, ignore_spelling, None, prepare_fields(fields))
+        async with aclosing(iter_items([], pages, limit)) as results:
+            async for result in results:
+                yield result
+
+    async def _iter_search_pages(
+        self,
+        query: str,
+        filter: str | None,
+        scope: str | None,
+        ignore_spelling: bool,
+        limit: int | None,
+        fields: FieldsType = None,
+    ) -> AsyncGenerator[JsonList, None]:
+        """yields the parsed results of each shelf and of each continuation page.
+        With a limit, continuations are requested only until limit results were yielded"""
         body = {"query": query}
         endpoint = "search"
-        search_results: JsonList = []
+        count = 0
         filters = [
             "albums",
             "artists",
@@ -183,7 +240,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if "contents" not in response:
-            return search_results
+            return
 
         if "tabbedSearchResultsRenderer" in response["contents"]:
             tab_index = 0 if not scope or filter else scopes.index(scope) + 1
@@ -197,7 +254,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if len(section_list) == 1 and "itemSectionRenderer" in section_list:
-            return search_results
+            return
 
         # set filter for parser
         result_type = None
@@ -207,19 +264,25 @@ class SearchMixin(MixinProtocol):
             filter = scopes[1]
             result_type = scopes[1][:-1]
 
+        number_format = self.parser.tables.number_format
         for res in section_list:
             category = None
 
             if "musicCardShelfRenderer" in res:
                 top_result = parse_top_result(
-                    res["musicCardShelfRenderer"], self.parser.get_search_result_types()
+                    res["musicCardShelfRenderer"],
+                    self.parser.get_search_result_types(),
+                    fields,
+                    number_format,
                 )
-                search_results.append(top_result)
+                count += 1
+                yield [top_result]
                 if not (shelf_contents := nav(res, ["musicCardShelfRenderer", "contents"], True)):
                     continue
                 # if "more from youtube" is present, remove it - it's not parseable
                 if "messageRenderer" in shelf_contents[0]:
-                    category = nav(shelf_contents.pop(0), ["messageRenderer", *TEXT_RUN_TEXT])
+                    category = nav(shelf_contents[0], ["messageRenderer", *TEXT_RUN_TEXT])
+                    shelf_contents = shelf_contents[1:]
 
             elif "musicShelfRenderer" in res:
                 shelf_contents = res["musicShelfRenderer"]["contents"]
@@ -236,29 +299,46 @@ class SearchMixin(MixinProtocol):
 
             api_search_result_types = self.parser.get_api_result_types()
 
-            search_results.extend(
-                parse_search_results(shelf_contents, api_search_result_types, result_type, category)
+            page = parse_search_results(
+                shelf_contents, api_search_result_types, result_type, category, fields, number_format
             )
+            count += len(page)
+            cursor = None
+            if filter and "musicShelfRenderer" in res:
+                cursor = get_continuation_cursor(
+                    res["musicShelfRenderer"],
+                    "search_results",
+                    endpoint,
+                    body,
+                    "musicShelfContinuation",
+                    params={"resultType": result_type, "category": category},
+                    fields=fields,
+                )
+                page = CursorList(page, cursor)
+            yield page
 
-            if filter:  # if filter is set, there are continuations
-                request_func: RequestFuncType = lambda additionalParams: (await self._send_request(
+            # if filter is set, there are continuations
+            if cursor is not None and (limit is None or count < limit):
+                request_func: RequestFuncType = lambda additionalParams: self._send_request(
                     endpoint, body, additionalParams
-                ) for _ in '_').__anext__()
+                )
                 parse_func: ParseFuncType = lambda contents: parse_search_results(
-                    contents, api_search_result_types, result_type, category
+                    contents, api_search_result_types, result_type, category, fields, number_format
                 )
-
-                search_results.extend(
-                    await get_continuations(
-                        res["musicShelfRenderer"],
-                        "musicShelfContinuation",
-                        limit - len(search_results),
-                        request_func,
-                        parse_func,
-                    )
+                continuation_pages = iter_continuations(
+                    res["musicShelfRenderer"],
+                    "musicShelfContinuation",
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
                 )
-
-        return search_results
+                async with aclosing(continuation_pages):
+                    async for page in continuation_pages:
+                        count += len(page)
+                        yield page
+                        if limit is not None and count >= limit:
+                            break
 
     async def get_search_suggestions(self, query: str, detailed_runs: bool = False) -> list[str] | JsonList:
         """
@@ -1,9 +1,17 @@
 import typing
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from pathlib import Path
 
 from aiohttp import ClientSession, ClientResponse
 
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import (
+    CursorList,
+    get_continuation_cursor,
+    get_continuations,
+    iter_continuations,
+    iter_items,
+)
 from ytmusicapi.helpers import *
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.albums import parse_album_header
@@ -11,7 +19,7 @@ from ytmusicapi.parsers.library import (
     get_library_contents,
     parse_library_albums,
     parse_library_artists,
-    pop_songs_random_mix,
+    skip_songs_random_mix,
 )
 from ytmusicapi.parsers.uploads import parse_uploaded_items
 from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
@@ -32,7 +40,7 @@ class UploadsMixin(MixinProtocol):
 
         :param limit: How many songs to return. ``None`` retrieves them all. Default: 25
         :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
-        :return: List of uploaded songs.
+        :return: List of uploaded songs. Its ``cursor`` attribute resumes after the last song with :py:func:`resume`.
 
         Each item is in the following format::
 
@@ -59,22 +67,61 @@ class UploadsMixin(MixinProtocol):
         results = get_library_contents(response, MUSIC_SHELF)
         if results is None:
             return []
-        pop_songs_random_mix(results)
-        songs: JsonList = parse_uploaded_items(results["contents"])
+        cursor = get_continuation_cursor(results, "uploaded_items", endpoint, body, "musicShelfContinuation")
+        songs = CursorList(parse_uploaded_items(skip_songs_random_mix(results)), cursor)
 
         if "continuations" in results:
             request_func: RequestFuncType = lambda additionalParams: self._send_request(
                 endpoint, body, additionalParams
             )
             remaining_limit = None if limit is None else (limit - len(songs))
-            songs.extend(
+            songs.extend_continuation(
                 await get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_uploaded_items,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
                 )
             )
 
         return songs
 
+    async def iter_library_upload_songs(
+        self, limit: int | None = None, order: LibraryOrderType | None = None
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields uploaded songs one by one, requesting further pages as they are consumed.
+        Same format as :py:func:`get_library_upload_songs`.
+
+        :param limit: Maximum number of songs to yield. Default: ``None``, yield all songs.
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        """
+        self._check_auth()
+        endpoint = "browse"
+        body = {"browseId": "FEmusic_library_privately_owned_tracks"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        response = await self._send_request(endpoint, body)
+        results = get_library_contents(response, MUSIC_SHELF)
+        if results is None:
+            return
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_uploaded_items(contents)
+        pages = iter_continuations(
+            results, "musicShelfContinuation", request_func, parse_func, prefetch=self.prefetch_continuations
+        )
+        first_page = parse_uploaded_items(skip_songs_random_mix(results))
+        async with aclosing(iter_items(first_page, pages, limit)) as songs:
+            async for song in songs:
+                yield song
+
     async def get_library_upload_albums(
         self, limit: int | None = 25, order: LibraryOrderType | None = None
     ) -> JsonList:
@@ -93,7 +140,11 @@ class UploadsMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_albums(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
         )
 
     async def get_library_upload_artists(
@@ -114,7 +165,11 @@ class UploadsMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         return await parse_library_artists(
-            response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
+            response,
+            lambda additionalParams: self._send_request(endpoint, body, additionalParams),
+            limit,
+            prefetch=self.prefetch_continuations,
+            body=body,
         )
 
     async def get_library_upload_artist(self, browseId: str, limit: int = 25) -> JsonList:
@@ -149,10 +204,9 @@ class UploadsMixin(MixinProtocol):
         endpoint = "browse"
         response = await self._send_request(endpoint, body)
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + MUSIC_SHELF)
-        if len(results["contents"]) > 1:
-            results["contents"].pop(0)
-
-        items = parse_uploaded_items(results["contents"])
+        contents = results["contents"]
+        cursor = get_continuation_cursor(results, "uploaded_items", endpoint, body, "musicShelfContinuation")
+        items = CursorList(parse_uploaded_items(contents[1:] if len(contents) > 1 else contents), cursor)
 
         if "continuations" in results:
             request_func: RequestFuncType = lambda additionalParams: self._send_request(
@@ -160,9 +214,15 @@ class UploadsMixin(MixinProtocol):
             )
             parse_func: ParseFuncType = lambda contents: parse_uploaded_items(contents)
             remaining_limit = None if limit is None else (limit - len(items))
-            items.extend(
+            items.extend_continuation(
                 await get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
                 )
             )
 
@@ -1,9 +1,18 @@
-from ytmusicapi.continuations import get_continuations
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+
+from ytmusicapi.continuations import (
+    CursorList,
+    get_continuation_cursor,
+    get_continuations,
+    iter_continuations,
+    iter_items,
+)
 from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.parsers.playlists import validate_playlist_id
 from ytmusicapi.parsers.watch import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
 
 
 class WatchMixin(MixinProtocol):
@@ -31,7 +40,7 @@ class WatchMixin(MixinProtocol):
             is set at the same time. does not work if radio=True
         :return: List of watch playlist items. The counterpart key is optional and only
             appears if a song has a corresponding video counterpart (UI song/video
-            switcher).
+            switcher). The ``cursor`` attribute of ``tracks`` continues the list with :py:func:`resume`.
 
         Example::
 
@@ -103,6 +112,87 @@ class WatchMixin(MixinProtocol):
             }
 
         """
+        body, is_playlist, watchNextRenderer, results = await self._get_playlist_panel(
+            videoId, playlistId, radio, shuffle
+        )
+        endpoint = "next"
+
+        lyrics_browse_id = get_tab_browse_id(watchNextRenderer, 1)
+        related_browse_id = get_tab_browse_id(watchNextRenderer, 2)
+
+        playlist = next(
+            filter(
+                bool,
+                map(
+                    lambda x: nav(x, ["playlistPanelVideoRenderer", *NAVIGATION_PLAYLIST_ID], True),
+                    results["contents"],
+                ),
+            ),
+            None,
+        )
+        ctoken_path = "" if is_playlist else "Radio"
+        cursor = get_continuation_cursor(
+            results, "watch_playlist", endpoint, body, "playlistPanelContinuation", ctoken_path
+        )
+        tracks = CursorList(parse_watch_playlist(results["contents"]), cursor)
+
+        if "continuations" in results:
+            request_func: RequestFuncType = lambda additionalParams: self._send_request(
+                endpoint, body, additionalParams
+            )
+            parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
+            tracks.extend_continuation(
+                await get_continuations(
+                    results,
+                    "playlistPanelContinuation",
+                    limit - len(tracks),
+                    request_func,
+                    parse_func,
+                    ctoken_path,
+                    prefetch=self.prefetch_continuations,
+                    cursor=cursor,
+                )
+            )
+
+        return dict(tracks=tracks, playlistId=playlist, lyrics=lyrics_browse_id, related=related_browse_id)
+
+    async def iter_watch_playlist(
+        self,
+        videoId: str | None = None,
+        playlistId: str | None = None,
+        limit: int | None = None,
+        radio: bool = False,
+        shuffle: bool = False,
+    ) -> AsyncGenerator[JsonDict, None]:
+        """
+        Yields the tracks of a watch list one by one, requesting further pages as they are consumed.
+        See :py:func:`get_watch_playlist` for the parameters and the track format.
+
+        :param limit: Maximum number of tracks to yield. Default: ``None``, yield all tracks.
+            Radio playlists are endless, so set a limit or stop iterating when done.
+        """
+        body, is_playlist, _, results = await self._get_playlist_panel(videoId, playlistId, radio, shuffle)
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            "next", body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
+        pages = iter_continuations(
+            results,
+            "playlistPanelContinuation",
+            request_func,
+            parse_func,
+            "" if is_playlist else "Radio",
+            prefetch=self.prefetch_continuations,
+        )
+        async with aclosing(iter_items(parse_watch_playlist(results["contents"]), pages, limit)) as tracks:
+            async for track in tracks:
+                yield track
+
+    async def _get_playlist_panel(
+        self, videoId: str | None, playlistId: str | None, radio: bool, shuffle: bool
+    ) -> tuple[JsonDict, bool, JsonDict, JsonDict]:
+        """returns the request body, whether it is a regular playlist,
+        the watch next renderer and the playlist panel of a watch playlist"""
         body = {
             "enablePersistentPlaylistPanel": True,
             "isAudioOnly": True,
@@ -133,7 +223,7 @@ class WatchMixin(MixinProtocol):
             body["params"] = "wAEB"
         endpoint = "next"
         response = await self._send_request(endpoint, body)
-        watchNextRenderer = nav(
+        watch_next_renderer = nav(
             response,
             [
                 "contents",
@@ -143,11 +233,10 @@ class WatchMixin(MixinProtocol):
             ],
         )
 
-        lyrics_browse_id = get_tab_browse_id(watchNextRenderer, 1)
-        related_browse_id = get_tab_browse_id(watchNextRenderer, 2)
-
         results = nav(
-            watchNextRenderer, [*TAB_CONTENT, "musicQueueRenderer", "content", "playlistPanelRenderer"], True
+            watch_next_renderer,
+            [*TAB_CONTENT, "musicQueueRenderer", "content", "playlistPanelRenderer"],
+            True,
         )
         if not results:
             msg = "No content returned by the server."
@@ -155,32 +244,4 @@ class WatchMixin(MixinProtocol):
                 msg += f"\nEnsure you have access to {playlistId} - a private playlist may cause this."
             raise YTMusicServerError(msg)
 
-        playlist = next(
-            filter(
-                bool,
-                map(
-                    lambda x: nav(x, ["playlistPanelVideoRenderer", *NAVIGATION_PLAYLIST_ID], True),
-                    results["contents"],
-                ),
-            ),
-            None,
-        )
-        tracks = parse_watch_playlist(results["contents"])
-
-        if "continuations" in results:
-            request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
-            tracks.extend(
-                await get_continuations(
-                    results,
-                    "playlistPanelContinuation",
-                    limit - len(tracks),
-                    request_func,
-                    parse_func,
-                    "" if is_playlist else "Radio",
-                )
-            )
-
-        return dict(tracks=tracks, playlistId=playlist, lyrics=lyrics_browse_id, related=related_browse_id)
+        return body, is_playlist, watch_next_renderer, results
@@ -1,3 +1,14 @@
 from .lyrics import LyricLine, Lyrics, TimedLyrics
+from .results import Album, Artist, Episode, Playlist, Thumbnail, Track
 
-__all__ = ["LyricLine", "Lyrics", "TimedLyrics"]
+__all__ = [
+    "Album",
+    "Artist",
+    "Episode",
+    "LyricLine",
+    "Lyrics",
+    "Playlist",
+    "Thumbnail",
+    "TimedLyrics",
+    "Track",
+]
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+
+from ytmusicapi.type_alias import JsonDict, JsonList
+
+
+@dataclass(slots=True)
+class Thumbnail:
+    """A thumbnail image in one of the sizes provided by the api."""
+
+    url: str
+    width: int
+    height: int
+
+    @classmethod
+    def from_raw(cls, raw_thumbnail: JsonDict) -> "Thumbnail":
+        return cls(raw_thumbnail["url"], raw_thumbnail["width"], raw_thumbnail["height"])
+
+
+def parse_thumbnails(raw_thumbnails: JsonList | None) -> list[Thumbnail] | None:
+    """Converts a thumbnail list returned by the api, None if it is absent"""
+    if raw_thumbnails is None:
+        return None
+    return [Thumbnail.from_raw(thumbnail) for thumbnail in raw_thumbnails]
+
+
+@dataclass(slots=True)
+class Artist:
+    """An artist or channel. Referenced artists of tracks and albums only have ``name`` and ``id``.
+
+    :param name: Name of the artist. ``artist`` in the dict format of library artists.
+    :param id: Channel id or browseId. ``browseId`` in the dict format of library artists.
+    """
+
+    name: str | None
+    id: str | None = None
+    type: str | None = None
+    subscribers: str | None = None
+    subscribers_count: int | None = None
+    shuffleId: str | None = None
+    radioId: str | None = None
+    thumbnails: list[Thumbnail] | None = None
+
+
+@dataclass(slots=True)
+class Album:
+    """An album. Referenced albums of tracks only have ``name`` and ``id``.
+
+    :param name: Title of the album. ``title`` in the dict format of library albums.
+    :param id: browseId of the album. ``browseId`` in the dict format of library albums.
+    """
+
+    name: str | None
+    id: str | None = None
+    playlistId: str | None = None
+    type: str | None = None
+    artists: list[Artist] | None = None
+    year: str | None = None
+    thumbnails: list[Thumbnail] | None = None
+
+
+@dataclass(slots=True)
+class Playlist:
+    """A playlist of the library.
+
+    :param name: Title of the playlist. ``title`` in the dict format of library playlists.
+    :param id: playlistId of the playlist. ``playlistId`` in the dict format of library playlists.
+    """
+
+    name: str | None
+    id: str | None = None
+    description: str | None = None
+    count: str | None = None
+    author: list[Artist] | None = None
+    thumbnails: list[Thumbnail] | None = None
+
+
+@dataclass(slots=True)
+class Episode:
+    """An episode of a podcast, channel or episodes playlist. Same fields as the dict format."""
+
+    videoId: str | None = None
+    browseId: str | None = None
+    title: str | None = None
+    description: str | None = None
+    duration: str | None = None
+    date: str | None = None
+    index: int | None = None
+    videoType: str | None = None
+    thumbnails: list[Thumbnail] | None = None
+
+
+@dataclass(slots=True)
+class Track:
+    """A song, video or episode of a playlist, album or library. Same fields as the dict format."""
+
+    videoId: str | None = None
+    title: str | None = None
+    artists: list[Artist] | None = None
+    album: Album | None = None
+    likeStatus: str | None = None
+    inLibrary: bool | None = None
+    thumbnails: list[Thumbnail] | None = None
+    isAvailable: bool | None = None
+    isExplicit: bool | None = None
+    videoType: str | None = None
+    views: str | None = None
+    views_count: int | None = None
+    duration: str | None = None
+    duration_seconds: int | None = None
+    setVideoId: str | None = None
+    feedbackTokens: JsonDict | None = None
+    trackNumber: int | None = None
@@ -1,5 +1,6 @@
 """commonly used navigation paths"""
 
+import reprlib
 from typing import Any, Literal, overload
 
 from ytmusicapi.type_alias import JsonDict, JsonList
@@ -102,6 +103,16 @@ TIMESTAMPED_LYRICS = [
 ]
 
 
+#: truncated repr of the node lacking a key in the message of a failed :py:func:`nav`,
+#: so a miss on a large response does not serialize the whole response
+_nav_repr = reprlib.Repr()
+_nav_repr.maxlevel = 2
+_nav_repr.maxdict = 8
+_nav_repr.maxlist = 4
+_nav_repr.maxstring = 60
+_nav_repr.maxother = 60
+
+
 @overload
 def nav(root: JsonDict | None, items: list[Any], none_if_absent: Literal[False] = False) -> Any:
     """overload for mypy only"""
@@ -122,7 +133,7 @@ def nav(root: JsonDict | None, items: list[Any], none_if_absent: bool = False) -
     except (KeyError, IndexError) as e:
         if none_if_absent:
             return None
-        raise type(e)(f"Unable to find '{k}' using path {items!r} on {root!r}, exception: {e}")
+        raise type(e)(f"Unable to find '{k}' using path {items!r} on {_nav_repr.repr(root)}, exception: {e}")
     return root
 
 
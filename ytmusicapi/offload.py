@@ -0,0 +1,101 @@
+"""offloading of CPU-bound decoding and parsing of large responses, and event loop lag metrics"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, TypeVar
+
+from ytmusicapi.json_backend import JsonBackendName, get_json_backend
+
+T = TypeVar("T")
+
+
+def decode_and_parse(raw: bytes, parse: Callable[[Any], T], json_backend: JsonBackendName = "json") -> T:
+    """
+    Decodes and parses a response in one step, so a worker process only sends back the parsed result,
+    which is much smaller than the decoded response.
+    """
+    return parse(get_json_backend(json_backend).loads(raw))
+
+
+async def run_offloaded(executor: Executor | None, func: Callable[..., T], *args: Any) -> T:
+    """
+    Runs ``func(*args)`` in the executor, so the event loop keeps serving other coroutines.
+
+    :param executor: a thread or process pool, None for the default executor of the event loop.
+        Process pools require ``func``, its arguments and its result to be picklable.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+
+class LoopLagMonitor:
+    """
+    Measures the lag of the event loop, i.e. how late a coroutine sleeping for ``interval`` seconds is woken up.
+    A high lag means that the loop was blocked, i.e. by decoding or parsing a large response.
+
+    Example::
+
+        from ytmusicapi.offload import LoopLagMonitor
+
+        monitor = LoopLagMonitor()
+        monitor.start()
+        await yt.get_playlist(playlistId, limit=None)
+        await monitor.stop()
+        print(monitor.stats())
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """
+        :param interval: seconds between two samples. Default: 0.001
+        """
+        self.interval = interval
+        #: lag of each sample in seconds
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Starts sampling on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._sample())
+
+    async def stop(self) -> None:
+        """Stops sampling. The samples are kept until :py:func:`reset`"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+    def stats(self) -> dict[str, float]:
+        """
+        Returns the number of samples and the mean, 99th percentile and maximum lag in milliseconds
+
+        Example::
+
+            {"samples": 1022, "mean_ms": 0.08, "p99_ms": 0.51, "max_ms": 24.7}
+        """
+        if not self.samples:
+            return {"samples": 0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "mean_ms": sum(ordered) / len(ordered) * 1000,
+            "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.perf_counter()
+            try:
+                await asyncio.sleep(self.interval)
+            finally:
+                # also records the sample cancelled by stop(), which may have been blocked the longest
+                self.samples.append(max(0.0, time.perf_counter() - start - self.interval))
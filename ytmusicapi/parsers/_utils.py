@@ -1,17 +1,19 @@
 import typing
-from collections.abc import Callable
-from functools import wraps
-from gettext import GNUTranslations
-from typing import ParamSpec, TypeVar
 
 from ytmusicapi.navigation import *
-from ytmusicapi.type_alias import JsonDict, JsonList
+from ytmusicapi.type_alias import FieldsType, JsonDict, JsonList
 
-P = ParamSpec("P")
-R = TypeVar("R")
 
-if typing.TYPE_CHECKING:
-    pass
+def wants(fields: FieldsType, *names: str) -> bool:
+    """True if any of the result fields ``names`` is requested"""
+    return fields is None or not fields.isdisjoint(names)
+
+
+def project(result: JsonDict, fields: FieldsType) -> JsonDict:
+    """removes the fields from a parsed result which were not requested"""
+    if fields is None:
+        return result
+    return {key: value for key, value in result.items() if key in fields}
 
 
 def parse_menu_playlists(data: JsonDict, result: JsonDict) -> None:
@@ -95,20 +97,6 @@ def parse_duration(duration: str | None) -> int | None:
     return seconds
 
 
-class SupportsLang(typing.Protocol):
-    lang: GNUTranslations
-
-
-def i18n(method: Callable[P, R]) -> Callable[P, R]:
-    @wraps(method)
-    def _impl(*args: P.args, **kwargs: P.kwargs) -> R:
-        self = args[0]
-        method.__globals__["_"] = self.lang.gettext  # type: ignore
-        return method(*args, **kwargs)
-
-    return _impl
-
-
 def parse_id_name(sub_run: JsonDict | None) -> JsonDict:
     return {
         "id": nav(sub_run, NAVIGATION_BROWSE_ID, True),
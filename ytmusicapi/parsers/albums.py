@@ -1,7 +1,11 @@
-from ytmusicapi.helpers import to_int
-from ytmusicapi.type_alias import JsonDict
+from ytmusicapi.helpers import sum_total_duration, to_int
+from ytmusicapi.models.results import Album, Artist
+from ytmusicapi.type_alias import FieldsType, JsonDict, OutputType
 
 from ._utils import *
+from .browsing import parse_album, parse_content_list
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat
+from .playlists import parse_playlist_items
 from .podcasts import parse_base_header
 from .songs import parse_like_status, parse_song_runs
 
@@ -85,3 +89,47 @@ def parse_album_header_2024(response: JsonDict) -> JsonDict:
         album["likeStatus"] = parse_like_status(service)
 
     return album
+
+
+def parse_album_response(
+    response: JsonDict,
+    browse_id: str,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> JsonDict:
+    """
+    Parses an album page, see :py:func:`ytmusicapi.YTMusic.get_album`
+
+    :param number_format: format of the play counts of the tracks of the language of the response
+    """
+    album: JsonDict = parse_album_header_2024(response)
+
+    results = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
+    album["tracks"] = parse_playlist_items(
+        results["contents"], is_album=True, fields=fields, output=output, number_format=number_format
+    )
+
+    other_versions = nav(
+        response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST, 1, *CAROUSEL], True
+    )
+    if other_versions is not None:
+        album["other_versions"] = parse_content_list(other_versions["contents"], parse_album)
+    album["duration_seconds"] = sum_total_duration(album)
+    if output == "models":
+        album_ref = Album(album["title"], browse_id)
+        album_artists = [Artist(artist["name"], artist["id"]) for artist in album["artists"] or []]
+        for track in album["tracks"]:
+            if wants(fields, "album"):
+                track.album = album_ref
+            if wants(fields, "artists"):
+                track.artists = track.artists or album_artists
+        return album
+
+    for track in album["tracks"]:
+        if wants(fields, "album"):
+            track["album"] = album["title"]
+        if wants(fields, "artists"):
+            track["artists"] = track["artists"] or album["artists"]
+
+    return album
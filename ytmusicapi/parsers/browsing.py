@@ -1,12 +1,25 @@
 import re
+from typing import TYPE_CHECKING
 
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncDictType
+from ytmusicapi.lazy import LazyList
+from ytmusicapi.type_alias import FieldsType, JsonDict, JsonList, ParseFuncDictType
 
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat, parse_count
+from .playlists import parse_playlist_items
 from .podcasts import parse_episode, parse_podcast
 from .songs import *
 
+if TYPE_CHECKING:
+    from .i18n import Parser
 
-def parse_mixed_content(rows: JsonList) -> JsonList:
+#: renderers of the items of a mixed content carousel
+MIXED_CONTENT_RENDERERS = (MTRIR, MRLIR, MMRIR)
+
+
+def parse_mixed_content(rows: JsonList, lazy: bool = False) -> JsonList:
+    """
+    :param lazy: return the contents of each row as :py:class:`LazyList`, which parses items on first access
+    """
     items = []
     for row in rows:
         if DESCRIPTION_SHELF[0] in row:
@@ -18,42 +31,47 @@ def parse_mixed_content(rows: JsonList) -> JsonList:
             if "contents" not in results:
                 continue
             title = nav(results, [*CAROUSEL_TITLE, "text"])
-            contents = []
-            for result in results["contents"]:
-                data = nav(result, [MTRIR], True)
-                content = None
-                if data:
-                    page_type = nav(data, TITLE + NAVIGATION_BROWSE + PAGE_TYPE, True)
-                    if page_type is None:  # song or watch_playlist
-                        if nav(data, NAVIGATION_WATCH_PLAYLIST_ID, True) is not None:
-                            content = parse_watch_playlist(data)
-                        else:
-                            content = parse_song(data)
-                    elif page_type == "MUSIC_PAGE_TYPE_ALBUM":
-                        content = parse_album(data)
-                    elif page_type == "MUSIC_PAGE_TYPE_ARTIST":
-                        content = parse_related_artist(data)
-                    elif page_type == "MUSIC_PAGE_TYPE_PLAYLIST":
-                        content = parse_playlist(data)
-                    elif page_type == "MUSIC_PAGE_TYPE_PODCAST_SHOW_DETAIL_PAGE":
-                        content = parse_podcast(data)
-                elif data := nav(result, [MRLIR], True):
-                    content = parse_song_flat(data)
-                elif data := nav(result, [MMRIR], True):
-                    content = parse_episode(data)
-                else:
-                    continue
-
-                contents.append(content)
+            results = [
+                result
+                for result in results["contents"]
+                if any(renderer in result for renderer in MIXED_CONTENT_RENDERERS)
+            ]
+            contents = LazyList(results, parse_mixed_item) if lazy else [parse_mixed_item(r) for r in results]
 
         items.append({"title": title, "contents": contents})
     return items
 
 
-def parse_content_list(results: JsonList, parse_func: ParseFuncDictType, key: str = MTRIR) -> JsonList:
+def parse_mixed_item(result: JsonDict) -> JsonDict | None:
+    """Parses a single item of a mixed content carousel, None for unknown item types"""
+    if data := result.get(MTRIR):
+        page_type = nav(data, TITLE + NAVIGATION_BROWSE + PAGE_TYPE, True)
+        if page_type is None:  # song or watch_playlist
+            if nav(data, NAVIGATION_WATCH_PLAYLIST_ID, True) is not None:
+                return parse_watch_playlist(data)
+            return parse_song(data)
+        elif page_type == "MUSIC_PAGE_TYPE_ALBUM":
+            return parse_album(data)
+        elif page_type == "MUSIC_PAGE_TYPE_ARTIST":
+            return parse_related_artist(data)
+        elif page_type == "MUSIC_PAGE_TYPE_PLAYLIST":
+            return parse_playlist(data)
+        elif page_type == "MUSIC_PAGE_TYPE_PODCAST_SHOW_DETAIL_PAGE":
+            return parse_podcast(data)
+        return None
+    elif data := result.get(MRLIR):
+        return parse_song_flat(data)
+    elif data := result.get(MMRIR):
+        return parse_episode(data)
+    return None
+
+
+def parse_content_list(
+    results: JsonList, parse_func: ParseFuncDictType, key: str = MTRIR, fields: FieldsType = None
+) -> JsonList:
     contents = []
     for result in results:
-        contents.append(parse_func(result[key]))
+        contents.append(project(parse_func(result[key]), fields))
 
     return contents
 
@@ -115,7 +133,7 @@ def parse_song_flat(data: JsonDict) -> JsonDict:
     return song
 
 
-def parse_video(result: JsonDict) -> JsonDict:
+def parse_video(result: JsonDict, number_format: NumberFormat = DEFAULT_NUMBER_FORMAT) -> JsonDict:
     runs = nav(result, SUBTITLE_RUNS)
     artists_len = get_dot_separator_index(runs)
     videoId = nav(result, NAVIGATION_VIDEO_ID, True)
@@ -132,6 +150,7 @@ def parse_video(result: JsonDict) -> JsonDict:
         "playlistId": nav(result, NAVIGATION_PLAYLIST_ID, True),
         "thumbnails": nav(result, THUMBNAIL_RENDERER, True),
         "views": runs[-1]["text"].split(" ")[0],
+        "views_count": parse_count(runs[-1]["text"], number_format),
     }
 
 
@@ -151,14 +170,14 @@ def parse_playlist(data: JsonDict) -> JsonDict:
     return playlist
 
 
-def parse_related_artist(data: JsonDict) -> JsonDict:
-    subscribers = nav(data, SUBTITLE, True)
-    if subscribers:
-        subscribers = subscribers.split(" ")[0]
+def parse_related_artist(data: JsonDict, number_format: NumberFormat = DEFAULT_NUMBER_FORMAT) -> JsonDict:
+    subtitle = nav(data, SUBTITLE, True)
+    subscribers = subtitle.split(" ")[0] if subtitle else subtitle
     return {
         "title": nav(data, TITLE_TEXT),
         "browseId": nav(data, TITLE + NAVIGATION_BROWSE_ID),
         "subscribers": subscribers,
+        "subscribers_count": parse_count(subtitle, number_format),
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
 
@@ -169,3 +188,41 @@ def parse_watch_playlist(data: JsonDict) -> JsonDict:
         "playlistId": nav(data, NAVIGATION_WATCH_PLAYLIST_ID),
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
+
+
+def parse_artist(response: JsonDict, parser: "Parser", lazy: bool = False) -> JsonDict:
+    """
+    Parses the channel page of an artist, see :py:func:`ytmusicapi.YTMusic.get_artist`
+
+    :param parser: parser of the localized carousel titles of the language of the response
+    :param lazy: return the results of the carousels as :py:class:`LazyList`
+    """
+    results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+
+    artist: JsonDict = {"description": None, "views": None}
+    header = response["header"]["musicImmersiveHeaderRenderer"]
+    artist["name"] = nav(header, TITLE_TEXT)
+    descriptionShelf = find_object_by_key(results, DESCRIPTION_SHELF[0], is_key=True)
+    if descriptionShelf:
+        artist["description"] = nav(descriptionShelf, DESCRIPTION)
+        artist["views"] = (
+            None if "subheader" not in descriptionShelf else descriptionShelf["subheader"]["runs"][0]["text"]
+        )
+    subscription_button = header["subscriptionButton"]["subscribeButtonRenderer"]
+    artist["channelId"] = subscription_button["channelId"]
+    artist["shuffleId"] = nav(header, ["playButton", "buttonRenderer", *NAVIGATION_PLAYLIST_ID], True)
+    artist["radioId"] = nav(header, ["startRadioButton", "buttonRenderer", *NAVIGATION_PLAYLIST_ID], True)
+    artist["subscribers"] = nav(subscription_button, ["subscriberCountText", "runs", 0, "text"], True)
+    artist["subscribed"] = subscription_button["subscribed"]
+    artist["thumbnails"] = nav(header, THUMBNAILS, True)
+    artist["songs"] = {"browseId": None}
+    if "musicShelfRenderer" in results[0]:  # API sometimes does not return songs
+        musicShelf = nav(results[0], MUSIC_SHELF)
+        if "navigationEndpoint" in nav(musicShelf, TITLE):
+            artist["songs"]["browseId"] = nav(musicShelf, TITLE + NAVIGATION_BROWSE_ID)
+        artist["songs"]["results"] = parse_playlist_items(musicShelf["contents"])
+
+    artist["views_count"] = parser.parse_count(artist["views"])
+    artist["subscribers_count"] = parser.parse_count(artist["subscribers"])
+    artist.update(parser.parse_channel_contents(results, lazy))
+    return artist
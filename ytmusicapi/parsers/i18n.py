@@ -1,6 +1,12 @@
+import gettext
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cache, cached_property, partial
 from gettext import GNUTranslations
-from gettext import gettext as _
+from pathlib import Path
+from types import MappingProxyType
 
+from ytmusicapi.lazy import LazyList
 from ytmusicapi.navigation import (
     CAROUSEL,
     CAROUSEL_TITLE,
@@ -10,7 +16,6 @@ from ytmusicapi.navigation import (
     NAVIGATION_BROWSE_ID,
     nav,
 )
-from ytmusicapi.parsers._utils import i18n
 from ytmusicapi.parsers.browsing import (
     parse_album,
     parse_content_list,
@@ -19,66 +24,160 @@ from ytmusicapi.parsers.browsing import (
     parse_single,
     parse_video,
 )
+from ytmusicapi.parsers.numbers import NUMBER_FORMATS, NumberFormat, parse_count
 from ytmusicapi.parsers.podcasts import parse_episode, parse_podcast
-from ytmusicapi.type_alias import JsonDict, JsonList
+from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncDictType
+
+#: result keys of the carousels on channel pages, with the parser and renderer of their items
+CHANNEL_CATEGORIES: list[tuple[str, ParseFuncDictType, str]] = [
+    ("albums", parse_album, MTRIR),
+    ("singles", parse_single, MTRIR),
+    ("shows", parse_album, MTRIR),
+    ("videos", parse_video, MTRIR),
+    ("playlists", parse_playlist, MTRIR),
+    ("related", parse_related_artist, MTRIR),
+    ("episodes", parse_episode, MMRIR),
+    ("podcasts", parse_podcast, MTRIR),
+]
+
+#: parsers of CHANNEL_CATEGORIES which parse localized counts with the ``number_format`` of the language
+COUNTED_PARSERS: frozenset[ParseFuncDictType] = frozenset([parse_video, parse_related_artist])
+
+LOCALE_DIR = Path(__file__).parent.parent.resolve() / "locales"
+
+
+@dataclass(frozen=True)
+class LanguageTables:
+    """Lookup tables of the localized labels of a language, keyed by the lowercase label"""
+
+    #: gettext translation of the language
+    translation: GNUTranslations
+    #: localized search result type -> search result type, i.e. "lied" -> "song"
+    search_result_types: Mapping[str, str]
+    #: localized result types including "single" and "ep"
+    api_result_types: frozenset[str]
+    #: localized channel carousel title -> result keys, i.e. "alben" -> ("albums",)
+    channel_categories: Mapping[str, tuple[str, ...]]
+    #: abbreviations of counts, i.e. "mio" for million
+    number_format: NumberFormat
+
+
+@cache
+def get_language_tables(language: str) -> LanguageTables:
+    """Builds the lookup tables of a language once, they are shared by all instances using it"""
+    translation = gettext.translation("base", localedir=LOCALE_DIR, languages=[language])
+    return _build_tables(translation, translation.gettext, NUMBER_FORMATS.get(language, NUMBER_FORMATS["en"]))
+
+
+def _build_tables(
+    translation: GNUTranslations, _: Callable[[str], str], number_format: NumberFormat
+) -> LanguageTables:
+    # the labels are wrapped in _() to be found by xgettext, see locales/README.rst
+    search_result_types = {
+        _("album"): "album",
+        _("artist"): "artist",
+        _("playlist"): "playlist",
+        _("song"): "song",
+        _("video"): "video",
+        _("station"): "station",
+        _("profile"): "profile",
+        _("podcast"): "podcast",
+        _("episode"): "episode",
+    }
+    channel_titles = {
+        "albums": _("albums"),
+        "singles": _("singles & eps"),
+        "shows": _("shows"),
+        "videos": _("videos"),
+        "playlists": _("playlists"),
+        "related": _("related"),
+        "episodes": _("episodes"),
+        "podcasts": _("podcasts"),
+    }
+    # the first type wins if a language uses the same label for several types, as with list.index
+    search_lookup: dict[str, str] = {}
+    for label, result_type in search_result_types.items():
+        search_lookup.setdefault(label.lower(), result_type)
+    channel_lookup: dict[str, tuple[str, ...]] = {}
+    for category, title in channel_titles.items():
+        channel_lookup[title.lower()] = (*channel_lookup.get(title.lower(), ()), category)
+    return LanguageTables(
+        translation=translation,
+        search_result_types=MappingProxyType(search_lookup),
+        api_result_types=frozenset([_("single").lower(), _("ep").lower(), *search_lookup]),
+        channel_categories=MappingProxyType(channel_lookup),
+        number_format=number_format,
+    )
 
 
 class Parser:
-    def __init__(self, language: GNUTranslations) -> None:
-        self.lang = language
-
-    @i18n
-    def get_search_result_types(self) -> list[str]:
-        return [
-            _("album"),
-            _("artist"),
-            _("playlist"),
-            _("song"),
-            _("video"),
-            _("station"),
-            _("profile"),
-            _("podcast"),
-            _("episode"),
-        ]
-
-    @i18n
-    def get_api_result_types(self) -> list[str]:
-        return [
-            _("single"),
-            _("ep"),
-            *self.get_search_result_types(),
-        ]
-
-    @i18n
-    def parse_channel_contents(self, results: JsonList) -> JsonDict:
-        categories = [
-            ("albums", _("albums"), parse_album, MTRIR),
-            ("singles", _("singles & eps"), parse_single, MTRIR),
-            ("shows", _("shows"), parse_album, MTRIR),
-            ("videos", _("videos"), parse_video, MTRIR),
-            ("playlists", _("playlists"), parse_playlist, MTRIR),
-            ("related", _("related"), parse_related_artist, MTRIR),
-            ("episodes", _("episodes"), parse_episode, MMRIR),
-            ("podcasts", _("podcasts"), parse_podcast, MTRIR),
-        ]
+    def __init__(self, language: str) -> None:
+        """
+        :param language: language code of the localized labels in responses, see :py:data:`SUPPORTED_LANGUAGES`
+        """
+        self.language = language
+
+    def __reduce__(self) -> tuple[type["Parser"], tuple[str]]:
+        # the tables are loaded again in worker processes, the gettext translation cannot be pickled
+        return Parser, (self.language,)
+
+    @cached_property
+    def tables(self) -> LanguageTables:
+        """lookup tables of the language, loaded on first use"""
+        return get_language_tables(self.language)
+
+    @property
+    def lang(self) -> GNUTranslations:
+        return self.tables.translation
+
+    def get_search_result_types(self) -> Mapping[str, str]:
+        """localized search result type -> search result type"""
+        return self.tables.search_result_types
+
+    def get_api_result_types(self) -> frozenset[str]:
+        return self.tables.api_result_types
+
+    def parse_count(self, text: str | None) -> int | None:
+        """Parses a localized count like "1.2M views" or "3,4 Mio. Aufrufe", None if text has no number"""
+        return parse_count(text, self.tables.number_format)
+
+    def parse_channel_contents(self, results: JsonList, lazy: bool = False) -> JsonDict:
+        """
+        :param lazy: return the results of each category as :py:class:`LazyList`,
+            which parses items on first access
+        """
+        carousels: dict[str, JsonDict] = {}
+        for r in results:
+            if "musicCarouselShelfRenderer" not in r:
+                continue
+            title = nav(r, CAROUSEL + CAROUSEL_TITLE)["text"].lower()
+            for category in self.tables.channel_categories.get(title, ()):
+                carousels.setdefault(category, r["musicCarouselShelfRenderer"])
+
         artist: JsonDict = {}
-        for category, category_local, category_parser, category_key in categories:
-            data = [
-                r["musicCarouselShelfRenderer"]
-                for r in results
-                if "musicCarouselShelfRenderer" in r
-                and nav(r, CAROUSEL + CAROUSEL_TITLE)["text"].lower() == category_local.lower()
-            ]
-            if len(data) > 0:
-                artist[category] = {"browseId": None, "results": []}
-                if "navigationEndpoint" in nav(data[0], CAROUSEL_TITLE):
-                    artist[category]["browseId"] = nav(data[0], CAROUSEL_TITLE + NAVIGATION_BROWSE_ID)
-                    artist[category]["params"] = nav(
-                        data[0], CAROUSEL_TITLE + NAVIGATION_BROWSE + ["params"], True
-                    )
+        for category, category_parser, category_key in CHANNEL_CATEGORIES:
+            if category not in carousels:
+                continue
+            data = carousels[category]
+            artist[category] = {"browseId": None, "results": []}
+            if "navigationEndpoint" in nav(data, CAROUSEL_TITLE):
+                artist[category]["browseId"] = nav(data, CAROUSEL_TITLE + NAVIGATION_BROWSE_ID)
+                artist[category]["params"] = nav(data, CAROUSEL_TITLE + NAVIGATION_BROWSE + ["params"], True)
 
+            if category_parser in COUNTED_PARSERS:
+                category_parser = partial(category_parser, number_format=self.tables.number_format)
+            if lazy:
+                artist[category]["results"] = LazyList(
+                    data["contents"], partial(_parse_content_item, category_parser, category_key)
+                )
+            else:
                 artist[category]["results"] = parse_content_list(
-                    data[0]["contents"], category_parser, key=category_key
+                    data["contents"], category_parser, key=category_key
                 )
 
         return artist
+
+
+def _parse_content_item(parse_func: ParseFuncDictType, key: str, result: JsonDict) -> JsonDict:
+    """single item of :py:func:`parse_content_list`"""
+    return parse_func(result[key])
@@ -1,118 +1,263 @@
-from ytmusicapi.continuations import get_continuations
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
+from typing import Any
+
+from ytmusicapi.continuations import (
+    ContinuationCursor,
+    CursorList,
+    get_continuation_cursor,
+    get_continuations,
+)
+from ytmusicapi.models.results import Album, Artist, Playlist, parse_thumbnails
+from ytmusicapi.type_alias import FieldsType, JsonDict, JsonList, OutputType, ParseFuncType, RequestFuncType
 
 from ._utils import *
-from .browsing import parse_content_list
+from .browsing import parse_content_list, parse_playlist
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat, parse_count
 from .playlists import parse_playlist_items
 from .podcasts import parse_podcast
 from .songs import parse_song_runs
 
 
-def parse_artists(results: JsonList, uploaded: bool = False) -> JsonList:
-    artists = []
+def parse_artists(
+    results: JsonList,
+    uploaded: bool = False,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> list[Any]:
+    artists: list[Any] = []
     for result in results:
         data = result[MRLIR]
         artist = {}
         artist["browseId"] = nav(data, NAVIGATION_BROWSE_ID)
         artist["artist"] = get_item_text(data, 0)
-        page_type = nav(data, NAVIGATION_BROWSE + PAGE_TYPE, True)
-        if page_type == "MUSIC_PAGE_TYPE_USER_CHANNEL":
-            artist["type"] = "channel"
-        elif page_type == "MUSIC_PAGE_TYPE_ARTIST":
-            artist["type"] = "artist"
-        parse_menu_playlists(data, artist)
+        if wants(fields, "type"):
+            page_type = nav(data, NAVIGATION_BROWSE + PAGE_TYPE, True)
+            if page_type == "MUSIC_PAGE_TYPE_USER_CHANNEL":
+                artist["type"] = "channel"
+            elif page_type == "MUSIC_PAGE_TYPE_ARTIST":
+                artist["type"] = "artist"
+        if wants(fields, "shuffleId", "radioId"):
+            parse_menu_playlists(data, artist)
         if uploaded:
             artist["songs"] = (get_item_text(data, 1) or "").split(" ")[0]
-        else:
+        elif wants(fields, "subscribers", "subscribers_count"):
             subtitle = get_item_text(data, 1)
             if subtitle:
                 artist["subscribers"] = subtitle.split(" ")[0]
-        artist["thumbnails"] = nav(data, THUMBNAILS, True)
-        artists.append(artist)
+                artist["subscribers_count"] = parse_count(subtitle, number_format)
+        if wants(fields, "thumbnails"):
+            artist["thumbnails"] = nav(data, THUMBNAILS, True)
+        if output == "models":
+            artists.append(_artist_model(artist))
+        else:
+            artists.append(project(artist, fields))
 
     return artists
 
 
-async def parse_library_albums(response: JsonDict, request_func: RequestFuncType, limit: int | None) -> JsonList:
+def _artist_model(artist: JsonDict) -> Artist:
+    return Artist(
+        name=artist["artist"],
+        id=artist["browseId"],
+        type=artist.get("type"),
+        subscribers=artist.get("subscribers"),
+        subscribers_count=artist.get("subscribers_count"),
+        shuffleId=artist.get("shuffleId"),
+        radioId=artist.get("radioId"),
+        thumbnails=parse_thumbnails(artist.get("thumbnails")),
+    )
+
+
+async def parse_library_albums(
+    response: JsonDict,
+    request_func: RequestFuncType,
+    limit: int | None,
+    prefetch: bool = False,
+    body: JsonDict | None = None,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+) -> list[Any]:
     results = get_library_contents(response, GRID)
     if results is None:
         return []
-    albums = parse_albums(results["items"])
+    cursor = _get_library_cursor(results, "albums", "gridContinuation", body, fields, output)
+    albums = CursorList(parse_albums(results["items"], fields, output), cursor)
 
     if "continuations" in results:
-        parse_func: ParseFuncType = lambda contents: parse_albums(contents)
+        parse_func: ParseFuncType = lambda contents: parse_albums(contents, fields, output)
         remaining_limit = None if limit is None else (limit - len(albums))
-        albums.extend(
-            await get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+        albums.extend_continuation(
+            await get_continuations(
+                results,
+                "gridContinuation",
+                remaining_limit,
+                request_func,
+                parse_func,
+                prefetch=prefetch,
+                cursor=cursor,
+            )
         )
 
     return albums
 
 
-def parse_albums(results: JsonList) -> JsonList:
-    albums = []
+def parse_albums(results: JsonList, fields: FieldsType = None, output: OutputType = "dicts") -> list[Any]:
+    albums: list[Any] = []
     for result in results:
         data = result[MTRIR]
         album = {}
         album["browseId"] = nav(data, TITLE + NAVIGATION_BROWSE_ID)
-        album["playlistId"] = nav(data, MENU_PLAYLIST_ID, none_if_absent=True)
+        if wants(fields, "playlistId"):
+            album["playlistId"] = nav(data, MENU_PLAYLIST_ID, none_if_absent=True)
         album["title"] = nav(data, TITLE_TEXT)
-        album["thumbnails"] = nav(data, THUMBNAIL_RENDERER)
+        if wants(fields, "thumbnails"):
+            album["thumbnails"] = nav(data, THUMBNAIL_RENDERER)
 
         if "runs" in data["subtitle"]:
             album["type"] = nav(data, SUBTITLE)
-            album.update(parse_song_runs(data["subtitle"]["runs"][2:]))
+            if wants(fields, "artists", "year"):
+                album.update(parse_song_runs(data["subtitle"]["runs"][2:]))
 
-        albums.append(album)
+        if output == "models":
+            albums.append(_album_model(album))
+        else:
+            albums.append(project(album, fields))
 
     return albums
 
 
-async def parse_library_podcasts(response: JsonDict, request_func: RequestFuncType, limit: int | None) -> JsonList:
+def parse_playlists(results: JsonList, fields: FieldsType = None, output: OutputType = "dicts") -> list[Any]:
+    if output == "models":
+        return [_playlist_model(parse_playlist(result[MTRIR])) for result in results]
+    return parse_content_list(results, parse_playlist, fields=fields)
+
+
+def _playlist_model(playlist: JsonDict) -> Playlist:
+    author = playlist.get("author")
+    return Playlist(
+        name=playlist["title"],
+        id=playlist["playlistId"],
+        description=playlist.get("description"),
+        count=playlist.get("count"),
+        author=[Artist(artist["name"], artist["id"]) for artist in author] if author is not None else None,
+        thumbnails=parse_thumbnails(playlist["thumbnails"]),
+    )
+
+
+def _album_model(album: JsonDict) -> Album:
+    artists = album.get("artists")
+    return Album(
+        name=album["title"],
+        id=album["browseId"],
+        playlistId=album.get("playlistId"),
+        type=album.get("type"),
+        artists=[Artist(artist["name"], artist["id"]) for artist in artists] if artists is not None else None,
+        year=album.get("year"),
+        thumbnails=parse_thumbnails(album.get("thumbnails")),
+    )
+
+
+async def parse_library_podcasts(
+    response: JsonDict,
+    request_func: RequestFuncType,
+    limit: int | None,
+    prefetch: bool = False,
+    body: JsonDict | None = None,
+    fields: FieldsType = None,
+) -> JsonList:
     results = get_library_contents(response, GRID)
     if results is None:
         return []
-    parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_podcast)
-    podcasts = parse_func(results["items"][1:])  # skip first entry "Add podcast"
+    parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_podcast, fields=fields)
+    cursor = _get_library_cursor(results, "podcasts", "gridContinuation", body, fields)
+    podcasts = CursorList(parse_func(results["items"][1:]), cursor)  # skip first entry "Add podcast"
 
     if "continuations" in results:
         remaining_limit = None if limit is None else (limit - len(podcasts))
-        podcasts.extend(
-            await get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+        podcasts.extend_continuation(
+            await get_continuations(
+                results,
+                "gridContinuation",
+                remaining_limit,
+                request_func,
+                parse_func,
+                prefetch=prefetch,
+                cursor=cursor,
+            )
         )
 
     return podcasts
 
 
-async def parse_library_artists(response: JsonDict, request_func: RequestFuncType, limit: int | None) -> JsonList:
+async def parse_library_artists(
+    response: JsonDict,
+    request_func: RequestFuncType,
+    limit: int | None,
+    prefetch: bool = False,
+    body: JsonDict | None = None,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> list[Any]:
     results = get_library_contents(response, MUSIC_SHELF)
     if results is None:
         return []
-    artists = parse_artists(results["contents"])
+    cursor = _get_library_cursor(results, "artists", "musicShelfContinuation", body, fields, output)
+    parse_func: ParseFuncType = lambda contents: parse_artists(
+        contents, fields=fields, output=output, number_format=number_format
+    )
+    artists = CursorList(parse_func(results["contents"]), cursor)
 
     if "continuations" in results:
-        parse_func: ParseFuncType = lambda contents: parse_artists(contents)
         remaining_limit = None if limit is None else (limit - len(artists))
-        artists.extend(
+        artists.extend_continuation(
             await get_continuations(
-                results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+                results,
+                "musicShelfContinuation",
+                remaining_limit,
+                request_func,
+                parse_func,
+                prefetch=prefetch,
+                cursor=cursor,
             )
         )
 
     return artists
 
 
-def pop_songs_random_mix(results: JsonDict | None) -> None:
-    """remove the random mix that conditionally appears at the start of library songs"""
-    if results:
-        if len(results["contents"]) >= 2:
-            results["contents"].pop(0)
+def _get_library_cursor(
+    results: JsonDict,
+    kind: str,
+    continuation_type: str,
+    body: JsonDict | None,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+) -> ContinuationCursor | None:
+    """cursor for the continuations of a library browse request, None if the request body is unknown"""
+    if body is None:
+        return None
+    return get_continuation_cursor(
+        results, kind, "browse", body, continuation_type, fields=fields, output=output
+    )
+
+
+def skip_songs_random_mix(results: JsonDict) -> JsonList:
+    """skip the random mix that conditionally appears at the start of library songs.
+    The response is not modified, as it may be shared with other requests"""
+    contents: JsonList = results["contents"]
+    return contents[1:] if len(contents) >= 2 else contents
 
 
-def parse_library_songs(response: JsonDict) -> JsonDict:
+def parse_library_songs(
+    response: JsonDict, fields: FieldsType = None, output: OutputType = "dicts"
+) -> JsonDict:
     results = get_library_contents(response, MUSIC_SHELF)
-    pop_songs_random_mix(results)
-    return {"results": results, "parsed": parse_playlist_items(results["contents"]) if results else results}
+    return {
+        "results": results,
+        "parsed": parse_playlist_items(skip_songs_random_mix(results), fields=fields, output=output)
+        if results
+        else results,
+    }
 
 
 def get_library_contents(response: JsonDict, renderer: list[str]) -> JsonDict | None:
@@ -0,0 +1,107 @@
+"""locale-independent parsing of localized counts, i.e. "1.2M views" or "3,4 Mio. Aufrufe" """
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+#: a number with grouping or decimal separators, including arabic separators and (narrow) no-break spaces
+_NUMBER = re.compile(r"\d(?:[\d.,' \u00a0\u202f\u066b\u066c]*\d)?")
+_NON_DIGIT = re.compile(r"\D")
+_SEPARATORS = ".,' \u00a0\u202f\u066b\u066c"
+
+
+@dataclass(frozen=True)
+class NumberFormat:
+    """Abbreviations and decimal separators of the counts of a language"""
+
+    #: abbreviation -> multiplier, lowercase without a trailing dot
+    magnitudes: Mapping[str, int]
+    #: characters separating the decimals of abbreviated counts, i.e. "," for "3,4 k"
+    decimals: str = "."
+    #: True if abbreviations are followed by other words without a space, i.e. "1.2万次观看"
+    attached: bool = False
+    #: abbreviations sorted by length, to match the longest one
+    _ordered: tuple[tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "magnitudes", MappingProxyType(dict(self.magnitudes)))
+        ordered = tuple(sorted(self.magnitudes.items(), key=lambda item: -len(item[0])))
+        object.__setattr__(self, "_ordered", ordered)
+
+    def __reduce__(self) -> tuple[type["NumberFormat"], tuple[Any, ...]]:
+        # mapping proxies cannot be pickled, formats are sent to worker processes with the parse functions
+        return NumberFormat, (dict(self.magnitudes), self.decimals, self.attached)
+
+    def magnitude(self, suffix: str) -> int:
+        """Returns the multiplier of the abbreviation at the start of suffix, 1 if there is none"""
+        suffix = suffix.lstrip().lower()
+        if not suffix:
+            return 1
+        if not self.attached:
+            suffix = suffix.split(maxsplit=1)[0].rstrip(".")
+            return self.magnitudes.get(suffix, 1)
+        for abbreviation, multiplier in self._ordered:
+            if suffix.startswith(abbreviation):
+                return multiplier
+        return 1
+
+
+_K, _M, _B = 1_000, 1_000_000, 1_000_000_000
+
+#: compact number formats of the supported languages
+NUMBER_FORMATS: Mapping[str, NumberFormat] = MappingProxyType(
+    {
+        "ar": NumberFormat({"ألف": _K, "آلاف": _K, "مليون": _M, "ملايين": _M, "مليار": _B}, "\u066b."),
+        "de": NumberFormat({"tsd": _K, "mio": _M, "mrd": _B}, ","),
+        "en": NumberFormat({"k": _K, "m": _M, "b": _B}),
+        "es": NumberFormat({"k": _K, "mil": _K, "m": _M, "mill": _M, "mm": _B}, ","),
+        "fr": NumberFormat({"k": _K, "m": _M, "md": _B, "mrd": _B}, ","),
+        "hi": NumberFormat({"हज़ार": _K, "लाख": 100_000, "क॰": 10_000_000, "करोड़": 10_000_000}),
+        "it": NumberFormat({"k": _K, "mln": _M, "mld": _B, "mrd": _B}, ","),
+        "ja": NumberFormat({"千": _K, "万": 10_000, "億": 100_000_000}, attached=True),
+        "ko": NumberFormat({"천": _K, "만": 10_000, "억": 100_000_000}, attached=True),
+        "nl": NumberFormat({"k": _K, "mln": _M, "mld": _B}, ","),
+        "pt": NumberFormat({"mil": _K, "mi": _M, "bi": _B}, ","),
+        "ru": NumberFormat({"тыс": _K, "млн": _M, "млрд": _B}, ","),
+        "tr": NumberFormat({"b": _K, "bin": _K, "mn": _M, "mr": _B, "milyar": _B}, ","),
+        "ur": NumberFormat({"ہزار": _K, "لاکھ": 100_000, "کروڑ": 10_000_000, "ارب": _B}),
+        "zh_CN": NumberFormat({"千": _K, "万": 10_000, "亿": 100_000_000}, attached=True),
+        "zh_TW": NumberFormat({"千": _K, "萬": 10_000, "億": 100_000_000}, attached=True),
+    }
+)
+
+#: format of counts in responses of the default language
+DEFAULT_NUMBER_FORMAT = NUMBER_FORMATS["en"]
+
+
+def parse_count(text: str | None, number_format: NumberFormat) -> int | None:
+    """
+    Parses the first count in a localized text, i.e. "1.2M views" -> 1200000 or "1,234 songs" -> 1234.
+    Separators of counts without an abbreviation are ignored.
+
+    :param text: localized text, i.e. a view count or a subscriber count
+    :param number_format: format of the language of the text, see :py:data:`NUMBER_FORMATS`
+    :return: the count, None if the text contains no number
+    """
+    if not text:
+        return None
+    match = _NUMBER.search(text)
+    if match is None:
+        return None
+    number = match.group()
+    multiplier = number_format.magnitude(text[match.end() :])
+    if multiplier == 1:
+        return int(_NON_DIGIT.sub("", number))
+
+    # the last separator is the decimal separator, if it is one of the language
+    integer, fraction = number, ""
+    for i in range(len(number) - 1, -1, -1):
+        if number[i] in _SEPARATORS:
+            if number[i] in number_format.decimals:
+                integer, fraction = number[:i], number[i + 1 :]
+            break
+    integer = _NON_DIGIT.sub("", integer)
+    fraction = _NON_DIGIT.sub("", fraction)
+    return int(integer) * multiplier + int(fraction or 0) * multiplier // 10 ** len(fraction)
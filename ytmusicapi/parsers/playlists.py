@@ -1,10 +1,20 @@
 import re
+from typing import Any
 
 from ytmusicapi.continuations import *
 from ytmusicapi.helpers import sum_total_duration
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncBodyType
+from ytmusicapi.models.results import Track, parse_thumbnails
+from ytmusicapi.type_alias import (
+    FieldsType,
+    JsonDict,
+    JsonList,
+    OutputType,
+    ParseFuncType,
+    RequestFuncBodyType,
+)
 
 from ..helpers import to_int
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat, parse_count
 from .songs import *
 
 
@@ -65,9 +75,20 @@ def parse_playlist_header_meta(header: JsonDict) -> JsonDict:
     return playlist_meta
 
 
-def parse_audio_playlist(
-    response: JsonDict, limit: int | None, request_func: RequestFuncBodyType
+async def parse_audio_playlist(
+    response: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    prefetch: bool = False,
+    body: JsonDict | None = None,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
 ) -> JsonDict:
+    """
+    :param body: body of the browse request, to return a cursor with the tracks
+    :param fields: fields of the tracks to parse, None for all fields
+    :param output: format of the tracks, ``dicts`` or ``models``
+    """
     playlist: JsonDict = {
         "owned": False,
         "privacy": "PUBLIC",
@@ -83,48 +104,132 @@ def parse_audio_playlist(
     content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
 
     playlist["id"] = nav(
-        content_data, [*CONTENT, MRLIR, *PLAY_BUTTON, "playNavigationEndpoint", *WATCH_PLAYLIST_ID]
+        content_data, [*CONTENT, MRLIR, *PLAY_BUTTON, "playNavigationEndpoint", *WATCH_PLAYLIST_ID], True
     )
+    if playlist["id"] is None and body is not None:  # no tracks
+        playlist["id"] = validate_playlist_id(body["browseId"])
     playlist["trackCount"] = nav(content_data, ["collapsedItemCount"])
 
-    playlist["tracks"] = []
+    playlist["tracks"] = CursorList()
     if "contents" in content_data:
-        playlist["tracks"] = parse_playlist_items(content_data["contents"])
-
-        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents)
-        playlist["tracks"].extend(get_continuations_2025(content_data, limit, request_func, parse_func))
+        cursor = None
+        if body is not None:
+            cursor = get_continuation_cursor(
+                content_data,
+                "playlist_items",
+                "browse",
+                body,
+                CONTINUATION_2025,
+                fields=fields,
+                output=output,
+            )
+        playlist["tracks"] = CursorList(
+            parse_playlist_items(content_data["contents"], fields=fields, output=output), cursor
+        )
 
-    playlist["title"] = playlist["tracks"][0]["album"]["name"]
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(
+            contents, fields=fields, output=output
+        )
+        playlist["tracks"].extend_continuation(
+            await get_continuations_2025(
+                content_data, limit, request_func, parse_func, prefetch=prefetch, cursor=cursor
+            )
+        )
 
+    playlist["title"] = parse_audio_playlist_title(content_data)
     playlist["duration_seconds"] = sum_total_duration(playlist)
     return playlist
 
 
+def parse_audio_playlist_title(content_data: JsonDict) -> str | None:
+    """
+    Audio playlists have no header, the title is only available as album of the tracks.
+    It is parsed from the first track regardless of the requested fields, None if there are no tracks.
+    """
+    for result in content_data.get("contents", []):
+        if MRLIR in result:
+            track = parse_playlist_item(result[MRLIR], fields=frozenset({"album"}))
+            album = track.get("album") if isinstance(track, dict) else None
+            return album["name"] if album else None
+    return None
+
+
 def parse_playlist_items(
-    results: JsonList, menu_entries: list[list[str]] | None = None, is_album: bool = False
-) -> JsonList:
+    results: JsonList,
+    menu_entries: list[list[str]] | None = None,
+    is_album: bool = False,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> list[Any]:
     songs = []
     for result in results:
         if MRLIR not in result:
             continue
         data = result[MRLIR]
-        song = parse_playlist_item(data, menu_entries, is_album)
+        song = parse_playlist_item(data, menu_entries, is_album, fields, output, number_format)
         if song:
             songs.append(song)
 
     return songs
 
 
+#: locations of the track shelf of the first page of a playlist, in the old and the 2025 format
+PLAYLIST_SHELF_PATHS = [
+    [*SINGLE_COLUMN_TAB, *SECTION_LIST_ITEM, "musicPlaylistShelfRenderer"],
+    [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION, *CONTENT, "musicPlaylistShelfRenderer"],
+]
+
+
+def parse_playlist_response(
+    response: JsonDict, fields: FieldsType = None, output: OutputType = "dicts"
+) -> tuple[JsonDict, list[Any]]:
+    """
+    Parses the tracks of the first page of a playlist.
+
+    :return: a copy of the response without the renderers of the tracks, and the parsed tracks.
+        The copy is much smaller to send back from a worker process than the whole response.
+    """
+    for path in PLAYLIST_SHELF_PATHS:
+        shelf = nav(response, path, True)
+        if shelf is not None and "contents" in shelf:
+            break
+    else:
+        return response, []
+    tracks = parse_playlist_items(shelf["contents"], fields=fields, output=output)
+    remaining = [item for item in shelf["contents"] if MRLIR not in item]
+    return _replace(response, [*path, "contents"], remaining), tracks
+
+
+def _replace(node: Any, path: list[str | int], value: Any) -> Any:
+    """copy of node with the value at path replaced, which only copies the containers along the path"""
+    if not path:
+        return value
+    copy = list(node) if isinstance(node, list) else dict(node)
+    copy[path[0]] = _replace(node[path[0]], path[1:], value)
+    return copy
+
+
 def parse_playlist_item(
-    data: JsonDict, menu_entries: list[list[str]] | None = None, is_album: bool = False
-) -> JsonDict | None:
+    data: JsonDict,
+    menu_entries: list[list[str]] | None = None,
+    is_album: bool = False,
+    fields: FieldsType = None,
+    output: OutputType = "dicts",
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> JsonDict | Track | None:
+    """
+    :param fields: fields to parse, None for all fields. Fields which are not requested are not navigated.
+    :param output: ``models`` to return a :py:class:`Track` instead of a dict
+    :param number_format: format of the play counts of album tracks, parsed as ``views_count``
+    """
     videoId = setVideoId = None
     like = None
     feedback_tokens = None
     library_status = None
 
     # if the item has a menu, find its setVideoId
-    if "menu" in data:
+    if "menu" in data and wants(fields, "videoId", "setVideoId", "feedbackTokens", "inLibrary"):
         for item in nav(data, MENU_ITEMS):
             if "menuServiceItemRenderer" in item:
                 menu_service = nav(item, MENU_SERVICE)
@@ -143,7 +248,7 @@ def parse_playlist_item(
         if "playNavigationEndpoint" in nav(data, PLAY_BUTTON):
             videoId = nav(data, PLAY_BUTTON)["playNavigationEndpoint"]["watchEndpoint"]["videoId"]
 
-            if "menu" in data:
+            if "menu" in data and wants(fields, "likeStatus"):
                 like = nav(data, MENU_LIKE_STATUS, True)
 
     isAvailable = True
@@ -205,28 +310,64 @@ def parse_playlist_item(
     if title == "Song deleted":
         return None
 
-    artists = parse_song_artists(data, artist_index) if artist_index is not None else None
+    artists = (
+        parse_song_artists(data, artist_index, output)
+        if artist_index is not None and wants(fields, "artists")
+        else None
+    )
 
-    album = parse_song_album(data, album_index) if album_index is not None else None
+    album = (
+        parse_song_album(data, album_index, output)
+        if album_index is not None and wants(fields, "album")
+        else None
+    )
 
-    views = get_item_text(data, 2) if is_album else None
+    views = get_item_text(data, 2) if is_album and wants(fields, "views", "views_count") else None
+    views_count = parse_count(views, number_format) if views is not None else None
 
     duration = None
-    if "fixedColumns" in data:
+    if "fixedColumns" in data and wants(fields, "duration", "duration_seconds"):
         if "simpleText" in nav(get_fixed_column_item(data, 0), ["text"]):
             duration = nav(get_fixed_column_item(data, 0), ["text", "simpleText"])
         else:
             duration = nav(get_fixed_column_item(data, 0), TEXT_RUN_TEXT)
 
-    thumbnails = nav(data, THUMBNAILS, True)
+    thumbnails = nav(data, THUMBNAILS, True) if wants(fields, "thumbnails") else None
 
-    isExplicit = nav(data, BADGE_LABEL, True) is not None
+    isExplicit = nav(data, BADGE_LABEL, True) is not None if wants(fields, "isExplicit") else None
 
-    videoType = nav(
-        data,
-        [*MENU_ITEMS, 0, MNIR, "navigationEndpoint", *NAVIGATION_VIDEO_TYPE],
-        True,
-    )
+    videoType = None
+    if wants(fields, "videoType"):
+        videoType = nav(
+            data,
+            [*MENU_ITEMS, 0, MNIR, "navigationEndpoint", *NAVIGATION_VIDEO_TYPE],
+            True,
+        )
+
+    trackNumber = None
+    if is_album and isAvailable and wants(fields, "trackNumber"):
+        trackNumber = int(nav(data, ["index", "runs", 0, "text"]))
+
+    if output == "models":
+        return Track(
+            videoId=videoId,
+            title=title,
+            artists=artists,
+            album=album,
+            likeStatus=like,
+            inLibrary=library_status,
+            thumbnails=parse_thumbnails(thumbnails),
+            isAvailable=isAvailable,
+            isExplicit=isExplicit,
+            videoType=videoType,
+            views=views,
+            views_count=views_count,
+            duration=duration or None,
+            duration_seconds=parse_duration(duration) if duration else None,
+            setVideoId=setVideoId or None,
+            feedbackTokens=feedback_tokens or None,
+            trackNumber=trackNumber,
+        )
 
     song = {
         "videoId": videoId,
@@ -242,8 +383,10 @@ def parse_playlist_item(
         "views": views,
     }
 
-    if is_album:
-        song["trackNumber"] = int(nav(data, ["index", "runs", 0, "text"])) if isAvailable else None
+    if is_album and wants(fields, "trackNumber"):
+        song["trackNumber"] = trackNumber
+    if is_album and wants(fields, "views_count"):
+        song["views_count"] = views_count
 
     if duration:
         song["duration"] = duration
@@ -262,7 +405,7 @@ def parse_playlist_item(
                 filter(lambda x: x is not None, (nav(itm, menu_entry, True) for itm in items)), None
             )
 
-    return song
+    return project(song, fields)
 
 
 def validate_playlist_id(playlistId: str) -> str:
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Any
 
-from ytmusicapi.type_alias import JsonDict, JsonList
+from ytmusicapi.models.results import Episode, parse_thumbnails
+from ytmusicapi.type_alias import JsonDict, JsonList, OutputType
 
 from .songs import *
 
@@ -126,6 +127,28 @@ def parse_episode(data: JsonDict) -> JsonDict:
     }
 
 
+def parse_episodes(results: JsonList, output: OutputType = "dicts") -> list[Any]:
+    """Parses the episodes of a podcast, channel or episodes playlist as dicts or :py:class:`Episode` models"""
+    episodes = [parse_episode(result[MMRIR]) for result in results]
+    if output == "models":
+        return [_episode_model(episode) for episode in episodes]
+    return episodes
+
+
+def _episode_model(episode: JsonDict) -> Episode:
+    return Episode(
+        videoId=episode["videoId"],
+        browseId=episode["browseId"],
+        title=episode["title"],
+        description=episode["description"],
+        duration=episode["duration"],
+        date=episode["date"],
+        index=episode["index"],
+        videoType=episode["videoType"],
+        thumbnails=parse_thumbnails(episode["thumbnails"]),
+    )
+
+
 def parse_podcast(data: JsonDict) -> JsonDict:
     """Parses a single podcast under "Podcasts" on a channel page"""
     return {
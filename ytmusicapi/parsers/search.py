@@ -1,7 +1,10 @@
-from ytmusicapi.type_alias import JsonDict, JsonList
+from collections.abc import Collection, Mapping
+
+from ytmusicapi.type_alias import FieldsType, JsonDict, JsonList
 
 from ..helpers import to_int
 from ._utils import *
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat, parse_count
 from .songs import *
 
 ALL_RESULT_TYPES = [
@@ -18,26 +21,30 @@ ALL_RESULT_TYPES = [
 API_RESULT_TYPES = ["single", "ep", *ALL_RESULT_TYPES]
 
 
-def get_search_result_type(result_type_local: str, result_types_local: list[str]) -> str | None:
+def get_search_result_type(result_type_local: str, result_types_local: Mapping[str, str]) -> str | None:
+    """
+    :param result_types_local: lowercase localized result type -> result type,
+        see :py:meth:`ytmusicapi.parsers.i18n.Parser.get_search_result_types`
+    """
     if not result_type_local:
         return None
-    result_type_local = result_type_local.lower()
     # default to album since it's labeled with multiple values ('Single', 'EP', etc.)
-    if result_type_local not in result_types_local:
-        result_type = "album"
-    else:
-        result_type = ALL_RESULT_TYPES[result_types_local.index(result_type_local)]
-
-    return result_type
+    return result_types_local.get(result_type_local.lower(), "album")
 
 
-def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict:
+def parse_top_result(
+    data: JsonDict,
+    search_result_types: Mapping[str, str],
+    fields: FieldsType = None,
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
+) -> JsonDict:
     result_type = get_search_result_type(nav(data, SUBTITLE), search_result_types)
     search_result = {"category": nav(data, CARD_SHELF_TITLE), "resultType": result_type}
     if result_type == "artist":
         subscribers = nav(data, SUBTITLE2, True)
         if subscribers:
             search_result["subscribers"] = subscribers.split(" ")[0]
+            search_result["subscribers_count"] = parse_count(subscribers, number_format)
 
         artist_info = parse_song_runs(nav(data, ["title", "runs"]))
         search_result.update(artist_info)
@@ -54,7 +61,7 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
 
         search_result["title"] = nav(data, TITLE_TEXT)
         runs = nav(data, ["subtitle", "runs"])
-        song_info = parse_song_runs(runs[2:])
+        song_info = parse_song_runs(runs[2:], number_format)
         search_result.update(song_info)
 
     if result_type in ["album"]:
@@ -67,12 +74,18 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
         search_result["title"] = nav(data, TITLE_TEXT)
         search_result["author"] = parse_song_artists_runs(nav(data, ["subtitle", "runs"])[2:])
 
-    search_result["thumbnails"] = nav(data, THUMBNAILS, True)
-    return search_result
+    if wants(fields, "thumbnails"):
+        search_result["thumbnails"] = nav(data, THUMBNAILS, True)
+    return project(search_result, fields)
 
 
 def parse_search_result(
-    data: JsonDict, api_search_result_types: list[str], result_type: str | None, category: str | None
+    data: JsonDict,
+    api_search_result_types: Collection[str],
+    result_type: str | None,
+    category: str | None,
+    fields: FieldsType = None,
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
 ) -> JsonDict:
     default_offset = (not result_type or result_type == "album") * 2
     search_result: JsonDict = {"category": category}
@@ -131,7 +144,7 @@ def parse_search_result(
 
     elif result_type == "song":
         search_result["album"] = None
-        if "menu" in data:
+        if "menu" in data and wants(fields, "inLibrary", "feedbackTokens"):
             toggle_menu = find_object_by_key(nav(data, MENU_ITEMS), TOGGLE_MENU)
             if toggle_menu:
                 search_result["inLibrary"] = parse_song_library_status(toggle_menu)
@@ -145,7 +158,7 @@ def parse_search_result(
                 search_result["videoId"] = nav(flex_items[0][0], NAVIGATION_VIDEO_ID, True)
                 search_result["playlistId"] = nav(flex_items[0][0], NAVIGATION_PLAYLIST_ID, True)
             if flex_items[1]:
-                search_result.update(parse_song_runs(flex_items[1]))
+                search_result.update(parse_song_runs(flex_items[1], number_format))
             search_result["resultType"] = "song"
 
         else:  # artist or album result
@@ -171,22 +184,23 @@ def parse_search_result(
         )
         search_result["videoType"] = video_type
 
-    if result_type in ["song", "video", "album"]:
+    song_info_fields = ("artists", "album", "views", "views_count", "duration", "duration_seconds", "year")
+    if result_type in ["song", "video", "album"] and wants(fields, *song_info_fields):
         search_result["duration"] = None
         search_result["year"] = None
         flex_item = get_flex_column_item(data, 1)
         runs = flex_item["text"]["runs"]
         if flex_item2 := get_flex_column_item(data, 2):
-            runs.extend([{"text": ""}, *flex_item2["text"]["runs"]])  # first item is a dummy separator
+            runs = [*runs, {"text": ""}, *flex_item2["text"]["runs"]]  # first item is a dummy separator
         # ignore the first run if it is a type specifier (like "Single" or "Album")
         runs_offset = (len(runs[0]) == 1 and runs[0]["text"].lower() in api_search_result_types) * 2
-        song_info = parse_song_runs(runs[runs_offset:])
+        song_info = parse_song_runs(runs[runs_offset:], number_format)
         search_result.update(song_info)
 
     if result_type in ["artist", "album", "playlist", "profile", "podcast"]:
         search_result["browseId"] = nav(data, NAVIGATION_BROWSE_ID, True)
 
-    if result_type in ["song", "album"]:
+    if result_type in ["song", "album"] and wants(fields, "isExplicit"):
         search_result["isExplicit"] = nav(data, BADGE_LABEL, True) is not None
 
     if result_type in ["episode"]:
@@ -198,9 +212,10 @@ def parse_search_result(
 
         search_result["podcast"] = parse_id_name(nav(flex_item, ["text", "runs", has_date * 2]))
 
-    search_result["thumbnails"] = nav(data, THUMBNAILS, True)
+    if wants(fields, "thumbnails"):
+        search_result["thumbnails"] = nav(data, THUMBNAILS, True)
 
-    return search_result
+    return project(search_result, fields)
 
 
 def parse_album_playlistid_if_exists(data: JsonDict | None) -> str | None:
@@ -210,12 +225,16 @@ def parse_album_playlistid_if_exists(data: JsonDict | None) -> str | None:
 
 def parse_search_results(
     results: JsonList,
-    api_search_result_types: list[str],
+    api_search_result_types: Collection[str],
     resultType: str | None = None,
     category: str | None = None,
+    fields: FieldsType = None,
+    number_format: NumberFormat = DEFAULT_NUMBER_FORMAT,
 ) -> JsonList:
     return [
-        parse_search_result(result[MRLIR], api_search_result_types, resultType, category)
+        parse_search_result(
+            result[MRLIR], api_search_result_types, resultType, category, fields, number_format
+        )
         for result in results
     ]
 
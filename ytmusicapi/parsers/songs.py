@@ -1,31 +1,39 @@
 import re
+from typing import Any
 
-from ytmusicapi.type_alias import JsonDict, JsonList
+from ytmusicapi.models.results import Album, Artist
+from ytmusicapi.type_alias import JsonDict, JsonList, OutputType
 
 from ._utils import *
+from .numbers import DEFAULT_NUMBER_FORMAT, NumberFormat, parse_count
 
 
-def parse_song_artists(data: JsonDict, index: int) -> JsonList:
+def parse_song_artists(data: JsonDict, index: int, output: OutputType = "dicts") -> list[Any]:
     flex_item = get_flex_column_item(data, index)
     if not flex_item:
         return []
     else:
         runs = flex_item["text"]["runs"]
-        return parse_song_artists_runs(runs)
+        return parse_song_artists_runs(runs, output)
 
 
-def parse_song_artists_runs(runs: JsonList) -> JsonList:
-    artists = []
+def parse_song_artists_runs(runs: JsonList, output: OutputType = "dicts") -> list[Any]:
+    artists: list[Any] = []
     for j in range(int(len(runs) / 2) + 1):
-        artists.append({"name": runs[j * 2]["text"], "id": nav(runs[j * 2], NAVIGATION_BROWSE_ID, True)})
+        name, id = runs[j * 2]["text"], nav(runs[j * 2], NAVIGATION_BROWSE_ID, True)
+        artists.append(Artist(name, id) if output == "models" else {"name": name, "id": id})
     return artists
 
 
-def parse_song_runs(runs: JsonList) -> JsonDict:
+#: classifies the text of a run without navigationEndpoint, the name of the matching group is the type.
+#: note: YT uses non-breaking space \xa0 to separate number and magnitude of views
+RUN_CLASSIFIER = re.compile(r"(?P<views>\d[^ ]* [^ ]*)|(?P<duration>(?:\d+:)*\d+:\d+)|(?P<year>\d{4})")
+
+
+def parse_song_runs(runs: JsonList, number_format: NumberFormat = DEFAULT_NUMBER_FORMAT) -> JsonDict:
     parsed: JsonDict = {"artists": []}
-    for i, run in enumerate(runs):
-        if i % 2:  # uneven items are always separators
-            continue
+    for i in range(0, len(runs), 2):  # uneven items are always separators
+        run = runs[i]
         text = run["text"]
         if "navigationEndpoint" in run:  # artist or album
             item = {"name": text, "id": nav(run, NAVIGATION_BROWSE_ID, True)}
@@ -34,29 +42,32 @@ def parse_song_runs(runs: JsonList) -> JsonDict:
                 parsed["album"] = item
             else:  # artist
                 parsed["artists"].append(item)
+            continue
 
-        else:
-            # note: YT uses non-breaking space \xa0 to separate number and magnitude
-            if re.match(r"^\d([^ ])* [^ ]*$", text) and i > 0:
-                parsed["views"] = text.split(" ")[0]
-
-            elif re.match(r"^(\d+:)*\d+:\d+$", text):
-                parsed["duration"] = text
-                parsed["duration_seconds"] = parse_duration(text)
-
-            elif re.match(r"^\d{4}$", text):
-                parsed["year"] = text
-
-            else:  # artist without id
-                parsed["artists"].append({"name": text, "id": None})
+        match = RUN_CLASSIFIER.fullmatch(text)
+        run_type = match.lastgroup if match else None
+        if run_type == "views" and i > 0:
+            parsed["views"] = text.split(" ")[0]
+            parsed["views_count"] = parse_count(text, number_format)
+        elif run_type == "duration":
+            parsed["duration"] = text
+            parsed["duration_seconds"] = sum(
+                multiplier * int(part) for multiplier, part in zip((1, 60, 3600), reversed(text.split(":")))
+            )
+        elif run_type == "year":
+            parsed["year"] = text
+        else:  # artist without id
+            parsed["artists"].append({"name": text, "id": None})
 
     return parsed
 
 
-def parse_song_album(data: JsonDict, index: int) -> JsonDict | None:
+def parse_song_album(data: JsonDict, index: int, output: OutputType = "dicts") -> Any:
     flex_item = get_flex_column_item(data, index)
-    browse_id = nav(flex_item, TEXT_RUN + NAVIGATION_BROWSE_ID, True)
-    return None if not flex_item else {"name": get_item_text(data, index), "id": browse_id}
+    if not flex_item:
+        return None
+    name, browse_id = get_item_text(data, index), nav(flex_item, TEXT_RUN + NAVIGATION_BROWSE_ID, True)
+    return Album(name, browse_id) if output == "models" else {"name": name, "id": browse_id}
 
 
 def parse_song_library_status(item: JsonDict) -> bool:
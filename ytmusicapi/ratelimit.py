@@ -0,0 +1,158 @@
+"""client-side rate limiting for innertube requests"""
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+#: Default sustained requests per second per endpoint
+DEFAULT_RATES: dict[str, float] = {
+    "browse": 10,
+    "next": 10,
+    "player": 5,
+    "search": 5,
+    "music/get_search_suggestions": 5,
+}
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests per second on average and bursts of up to ``burst`` requests.
+    Callers reserve a token and wait until it is available, so waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        """
+        :param rate: tokens added per second
+        :param burst: maximum number of tokens. Default: ``rate``, but at least 1
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait until it may be used"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Delays all following requests by at least ``seconds``, and drops saved up burst tokens"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+        self.paused_until = max(self.paused_until, now + seconds)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Per-endpoint token bucket rate limiter with adaptive backoff.
+
+    When the server throttles a request (HTTP 429 or a quota error), the rate of that endpoint
+    is multiplied by ``backoff_factor`` and requests are paused for the time the server asked for.
+    Every successful request then raises the rate by ``recovery`` times the configured rate,
+    until the configured rate is reached again.
+
+    Example::
+
+        from ytmusicapi import YTMusic
+        from ytmusicapi.ratelimit import RateLimiter
+
+        yt = YTMusic(rate_limiter=RateLimiter({"browse": 20, "search": 2}))
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float] | None = None,
+        default_rate: float | None = None,
+        backoff_factor: float = 0.5,
+        recovery: float = 0.05,
+        min_rate: float = 0.1,
+        default_pause: float = 1.0,
+    ):
+        """
+        :param rates: Requests per second per endpoint. Default: :py:data:`DEFAULT_RATES`
+        :param default_rate: Requests per second for endpoints not in ``rates``.
+            Default: None, other endpoints are not limited
+        :param backoff_factor: Factor applied to the rate of an endpoint when it is throttled. Default: 0.5
+        :param recovery: Fraction of the configured rate regained per successful request. Default: 0.05
+        :param min_rate: Lower bound for the rate after backing off. Default: 0.1
+        :param default_pause: Seconds to pause an endpoint if the server did not send ``Retry-After``.
+            Default: 1
+        """
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.default_rate = default_rate
+        self.backoff_factor = backoff_factor
+        self.recovery = recovery
+        self.min_rate = min_rate
+        self.default_pause = default_pause
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _target_rate(self, endpoint: str) -> float | None:
+        return self.rates.get(endpoint, self.default_rate)
+
+    def bucket(self, endpoint: str) -> TokenBucket | None:
+        """Returns the bucket of an endpoint, None if the endpoint is not limited"""
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            rate = self._target_rate(endpoint)
+            if rate is None:
+                return None
+            bucket = self._buckets[endpoint] = TokenBucket(rate)
+        return bucket
+
+    async def acquire(self, endpoint: str) -> None:
+        """Waits until a request to endpoint may be sent"""
+        if bucket := self.bucket(endpoint):
+            await bucket.acquire()
+
+    def throttled(self, endpoint: str, retry_after: float | None = None) -> None:
+        """Backs off after the server throttled a request to endpoint"""
+        if bucket := self.bucket(endpoint):
+            bucket.rate = max(self.min_rate, bucket.rate * self.backoff_factor)
+            bucket.pause(retry_after if retry_after is not None else self.default_pause)
+
+    def succeeded(self, endpoint: str) -> None:
+        """Gradually recovers the rate of endpoint after a successful request"""
+        bucket = self._buckets.get(endpoint)
+        target = self._target_rate(endpoint)
+        if bucket is not None and target is not None and bucket.rate < target:
+            bucket.rate = min(target, bucket.rate + target * self.recovery)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Returns the seconds of a ``Retry-After`` header, None if it is absent or an HTTP date"""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def is_throttled(status: int, error: object = None) -> bool:
+    """
+    Returns True if a response indicates that the client sends too many requests
+
+    :param status: HTTP status code
+    :param error: ``error`` object of the response body, if any
+    """
+    if status == 429:
+        return True
+    if status >= 400 and isinstance(error, dict):
+        reason = str(error.get("status", "")) + " " + str(error.get("message", ""))
+        return "RESOURCE_EXHAUSTED" in reason or "quota" in reason.lower()
+    return False
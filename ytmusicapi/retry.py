@@ -0,0 +1,117 @@
+"""retry policy for transient innertube failures"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from ytmusicapi.constants import IDEMPOTENT_ENDPOINTS
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.type_alias import JsonDict
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of all requests, so retries cannot multiply the load during an outage.
+    Every request deposits ``ratio`` tokens, every retry withdraws one token.
+    """
+
+    def __init__(self, ratio: float = 0.2, initial: float = 10, maximum: float = 100):
+        """
+        :param ratio: retries allowed per request on average. Default: 0.2
+        :param initial: tokens available at the start. Default: 10
+        :param maximum: maximum number of saved tokens. Default: 100
+        """
+        self.ratio = ratio
+        self.maximum = maximum
+        self.tokens = min(initial, maximum)
+
+    def deposit(self) -> None:
+        self.tokens = min(self.maximum, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a token for a retry. Returns False if the budget is exhausted"""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retries idempotent requests that failed with a transient error, with jittered exponential backoff.
+
+    Example::
+
+        from ytmusicapi import YTMusic
+        from ytmusicapi.retry import RetryPolicy
+
+        yt = YTMusic(retry_policy=RetryPolicy(max_attempts=5))
+    """
+
+    #: maximum number of attempts per request, including the first one
+    max_attempts: int = 3
+    #: HTTP status codes which are retried
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+    #: exception classes which are retried
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+    #: backoff before the first retry in seconds, doubled for each following retry
+    backoff_base: float = 0.5
+    #: upper bound of the backoff in seconds
+    backoff_max: float = 10.0
+    #: endpoints which are retried. Requests that modify the account, i.e. ``browse/edit_playlist``
+    #: or ``like/like``, must not be added.
+    endpoints: frozenset[str] = frozenset(IDEMPOTENT_ENDPOINTS)
+    #: shared limit for retries, None for no limit
+    budget: RetryBudget | None = field(default_factory=RetryBudget)
+
+    def applies_to(self, endpoint: str, body: JsonDict | None = None) -> bool:
+        """
+        Returns True if failed requests to ``endpoint`` are retried.
+        Bodies with ``formData`` modify the account, i.e. ``set_tasteprofile`` posts to ``browse``, and are not retried.
+        """
+        return endpoint in self.endpoints and (body is None or "formData" not in body)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay after the failed attempt number ``attempt`` (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def record_request(self) -> None:
+        """Called once per request, before the first attempt"""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def retry_delay(
+        self,
+        attempt: int,
+        error: BaseException | None = None,
+        status: int | None = None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """
+        Returns the delay in seconds before the next attempt, or None if the request must not be retried.
+
+        :param attempt: number of the failed attempt, starting at 1
+        :param error: exception raised by the attempt
+        :param status: HTTP status of the attempt
+        :param retry_after: delay requested by the server
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if isinstance(error, YTMusicServerError):
+            status, retry_after, error = error.status, error.retry_after, None
+        if error is not None:
+            if not isinstance(error, self.retry_exceptions):
+                return None
+        elif status not in self.retry_statuses:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        delay = self.backoff(attempt)
+        return max(delay, retry_after) if retry_after is not None else delay
@@ -1,10 +1,15 @@
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Literal
 
 JsonDict = dict[str, Any]
 JsonList = list[JsonDict]
 
 RequestFuncType = Callable[[str], JsonDict]
 RequestFuncBodyType = Callable[[JsonDict], JsonDict]
-ParseFuncType = Callable[[JsonList], JsonList]
+ParseFuncType = Callable[[JsonList], list[Any]]
 ParseFuncDictType = Callable[[JsonDict], JsonDict]
+
+#: names of the result fields to parse, None for all fields
+FieldsType = frozenset[str] | None
+#: result format, plain dicts or the dataclasses of :py:mod:`ytmusicapi.models`
+OutputType = Literal["dicts", "models"]
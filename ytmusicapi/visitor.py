@@ -0,0 +1,135 @@
+"""visitor id stores shared by instances and processes, and streamed visitor id parsing"""
+
+import json
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from pathlib import Path
+
+from ytmusicapi.filelock import LOCK_POLL_INTERVAL, FileLock, atomic_write
+
+#: default time-to-live of stored visitor ids in seconds
+VISITOR_ID_TTL = 7 * 86400
+
+#: seconds between checks of the store while another instance fetches the visitor id
+VISITOR_ID_POLL_INTERVAL = LOCK_POLL_INTERVAL
+
+#: size of the chunks of the html of YouTube Music scanned for the visitor id
+VISITOR_ID_CHUNK_SIZE = 16384
+
+#: ``"VISITOR_DATA":"..."`` of the ytcfg in the html of YouTube Music
+_VISITOR_DATA = re.compile(rb'"VISITOR_DATA"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+#: bytes kept from the previous chunk, so a match split across chunks is found
+_OVERLAP = 512
+
+
+async def read_visitor_id(chunks: AsyncIterable[bytes]) -> str:
+    """
+    Returns the visitor id of the ytcfg in the html of YouTube Music, an empty string if it is missing.
+    Stops reading at the first match, which is in the ``<head>`` of the page.
+
+    :param chunks: the html, i.e. ``response.content.iter_chunked(n)`` of an aiohttp response
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer = buffer[-_OVERLAP:] + chunk
+        if match := _VISITOR_DATA.search(buffer):
+            visitor_id: str = json.loads(b'"' + match.group(1) + b'"')
+            return visitor_id
+    return ""
+
+
+class VisitorIdStore(ABC):
+    """
+    Base class for visitor id storage shared by several :py:class:`ytmusicapi.YTMusic` instances.
+
+    While an instance fetches the visitor id, it holds the lock of the store,
+    so other instances wait for the stored visitor id instead of fetching it as well.
+    """
+
+    def __init__(self, ttl: float = VISITOR_ID_TTL):
+        """
+        :param ttl: Time in seconds until a stored visitor id is fetched again. Default: 7 days
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self) -> str | None:
+        """Returns the stored visitor id or None if it is absent or expired"""
+
+    @abstractmethod
+    def set(self, visitor_id: str) -> None:
+        """Stores a visitor id for ``ttl`` seconds"""
+
+    @abstractmethod
+    def acquire(self) -> bool:
+        """Acquires the lock without blocking. Returns False if it is held by another instance."""
+
+    @abstractmethod
+    def release(self) -> None:
+        """Releases the lock"""
+
+
+class MemoryVisitorIdStore(VisitorIdStore):
+    """Stores the visitor id in memory, shared by the instances of one process"""
+
+    def __init__(self, ttl: float = VISITOR_ID_TTL):
+        super().__init__(ttl)
+        self._visitor_id: str | None = None
+        self._expires_at = 0.0
+        self._locked = False
+
+    def get(self) -> str | None:
+        return self._visitor_id if self._expires_at > time.time() else None
+
+    def set(self, visitor_id: str) -> None:
+        self._visitor_id = visitor_id
+        self._expires_at = time.time() + self.ttl
+
+    def acquire(self) -> bool:
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def release(self) -> None:
+        self._locked = False
+
+
+class FileVisitorIdStore(VisitorIdStore):
+    """
+    Stores the visitor id in a file, shared by the instances of several processes.
+    The file is replaced atomically, the lock is an OS file lock on ``<path>.lock``,
+    which is released if the process holding it exits.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = VISITOR_ID_TTL):
+        """
+        :param path: File to store the visitor id in. Its directory is created if it does not exist.
+        :param ttl: Time in seconds until a stored visitor id is fetched again. Default: 7 days
+        """
+        super().__init__(ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def get(self) -> str | None:
+        try:
+            with open(self.path, encoding="utf8") as file:
+                stored = json.load(file)
+            visitor_id, expires_at = stored["visitor_id"], float(stored["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return visitor_id if expires_at > time.time() and isinstance(visitor_id, str) else None
+
+    def set(self, visitor_id: str) -> None:
+        stored = {"visitor_id": visitor_id, "expires_at": time.time() + self.ttl}
+        atomic_write(self.path, json.dumps(stored).encode("utf-8"))
+
+    def acquire(self) -> bool:
+        return self._lock.acquire()
+
+    def release(self) -> None:
+        self._lock.release()
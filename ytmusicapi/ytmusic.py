@@ -1,30 +1,31 @@
 from __future__ import annotations
 
-import gettext
+import asyncio
+import copy
+import hashlib
 import json
-import locale
 import time
-from collections.abc import Iterator
-from contextlib import contextmanager, suppress
-from functools import cached_property, partial
-from pathlib import Path
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from functools import cached_property
+from gettext import GNUTranslations
+from types import MappingProxyType, TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from aiohttp import ClientSession, ClientResponse
 import aiohttp
-from requests import get as requests_get
-from requests import Response
-from requests import post as requests_post
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.helpers import (
+    IDEMPOTENT_ENDPOINTS,
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
     YTM_BASE_API,
+    YTM_DOMAIN,
     YTM_PARAMS,
     YTM_PARAMS_KEY,
     get_authorization,
-    get_visitor_id,
     initialize_context,
     initialize_headers,
     sapisid_from_cookie,
@@ -32,6 +33,7 @@ from ytmusicapi.helpers import (
 from ytmusicapi.mixins.browsing import BrowsingMixin
 from ytmusicapi.mixins.explore import ExploreMixin
 from ytmusicapi.mixins.library import LibraryMixin
+from ytmusicapi.mixins.pagination import PaginationMixin
 from ytmusicapi.mixins.playlists import PlaylistsMixin
 from ytmusicapi.mixins.podcasts import PodcastsMixin
 from ytmusicapi.mixins.search import SearchMixin
@@ -41,10 +43,23 @@ from ytmusicapi.parsers.i18n import Parser
 
 from .auth.auth_parse import determine_auth_type, parse_auth_str
 from .auth.oauth import OAuthCredentials, RefreshingToken
-from .auth.oauth.token import Token
 from .auth.types import AuthType
+from .bulk import BulkRequest
+from .cache import ResponseCache, request_key
 from .exceptions import YTMusicServerError, YTMusicUserError
+from .compression import COMPRESS_THRESHOLD, TransferStats, compress_body
+from .context import MOBILE_CLIENT, ContextOverrides, SerializedContext, get_overrides, override
+from .json_backend import JsonBackendName, get_json_backend
+from .offload import decode_and_parse, run_offloaded
+from .ratelimit import RateLimiter, is_throttled, parse_retry_after
+from .retry import RetryPolicy
 from .type_alias import JsonDict
+from .visitor import VISITOR_ID_CHUNK_SIZE, VISITOR_ID_POLL_INTERVAL, VisitorIdStore, read_visitor_id
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
 
 
 class YTMusicBase:
@@ -57,6 +72,19 @@ class YTMusicBase:
         language: str = "en",
         location: str = "",
         oauth_credentials: OAuthCredentials | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        bulk_concurrency: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        prefetch_continuations: bool = False,
+        offload_threshold: int | None = None,
+        executor: Executor | None = None,
+        json_backend: JsonBackendName = "auto",
+        compress_threshold: int | None = COMPRESS_THRESHOLD,
+        visitor_id: str | None = None,
+        visitor_id_store: VisitorIdStore | None = None,
+        renew_token: bool = False,
     ):
         """
         Create a new instance to interact with YouTube Music.
@@ -70,12 +98,11 @@ class YTMusicBase:
           Otherwise the default account is used. You can retrieve the user ID
           by going to https://myaccount.google.com/brandaccounts and selecting your brand account.
           The user ID will be in the URL: https://myaccount.google.com/b/user_id/
-        :param requests_session: A Requests session object or None to create one.
-          Default sessions have a request timeout of 30s, which produces a requests.exceptions.ReadTimeout.
-          The timeout can be changed by passing your own Session object::
+        :param requests_session: An aiohttp session or None to create one on the first request.
+          Default sessions have a request timeout of 30s, which produces an asyncio.TimeoutError.
+          The timeout can be changed by passing your own session::
 
-            s = requests.Session()
-            s.request = functools.partial(s.request, timeout=3)
+            s = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=3))
             ytm = YTMusic(requests_session=s)
 
         :param proxies: Optional. Proxy configuration in requests_ format_.
@@ -91,15 +118,79 @@ class YTMusicBase:
             Available languages can be checked in the FAQ.
         :param oauth_credentials: Optional. Used to specify a different oauth client to be
             used for authentication flow.
+        :param cache: Optional. A :py:class:`ResponseCache` to serve repeated requests from,
+            i.e. for the same album or artist. Default: responses are not cached.
+        :param coalesce_requests: Optional. If True, identical read-only requests that are in flight
+            at the same time share a single network request and the same decoded response.
+            Default: False
+        :param bulk_concurrency: Optional. Maximum number of concurrent requests of all batch methods
+            like :py:func:`get_albums` of this instance combined. Default: 10
+        :param rate_limiter: Optional. A :py:class:`ytmusicapi.ratelimit.RateLimiter` limiting the request
+            rate per endpoint, which backs off automatically when the server throttles requests.
+            Share one instance between several YTMusic instances to limit their combined rate.
+            Default: requests are not limited
+        :param retry_policy: Optional. A :py:class:`ytmusicapi.retry.RetryPolicy` to retry read-only requests
+            (``browse``, ``next``, ``player``, ``search``) failing with transient errors,
+            like HTTP 5xx, connection resets or timeouts. Default: requests are not retried
+        :param prefetch_continuations: Optional. If True, paginated methods request the next page
+            as soon as its continuation token is known, while the current page is still parsed.
+            This reduces the time for long playlists and libraries, but may request one page
+            more than needed when a limit is set. Default: False
+        :param offload_threshold: Optional. Size in bytes from which responses are decoded and parsed
+            in ``executor`` instead of on the event loop, so other coroutines are not blocked by
+            large responses like long playlists, albums or charts. Default: responses are processed on the event loop
+        :param executor: Optional. A thread or process pool for offloaded responses. Prefer a process pool,
+            since decoding JSON holds the GIL. Default: the default thread pool of the event loop
+        :param json_backend: Optional. JSON library for request bodies, responses and stored OAuth tokens:
+            ``orjson``, ``msgspec`` or ``json`` for the standard library. ``auto`` uses orjson or msgspec
+            if installed, the standard library otherwise. Default: ``auto``
+        :param compress_threshold: Optional. Size in bytes from which request bodies are compressed with gzip,
+            i.e. long action lists of :py:func:`edit_playlist`. None disables compression. Default: 1024
+        :param visitor_id: Optional. A visitor id (``X-Goog-Visitor-Id`` header) of an earlier instance,
+            i.e. :py:attr:`visitor_id`. Default: fetched from YouTube Music before the first request
+        :param visitor_id_store: Optional. A :py:class:`ytmusicapi.visitor.VisitorIdStore` sharing the
+            visitor id with other instances, i.e. a :py:class:`ytmusicapi.visitor.FileVisitorIdStore`
+            shared by the worker processes of an application. Only one instance fetches it when it is
+            absent or expired. Default: each instance fetches its own visitor id
+        :param renew_token: Optional. If True, an OAuth token is renewed in the background before it expires,
+            starting with the first request, so requests do not wait for a refresh.
+            :py:meth:`close` stops the renewal. Default: the token is refreshed by the first request after it expires
+
+        Construction performs no network requests, so it does not block the event loop.
         """
-        #: request session for connection pooling
-        self._session = self._prepare_session(requests_session)
+        #: user-provided session, or the session created on first use
+        self._client_session: aiohttp.ClientSession | None = (
+            requests_session if isinstance(requests_session, aiohttp.ClientSession) else None
+        )
+        #: True if the session is created by the instance and closed by :py:meth:`close`
+        self._owns_session = self._client_session is None
+        self.renew_token = renew_token
         self.proxies: dict[str, str] | None = proxies  #: params for session modification
 
         # see google cookie docs: https://policies.google.com/technologies/cookies
         # value from https://github.com/yt-dlp/yt-dlp/blob/master/yt_dlp/extractor/youtube.py#L502
         self.cookies = {"SOCS": "CAI"}
-        self._visitor_id: str | None = None
+        self._visitor_id: str | None = visitor_id
+        self._visitor_id_lock = asyncio.Lock()
+        self._header_template_cache: tuple[Mapping[str, str], str | None, Mapping[str, str]] | None = None
+        self.visitor_id_store = visitor_id_store
+
+        #: response cache, see :py:class:`ResponseCache`
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        self._inflight: dict[str, asyncio.Future[JsonDict]] = {}
+        self.bulk_concurrency = bulk_concurrency
+        self._bulk_semaphore = asyncio.Semaphore(bulk_concurrency)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.prefetch_continuations = prefetch_continuations
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        #: JSON library, see :py:func:`ytmusicapi.json_backend.get_json_backend`
+        self.json_backend = get_json_backend(json_backend)
+        self.compress_threshold = compress_threshold
+        #: byte counters of requests and responses, see :py:class:`ytmusicapi.compression.TransferStats`
+        self.transfer_stats = TransferStats()
 
         self._auth_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict[str]()
         self.auth_type = AuthType.UNAUTHORIZED
@@ -107,7 +198,7 @@ class YTMusicBase:
             self._auth_headers, auth_path = parse_auth_str(auth)
             self.auth_type = determine_auth_type(self._auth_headers)
 
-            self._token: Token
+            self._token: RefreshingToken
             if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
                 if oauth_credentials is None:
                     raise YTMusicUserError(
@@ -116,11 +207,15 @@ class YTMusicBase:
                     )
                 #: OAuth credential handler
                 self._token = RefreshingToken(
-                    credentials=oauth_credentials, _local_cache=auth_path, **self._auth_headers
+                    credentials=oauth_credentials,
+                    _local_cache=auth_path,
+                    json_backend=self.json_backend,
+                    **self._auth_headers,
                 )
 
         # prepare context
         self.context = initialize_context()
+        self._context_memo: SerializedContext | None = None
 
         if location:
             if location not in SUPPORTED_LOCATIONS:
@@ -133,15 +228,8 @@ class YTMusicBase:
             )
         self.context["context"]["client"]["hl"] = language
         self.language = language
-        try:
-            locale.setlocale(locale.LC_ALL, self.language)
-        except locale.Error:
-            with suppress(locale.Error):
-                locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
-        locale_dir = Path(__file__).parent.resolve() / "locales"
-        self.lang = gettext.translation("base", localedir=locale_dir, languages=[language])
-        self.parser = Parser(self.lang)
+        self.parser = Parser(language)
 
         if user:
             self.context["context"]["user"]["onBehalfOfUser"] = user
@@ -151,28 +239,61 @@ class YTMusicBase:
         if self.auth_type == AuthType.BROWSER:
             self.params += YTM_PARAMS_KEY
             try:
-                cookie = self.base_headers["cookie"]
+                cookie = self._auth_headers["cookie"]
                 self.sapisid = sapisid_from_cookie(cookie)
-                self.origin: str = self.base_headers.get("origin", str(self.base_headers.get("x-origin")))
+                self.origin: str = self._auth_headers.get("origin", str(self._auth_headers.get("x-origin")))
             except KeyError:
                 raise YTMusicUserError("Your cookie is missing the required value __Secure-3PAPISID")
 
-    @cached_property
-    def base_headers(self) -> CaseInsensitiveDict[str]:
-        headers = (
-            self._auth_headers
-            if self.auth_type == AuthType.BROWSER or self.auth_type == AuthType.OAUTH_CUSTOM_FULL
-            else initialize_headers()
-        )
+    @property
+    def lang(self) -> GNUTranslations:
+        """translation of the instance language, loaded on first use"""
+        return self.parser.lang
 
-        if "X-Goog-Visitor-Id" not in headers:
-            headers.update(get_visitor_id(partial(self.__send_get_request_sync, use_base_headers=True)))
+    @property
+    def _session(self) -> aiohttp.ClientSession:
+        """request session for connection pooling, created on first use inside the event loop"""
+        if self._client_session is None:
+            self._client_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._client_session
 
+    @property
+    def visitor_id(self) -> str | None:
+        """
+        The visitor id of this instance, None before the first request.
+        Pass it to new instances to skip fetching it again.
+        """
+        return self.base_headers.get("X-Goog-Visitor-Id", self._visitor_id)
+
+    @cached_property
+    def base_headers(self) -> CaseInsensitiveDict[str]:
+        if self.auth_type == AuthType.BROWSER or self.auth_type == AuthType.OAUTH_CUSTOM_FULL:
+            return CaseInsensitiveDict(self._auth_headers)
         return initialize_headers()
 
     @property
     def headers(self) -> CaseInsensitiveDict[str]:
-        headers = self.base_headers.copy()
+        return CaseInsensitiveDict(self._request_headers())
+
+    @property
+    def _header_template(self) -> Mapping[str, str]:
+        """
+        Frozen headers shared by all requests, built from ``base_headers`` and the visitor id
+        and rebuilt only when one of them changes. Names are lower case, so the headers
+        of a request are a plain dict copy instead of a case-insensitive dict.
+        """
+        base_headers, visitor_id = self.base_headers, self._visitor_id
+        cached = self._header_template_cache
+        if cached is None or cached[0] is not base_headers or cached[1] != visitor_id:
+            template = {key.lower(): value for key, value in base_headers.items()}
+            if visitor_id:
+                template.setdefault("x-goog-visitor-id", visitor_id)
+            cached = self._header_template_cache = (base_headers, visitor_id, MappingProxyType(template))
+        return cached[2]
+
+    def _request_headers(self) -> dict[str, str]:
+        """headers of a single request, with lower case names"""
+        headers = dict(self._header_template)
 
         # keys updated each use, custom oauth implementations left untouched
         if self.auth_type == AuthType.BROWSER:
@@ -182,38 +303,127 @@ class YTMusicBase:
         # Full headers are provided by the downstream client in this scenario.
         elif self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
             headers["authorization"] = self._token.as_auth()
-            headers["X-Goog-Request-Time"] = str(int(time.time()))
+            headers["x-goog-request-time"] = str(int(time.time()))
 
         return headers
 
+    @cached_property
+    def _auth_identity(self) -> str:
+        """
+        Fingerprint of the account in cache keys, so authenticated responses are not served to other accounts.
+        Brand accounts are part of the context. Empty without authentication.
+        """
+        if self.auth_type == AuthType.BROWSER:
+            secret = self.sapisid
+        elif self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            secret = self._token.refresh_token
+        elif self.auth_type == AuthType.OAUTH_CUSTOM_FULL:
+            secret = self._auth_headers.get("authorization", "") + self._auth_headers.get("cookie", "")
+        else:
+            return ""
+        return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
     async def _ensure_visitor_id(self) -> None:
-        """Ensure visitor ID is fetched and cached"""
-        if self._visitor_id is None and "X-Goog-Visitor-Id" not in self.base_headers:
-            response = await self._send_get_request("https://music.youtube.com/", use_base_headers=True)
-            visitor_id = response.headers.get("X-Goog-Visitor-Id")
-            if visitor_id:
-                self._visitor_id = visitor_id
-    
-    def __ensure_visitor_id_sync(self) -> None:
-        """Ensure visitor ID is fetched and cached"""
-        if self._visitor_id is None and "X-Goog-Visitor-Id" not in self.base_headers:
-            response = self.__send_get_request_sync("https://music.youtube.com/", use_base_headers=True)
-            visitor_id = response.headers.get("X-Goog-Visitor-Id")
-            if visitor_id:
-                self._visitor_id = visitor_id
+        """Fetches the visitor id once before the first request, unless it was provided"""
+        if self._visitor_id is not None or "X-Goog-Visitor-Id" in self.base_headers:
+            return
+        # concurrent first requests share one fetch
+        async with self._visitor_id_lock:
+            if self._visitor_id is None:
+                self._visitor_id = await self._load_visitor_id()
+
+    async def _load_visitor_id(self) -> str:
+        """Returns the stored visitor id, or fetches and stores it while holding the lock of the store"""
+        store = self.visitor_id_store
+        if store is None:
+            return await self._fetch_visitor_id()
+        while (visitor_id := store.get()) is None:
+            if store.acquire():
+                try:
+                    # stored by another instance between get and acquire
+                    if (visitor_id := store.get()) is None:
+                        visitor_id = await self._fetch_visitor_id()
+                        if visitor_id:
+                            store.set(visitor_id)
+                finally:
+                    store.release()
+                return visitor_id
+            # another instance is fetching it
+            await asyncio.sleep(VISITOR_ID_POLL_INTERVAL)
+        return visitor_id
+
+    async def _fetch_visitor_id(self) -> str:
+        """Streams the html of YouTube Music until the visitor id, without downloading the rest"""
+        response = await self._send_get_request(YTM_DOMAIN, use_base_headers=True)
+        try:
+            return await read_visitor_id(response.content.iter_chunked(VISITOR_ID_CHUNK_SIZE))
+        finally:
+            # closes the connection if the page was not read completely
+            response.close()
+
+    async def _ensure_token(self) -> None:
+        """Refreshes an expiring OAuth token before building the headers of a request"""
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            if self.renew_token:
+                self._token.start_renewal()
+            await self._token.ensure_fresh()
 
     @contextmanager
-    def as_mobile(self) -> Iterator[None]:
+    def client_context(
+        self,
+        client_name: str | None = None,
+        client_version: str | None = None,
+        language: str | None = None,
+        location: str | None = None,
+        user: str | None = None,
+    ) -> Iterator[None]:
         """
-        Not thread-safe!
-        ----------------
+        Overrides the client context of the requests of this instance inside the ``with`` block.
+        The overrides only apply to the current task and the tasks created inside the block,
+        so concurrent requests of other tasks keep the context of the instance. Blocks can be nested.
 
+        :param client_name: client, i.e. ``ANDROID_MUSIC``
+        :param client_version: version of the client
+        :param language: language of the returned data. Parsing still uses the language of the instance.
+        :param location: location of the user
+        :param user: user ID of a brand account, see :py:meth:`__init__`
+
+        Example::
+
+            with yt.client_context(location="DE"):
+                await yt.get_charts()  # charts of Germany
+
+            await yt.get_charts()  # back to the location of the instance
+        """
+        if language is not None and language not in SUPPORTED_LANGUAGES:
+            raise YTMusicUserError(
+                "Language not supported. Supported languages are " + (", ".join(SUPPORTED_LANGUAGES)) + "."
+            )
+        if location is not None and location not in SUPPORTED_LOCATIONS:
+            raise YTMusicUserError("Location not supported. Check the FAQ for supported locations.")
+        client = {
+            key: value
+            for key, value in [
+                ("clientName", client_name),
+                ("clientVersion", client_version),
+                ("hl", language),
+                ("gl", location),
+            ]
+            if value is not None
+        }
+        overrides = ContextOverrides(client, {"onBehalfOfUser": user} if user is not None else {})
+        with override(self, overrides):
+            yield None
+
+    @contextmanager
+    def as_mobile(self) -> Iterator[None]:
+        """
         Temporarily changes the `context` to enable different results
         from the API, meant for the Android mobile-app.
         All calls inside the `with`-statement with emulate mobile behavior.
 
-        This context-manager has no `enter_result`, as it operates in-place
-        and only temporarily alters the underlying `YTMusic`-object.
+        Like :py:meth:`client_context`, it only applies to the current task,
+        so concurrent requests of the same instance are not affected.
 
 
         Example::
@@ -224,74 +434,207 @@ class YTMusicBase:
             yt._send_request(...)  # back to normal, like web-app
 
         """
-
-        # change the context to emulate a mobile-app (Android)
-        copied_context_client = self.context["context"]["client"].copy()
-        self.context["context"]["client"].update({"clientName": "ANDROID_MUSIC", "clientVersion": "7.21.50"})
-
-        # this will not catch errors
-        try:
+        with self.client_context(MOBILE_CLIENT["clientName"], MOBILE_CLIENT["clientVersion"]):
             yield None
-        finally:
-            # safely restore the old context
-            self.context["context"]["client"] = copied_context_client
 
-    def _prepare_session(self, requests_session: aiohttp.ClientSession | None) -> aiohttp.ClientSession:
-        """Prepare requests session or use user-provided requests_session"""
-        if isinstance(requests_session, aiohttp.ClientSession):
-            return requests_session
-        self._session = aiohttp.ClientSession()
-        self._session.request = partial(self._session.request, timeout=30)  # type: ignore[method-assign]
-        return self._session
+    def _serialized_context(self) -> SerializedContext:
+        """
+        The context of the current task, serialized once for request bodies and cache keys.
+        The context of the instance is serialized again only after it was changed.
+        """
+        overrides = get_overrides(self)
+        if overrides is None:
+            memo = self._context_memo
+            if memo is not None and memo.context == self.context:
+                return memo
+        context = self.context if overrides is None else overrides.apply(self.context)
+        serialized = SerializedContext(
+            copy.deepcopy(context),
+            # the members of the context replace the closing brace of an encoded body
+            b"," + self.json_backend.dumps(context)[1:],
+            json.dumps(context, sort_keys=True, separators=(",", ":")),
+        )
+        if overrides is None:
+            self._context_memo = serialized
+        return serialized
+
+    def _encode_request(self, body: JsonDict, context: SerializedContext) -> bytes:
+        """Returns the encoded body with the context appended, without copying or changing ``body``"""
+        if not context.context or not body.keys().isdisjoint(context.context):
+            # the context of the instance replaces a context passed in the body
+            return self.json_backend.dumps({**body, **context.context})
+        encoded = self.json_backend.dumps(body)
+        if len(encoded) == 2:  # {}
+            return b"{" + context.suffix[1:]
+        return encoded[:-1] + context.suffix
 
     async def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
+        context = self._serialized_context()
+
+        cache, cache_key, ttl = self.cache, None, 0.0
+        if cache is not None and (ttl := cache.ttl(endpoint, body)) > 0:
+            cache_key = cache.key(endpoint, body, additionalParams, context.key, self._auth_identity)
+            if (cached := await cache.get(cache_key)) is not None:
+                return cached
+
+        data = self._encode_request(body, context)
+        if self.coalesce_requests and endpoint in IDEMPOTENT_ENDPOINTS and "formData" not in body:
+            key = cache_key or request_key(endpoint, body, additionalParams, context.key, self._auth_identity)
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(
+                    self._post_request(endpoint, data, additionalParams, body=body)
+                )
+                self._inflight[key] = inflight
+                inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # shield the shared request, so a cancelled caller does not cancel it for the others
+            response = await asyncio.shield(inflight)
+        else:
+            response = await self._post_request(endpoint, data, additionalParams, body=body)
+
+        if cache is not None and cache_key is not None:
+            await cache.set(cache_key, response, ttl, body.get("browseId"))
+        return response
+
+    async def _invalidate(self, *browse_ids: str) -> None:
+        """Removes the cached responses of the browse ids after a request changed them"""
+        if self.cache is not None:
+            await self.cache.invalidate(browse_ids)
+
+    async def _post_request(
+        self,
+        endpoint: str,
+        data: bytes,
+        additionalParams: str = "",
+        parse: Callable[[JsonDict], Any] | None = None,
+        body: JsonDict | None = None,
+    ) -> Any:
+        """
+        :param data: encoded request body, including the context
+        :param parse: parser for the decoded response, which is returned instead of the response
+        :param body: the request body before encoding, decides if a failed request is retried
+        """
         # Ensure visitor ID is available before making requests
         await self._ensure_visitor_id()
-        
-        body.update(self.context)
+
+        policy = self.retry_policy
+        if policy is None or not policy.applies_to(endpoint, body):
+            return await self._post_request_once(endpoint, data, additionalParams, parse)
+
+        policy.record_request()
+        attempt = 1
+        while True:
+            try:
+                return await self._post_request_once(endpoint, data, additionalParams, parse)
+            except Exception as e:
+                if (delay := policy.retry_delay(attempt, e)) is None:
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _post_request_once(
+        self,
+        endpoint: str,
+        data: bytes,
+        additionalParams: str,
+        parse: Callable[[JsonDict], Any] | None = None,
+    ) -> Any:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(endpoint)
+
+        sent, content_encoding = compress_body(data, self.compress_threshold)
+        self.transfer_stats.record_request(len(data), len(sent))
+        await self._ensure_token()
+        headers = self._request_headers()
+        if content_encoding is None:
+            headers.pop("content-encoding", None)
+        else:
+            headers["content-encoding"] = content_encoding
 
         response = await self._session.post(
             YTM_BASE_API + endpoint + self.params + additionalParams,
-            json=body,
-            headers=self.headers,
+            data=sent,
+            headers=headers,
             # proxies=self.proxies,
             cookies=self.cookies,
         )
-        response_text: JsonDict = await response.json()
         if response.status >= 400:
+            try:
+                error = self.json_backend.loads(await response.read()).get("error", {})
+            except (self.json_backend.decode_error, ValueError):  # i.e. an html error page
+                error = {}
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self.rate_limiter is not None and is_throttled(response.status, error):
+                self.rate_limiter.throttled(endpoint, retry_after)
             message = "Server returned HTTP " + str(response.status) + ": " + (response.reason or "") + ".\n"
-            error = response_text.get("error", {}).get("message")
-            raise YTMusicServerError(message + error)
+            raise YTMusicServerError(message + str(error.get("message", "")), response.status, retry_after)
+
+        raw = await response.read()
+        self.transfer_stats.record_response(len(raw), response.headers)
+        if parse is None:
+            response_text = self.json_backend.loads(raw)
+        elif self.offload_threshold is not None and len(raw) >= self.offload_threshold:
+            response_text = await run_offloaded(
+                self.executor, decode_and_parse, raw, parse, self.json_backend.name
+            )
+        else:
+            response_text = decode_and_parse(raw, parse, self.json_backend.name)
+        if self.rate_limiter is not None:
+            self.rate_limiter.succeeded(endpoint)
         return response_text
-    
 
+    async def _send_parsed_request(self, endpoint: str, body: JsonDict, parse: Callable[[JsonDict], T]) -> T:
+        """
+        Sends a request and parses the response with ``parse``. Responses of at least ``offload_threshold`` bytes
+        are decoded and parsed in the executor. Cached and coalesced responses are parsed on the event loop.
+        """
+        if (
+            self.offload_threshold is None
+            or self.coalesce_requests
+            or (self.cache is not None and self.cache.ttl(endpoint, body) > 0)
+        ):
+            return parse(await self._send_request(endpoint, body))
+        data = self._encode_request(body, self._serialized_context())
+        parsed: T = await self._post_request(endpoint, data, parse=parse, body=body)
+        return parsed
 
     async def _send_get_request(
         self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
     ) -> ClientResponse:
-        response = await self._session.get(
-            url,
-            params=params,
-            # handle first-use x-goog-visitor-id fetching
-            headers=initialize_headers() if use_base_headers else self.headers,
-            # proxies=self.proxies,
-            cookies=self.cookies,
-        )
-        return response
+        policy = self.retry_policy
+        if policy is not None:
+            policy.record_request()
+        attempt = 1
+        while True:
+            await self._ensure_token()
+            try:
+                response = await self._session.get(
+                    url,
+                    params=params,
+                    # handle first-use x-goog-visitor-id fetching
+                    headers=initialize_headers() if use_base_headers else self._request_headers(),
+                    # proxies=self.proxies,
+                    cookies=self.cookies,
+                )
+            except Exception as e:
+                if policy is None or (delay := policy.retry_delay(attempt, e)) is None:
+                    raise
+            else:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if policy is None:
+                    return response
+                if (delay := policy.retry_delay(attempt, None, response.status, retry_after)) is None:
+                    return response
+                response.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _bulk(
+        self, fetch: Callable[[str], Awaitable[T]], ids: Sequence[str], concurrency: int | None = None
+    ) -> BulkRequest[T]:
+        """Prepares a batch of requests limited by the instance-wide bulk semaphore"""
+        return BulkRequest(fetch, ids, self._bulk_semaphore, concurrency or self.bulk_concurrency)
 
-    def __send_get_request_sync(
-        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
-    ) -> Response:
-        response = requests_get(
-            url,
-            params=params,
-            # handle first-use x-goog-visitor-id fetching
-            headers=initialize_headers() if use_base_headers else self.headers,
-            # proxies=self.proxies,
-            cookies=self.cookies,
-        )
-        return response
-    
     def _check_auth(self) -> None:
         """
         Checks if the user has provided authorization credentials
@@ -302,6 +645,17 @@ class YTMusicBase:
         if self.auth_type == AuthType.UNAUTHORIZED:
             raise YTMusicUserError("Please provide authentication before using this function")
 
+    async def close(self) -> None:
+        """
+        Stops the background renewal of the OAuth token and closes the session created by the instance.
+        A session passed as ``requests_session`` is left open. The instance can be used again afterwards.
+        """
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            self._token.stop_renewal()
+        if self._owns_session and self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+
     def __enter__(self) -> YTMusicBase:
         return self
 
@@ -311,7 +665,21 @@ class YTMusicBase:
         exc_value: BaseException | None,
         traceback: Any | None,
     ) -> bool | None:
-        pass
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            self._token.stop_renewal()
+        return None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        await self.close()
+        return None
 
 
 class YTMusic(
@@ -324,6 +692,7 @@ class YTMusic(
     PlaylistsMixin,
     PodcastsMixin,
     UploadsMixin,
+    PaginationMixin,
 ):
     """
     Allows automated interactions with YouTube Music by emulating the YouTube web client's requests.